@@ -0,0 +1,8 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
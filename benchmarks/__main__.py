@@ -0,0 +1,114 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+"""Headless benchmark suite
+
+Runs every reference scene (each in its own process, so peak RSS isn't
+shared between scenes), writes the results to a JSON file and optionally
+fails if they regressed compared to a baseline:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline results.json --threshold p99_frame_ms=0.5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+from benchmarks.harness import DEFAULT_THRESHOLDS, compare, environment, run_scene
+from benchmarks.scenes import SCENES
+
+
+def run_isolated(name: str, frames: int | None) -> dict[str, float]:
+    command: list[str] = [sys.executable, "-m", "benchmarks", "--run-scene", name]
+    if frames is not None:
+        command += ["--frames", str(frames)]
+
+    output: str = subprocess.run(
+        command, check=True, stdout=subprocess.PIPE, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def parse_threshold(value: str) -> tuple[str, float]:
+    metric, _, threshold = value.partition("=")
+    if not threshold:
+        raise argparse.ArgumentTypeError(
+            f"Expected METRIC=FRACTION (e.g. fps=0.1), got {value!r}"
+        )
+    return metric, float(threshold)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="ComPyGUI headless benchmark suite"
+    )
+    parser.add_argument(
+        "--scene",
+        action="append",
+        choices=sorted(SCENES),
+        help="Only run this scene (can be given multiple times)",
+    )
+    parser.add_argument(
+        "--frames", type=int, help="Override how many frames every scene runs for"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare the results to this JSON file")
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        type=parse_threshold,
+        default=[],
+        metavar="METRIC=FRACTION",
+        help="Allowed relative regression of a metric (default: "
+        + ", ".join(f"{k}={v}" for k, v in DEFAULT_THRESHOLDS.items())
+        + ")",
+    )
+    parser.add_argument("--run-scene", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_scene:
+        print(json.dumps(run_scene(SCENES[args.run_scene](), args.frames)))
+        return 0
+
+    results: dict = {"environment": environment(), "scenes": {}}
+    for name in args.scene or SCENES:
+        metrics: dict[str, float] = run_isolated(name, args.frames)
+        results["scenes"][name] = metrics
+        print(
+            f"{name:<20} {metrics['fps']:9.1f} fps  "
+            f"p50 {metrics['p50_frame_ms']:7.2f} ms  "
+            f"p99 {metrics['p99_frame_ms']:7.2f} ms  "
+            f"{metrics['alloc_peak_kib_per_frame']:9.1f} KiB/frame  "
+            f"{metrics['peak_rss_mib']:7.1f} MiB RSS"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline: dict = json.load(file)
+
+        thresholds: dict[str, float] = dict(DEFAULT_THRESHOLDS)
+        thresholds.update(args.threshold)
+
+        regressions: list[str] = compare(results, baseline, thresholds)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
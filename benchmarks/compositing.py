@@ -0,0 +1,82 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+"""Compositing benchmark
+
+Composites large translucent layers onto a 1920x1080 surface with every
+blend mode, through both SDL's blitters (straight alpha) and the NumPy
+path (premultiplied alpha).
+"""
+
+import time
+
+from sdl2.surface import SDL_CreateRGBSurface, SDL_FreeSurface
+
+from compygui.compositor import BlendMode, composite, fill, has_numpy
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor, RGBAMask
+from compygui.datatypes.vector2 import IVector2
+
+SIZE: IVector2 = IVector2(1920, 1080)
+ITERATIONS: int = 20
+
+
+def create_surface(size: IVector2):
+    mask: RGBAMask = RGBAMask.RGBA()
+    return SDL_CreateRGBSurface(
+        0, size.x, size.y, 32, mask.r, mask.g, mask.b, mask.a
+    )
+
+
+def timed(name: str, func) -> None:
+    func()
+    start: float = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    elapsed: float = (time.perf_counter() - start) / ITERATIONS
+    print(f"{name:<40} {elapsed * 1000:8.2f} ms")
+
+
+def main() -> None:
+    dst = create_surface(SIZE)
+    layer = create_surface(SIZE)
+    fill(dst, IRect2.from_vectors(IVector2.ZERO(), SIZE), RGBAColor.WHITE())
+    fill(
+        layer,
+        IRect2.from_vectors(IVector2.ZERO(), SIZE),
+        RGBAColor(r=255, g=0, b=128, a=128),
+        BlendMode.NONE,
+    )
+
+    translucent: RGBAColor = RGBAColor(r=0, g=128, b=255, a=96)
+    for mode in BlendMode:
+        timed(
+            f"composite {mode.name} (SDL)",
+            lambda: composite(layer, dst, IVector2.ZERO(), mode),
+        )
+        if has_numpy():
+            timed(
+                f"composite {mode.name} (NumPy, premultiplied)",
+                lambda: composite(
+                    layer, dst, IVector2.ZERO(), mode, premultiplied=True
+                ),
+            )
+        timed(
+            f"fill {mode.name}",
+            lambda: fill(
+                dst, IRect2.from_vectors(IVector2.ZERO(), SIZE), translucent, mode
+            ),
+        )
+
+    SDL_FreeSurface(layer)
+    SDL_FreeSurface(dst)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+"""Benchmark harness
+
+Runs Scene()s in a headless ComPyGUIApp(), measures them and compares
+the results against a baseline.
+"""
+
+import gc
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from compygui import ComPyGUIApp, Window
+from compygui.datatypes.vector2 import IVector2
+from compygui.window import WindowPositionFlags
+
+FRAME_DELTA: float = 1 / 60
+
+
+class Scene:
+    """A reference scene to benchmark
+
+    name: The name of the scene, used on the command line and in results
+    frames: How many frames get timed by default
+    alloc_frames: How many frames allocations get sampled over by default
+    window_size: The size of the (headless) window
+    """
+
+    name: str = "scene"
+    frames: int = 300
+    alloc_frames: int = 20
+    window_size: IVector2 = IVector2(1280, 720)
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        """Builds the scene inside window. Not timed."""
+        pass
+
+    def prepare(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        """Runs before every frame. Not timed."""
+        pass
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        """Runs one (timed) frame of the scene"""
+        app.step(FRAME_DELTA)
+
+
+class BenchmarkApp(ComPyGUIApp):
+    """A headless app that builds a Scene() in a single window"""
+
+    def __init__(self, scene: Scene, *args, **kwargs) -> None:
+        super().__init__(*args, headless=True, silence_license_info=True, **kwargs)
+        self.scene: Scene = scene
+        self.window: Window
+
+    def setup(self) -> None:
+        self.window = self.create_window(
+            position=WindowPositionFlags.undefined(), size=self.scene.window_size
+        )
+        self.window.show()
+        self.scene.build(self, self.window)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    return ordered[min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))]
+
+
+def run_scene(
+    scene: Scene, frames: int | None = None, alloc_frames: int | None = None
+) -> dict[str, float]:
+    """Runs a scene and returns its metrics
+
+    Frame times are measured first, then allocations are sampled over a few
+    more frames with tracemalloc (which slows frames down too much to time
+    them at the same time).
+
+    scene: The scene to run
+    frames: How many frames to time (defaults to scene.frames)
+    alloc_frames: How many frames to sample allocations over (defaults to
+        scene.alloc_frames)
+    """
+
+    if frames is None:
+        frames = scene.frames
+    if alloc_frames is None:
+        alloc_frames = scene.alloc_frames
+
+    app: BenchmarkApp = BenchmarkApp(scene)
+    app.step(FRAME_DELTA)  # sets the app (and the scene) up
+
+    times: list[float] = []
+    index: int = 0
+    for index in range(frames):
+        scene.prepare(app, app.window, index)
+        start: int = time.perf_counter_ns()
+        scene.frame(app, app.window, index)
+        times.append((time.perf_counter_ns() - start) / 1e6)
+
+    peak_bytes: list[int] = []
+    blocks: list[int] = []
+    tracemalloc.start()
+    for index in range(frames, frames + alloc_frames):
+        scene.prepare(app, app.window, index)
+        gc.collect()
+        tracemalloc.reset_peak()
+        before: int = tracemalloc.get_traced_memory()[0]
+        before_blocks: int = sys.getallocatedblocks()
+
+        scene.frame(app, app.window, index)
+
+        peak_bytes.append(tracemalloc.get_traced_memory()[1] - before)
+        blocks.append(sys.getallocatedblocks() - before_blocks)
+    tracemalloc.stop()
+
+    ordered: list[float] = sorted(times)
+    total: float = sum(times)
+    result: dict[str, float] = {
+        "frames": frames,
+        "fps": frames / (total / 1000) if total else 0.0,
+        "mean_frame_ms": total / frames,
+        "p50_frame_ms": _percentile(ordered, 50),
+        "p99_frame_ms": _percentile(ordered, 99),
+        "alloc_peak_kib_per_frame": sum(peak_bytes) / len(peak_bytes) / 1024,
+        "net_blocks_per_frame": sum(blocks) / len(blocks),
+        # ru_maxrss is in KiB on Linux, but in bytes on macOS
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    }
+
+    app.quit()
+    return result
+
+
+def environment() -> dict[str, str]:
+    """Describes the machine the benchmarks ran on"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+# Metrics where a higher value is better - everything else is lower-is-better
+HIGHER_IS_BETTER: set[str] = {"fps"}
+
+DEFAULT_THRESHOLDS: dict[str, float] = {
+    "fps": 0.10,
+    "p50_frame_ms": 0.10,
+    "p99_frame_ms": 0.25,
+    "alloc_peak_kib_per_frame": 0.25,
+    "peak_rss_mib": 0.15,
+}
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    thresholds: dict[str, float] = DEFAULT_THRESHOLDS,
+) -> list[str]:
+    """Compares results against a baseline and returns a description of
+    every regression that is larger than its threshold
+
+    results: The results to check
+    baseline: The results to compare against
+    thresholds: Allowed relative regression per metric (0.1 = 10% worse)
+    """
+
+    regressions: list[str] = []
+    for scene, metrics in results["scenes"].items():
+        base: dict[str, float] | None = baseline["scenes"].get(scene)
+        if base is None:
+            continue
+
+        for metric, threshold in thresholds.items():
+            if metric not in metrics or not base.get(metric):
+                continue
+
+            change: float = (metrics[metric] - base[metric]) / base[metric]
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+
+            if change > threshold:
+                regressions.append(
+                    f"{scene}: {metric} regressed by {change:.1%} "
+                    f"({base[metric]:.3f} -> {metrics[metric]:.3f}, "
+                    f"threshold {threshold:.0%})"
+                )
+
+    return regressions
@@ -0,0 +1,373 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+"""Reference scenes for the benchmark suite"""
+
+import math
+import random
+
+from compygui import ComPyGUIApp, Window
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2, Vector2
+from compygui.events import Event, EventListener, EventOrigin, EventType
+from compygui.gui.colorrect import GUIColorRectangle
+from compygui.gui.virtuallist import GUIVirtualList
+from compygui.guicomponent import GUIComponent
+from compygui.reconcile import Element, reconcile
+
+from benchmarks.harness import FRAME_DELTA, Scene
+
+
+def random_color(rng: random.Random) -> RGBAColor:
+    return RGBAColor(
+        r=rng.randrange(256), g=rng.randrange(256), b=rng.randrange(256), a=255
+    )
+
+
+class FlatRectangles(Scene):
+    """10k GUIColorRectangle()s directly inside the viewport"""
+
+    name = "flat_rects"
+    frames = 30
+    count: int = 10_000
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        rng: random.Random = random.Random(0)
+        for _ in range(self.count):
+            GUIColorRectangle(
+                position=IVector2(
+                    rng.randrange(self.window_size.x), rng.randrange(self.window_size.y)
+                ),
+                size=IVector2(rng.randrange(8, 64), rng.randrange(8, 64)),
+                color=random_color(rng),
+            ).reparent(window.viewport)
+
+
+class DeepTree(Scene):
+    """A 20 levels deep chain of nested GUIColorRectangle()s"""
+
+    name = "deep_tree"
+    frames = 300
+    depth: int = 20
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        rng: random.Random = random.Random(0)
+        root: GUIComponent | None = None
+        parent: GUIComponent | None = None
+        for level in range(self.depth):
+            node: GUIColorRectangle = GUIColorRectangle(
+                position=IVector2(8, 8) if parent else IVector2.ZERO(),
+                size=IVector2(
+                    window.viewport.size.x - 16 * level,
+                    window.viewport.size.y - 16 * level,
+                ),
+                color=random_color(rng),
+            )
+            if parent is None:
+                root = node
+            else:
+                node.reparent(parent)
+            parent = node
+
+        if root is not None:
+            root.reparent(window.viewport)
+
+
+class EventStorm(Scene):
+    """100k events fired at a handful of listeners"""
+
+    name = "event_storm"
+    frames = 100
+    fires_per_frame: int = 1000
+    listeners: int = 8
+    event_type: str = "bench.storm"
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        self.received: int = 0
+        queue = window.viewport.tree_events
+        queue.max_events = None
+        for index in range(self.listeners):
+            queue.connect(
+                self,
+                self.on_storm,
+                self.event_type,
+                condition=lambda event, index=index: event.data["target"] == index,
+            )
+
+    def on_storm(self, event: Event) -> None:
+        self.received += 1
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        queue = window.viewport.tree_events
+        for fire in range(self.fires_per_frame):
+            queue.fire(
+                self.event_type,
+                event_origin=EventOrigin.OTHER,
+                target=fire % self.listeners,
+            )
+        app.step(FRAME_DELTA)
+
+
+class ContinuousResize(Scene):
+    """A viewport that gets resized every frame, full of relatively sized rectangles"""
+
+    name = "continuous_resize"
+    frames = 200
+    count: int = 100
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        rng: random.Random = random.Random(0)
+        for _ in range(self.count):
+            GUIColorRectangle(
+                position=IVector2(
+                    rng.randrange(self.window_size.x), rng.randrange(self.window_size.y)
+                ),
+                size=Vector2(rng.uniform(0.05, 0.5), rng.uniform(0.05, 0.5)),
+                color=random_color(rng),
+            ).reparent(window.viewport)
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        scale: float = 0.75 + 0.25 * math.sin(index / 10)
+        window.viewport.resize(
+            Vector2(self.window_size.x * scale, self.window_size.y * scale).rounded()
+        )
+        app.step(FRAME_DELTA)
+
+
+class ListenerChurn(Scene):
+    """1k listeners connected and disconnected again every frame"""
+
+    name = "listener_churn"
+    frames = 100
+    listeners: int = 1000
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        self.connected: list[EventListener] = []
+
+    def on_event(self, event: Event) -> None:
+        pass
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        queue = window.viewport.tree_events
+        for _ in range(self.listeners):
+            self.connected.append(queue.connect(self, self.on_event, EventType.G_RENDER))
+
+        app.step(FRAME_DELTA)
+
+        for listener in self.connected:
+            listener.disconnect()
+        self.connected.clear()
+
+
+class Teardown(Scene):
+    """Destroying a 50k node tree (50 panels with 1000 children each) that's
+    part of the VCT. The tree is re-built before every frame (not timed).
+    """
+
+    name = "teardown"
+    frames = 10
+    alloc_frames = 3
+    panels: int = 50
+    children: int = 1000
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        self.root: GUIComponent | None = None
+
+    def prepare(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        root: GUIComponent = GUIComponent(position=IVector2.ZERO())
+        for _ in range(self.panels):
+            panel: GUIComponent = GUIComponent(position=IVector2.ZERO())
+            panel.extend_children(
+                GUIComponent(position=IVector2.ZERO()) for _ in range(self.children)
+            )
+            panel.reparent(root)
+
+        window.viewport.extend_children([root])
+        self.root = root
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        if self.root is not None:
+            self.root.destroy()
+            self.root = None
+        app.step(FRAME_DELTA)
+
+
+class Reorder(Scene):
+    """A list of 20k rows that gets re-sorted every frame"""
+
+    name = "reorder"
+    frames = 30
+    rows: int = 20_000
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        rng: random.Random = random.Random(0)
+        self.rng: random.Random = rng
+        self.panel: GUIComponent = GUIComponent(position=IVector2.ZERO())
+        self.panel.reparent(window.viewport)
+        self.panel.extend_children(
+            GUIComponent(position=IVector2(0, index)) for index in range(self.rows)
+        )
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        order: list[GUIComponent] = list(self.panel.children)  # type: ignore
+        self.rng.shuffle(order)
+        self.panel.replace_children(order)
+        app.step(FRAME_DELTA)
+
+
+class VirtualList(Scene):
+    """A GUIVirtualList() of 10M variable height rows, scrolled every frame"""
+
+    name = "virtual_list"
+    frames = 120
+    items: int = 10_000_000
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        self.list: GUIVirtualList = GUIVirtualList(
+            position=IVector2.ZERO(),
+            size=window.viewport.size,
+            item_count=self.items,
+            create_row=lambda: GUIColorRectangle(
+                position=IVector2.ZERO(),
+                size=IVector2(window.viewport.size.x, 24),
+                color=RGBAColor(r=0, g=0, b=0, a=255),
+            ),
+            bind_row=self.bind_row,
+            row_height=lambda item: 20 + item % 9,
+        )
+        self.list.reparent(window.viewport)
+
+    def bind_row(self, row: GUIColorRectangle, item: int) -> None:
+        row.color = RGBAColor(r=item % 256, g=(item // 256) % 256, b=128, a=255)
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        # Mostly smooth scrolling, with a jump far into the list now and then
+        if index % 30 == 0:
+            self.list.scroll_to_item(index * 81_173 % self.items)
+        else:
+            self.list.scroll_by(53)
+        app.step(FRAME_DELTA)
+
+
+class Reconcile(Scene):
+    """A 5k node dashboard that's reconciled every frame, with 1% of its
+    cells changing. Like reconcile() expects, the Element()s are cached and
+    only the ones of the changed cells (and of their panels) are rebuilt
+    """
+
+    name = "reconcile"
+    frames = 60
+    panels: int = 50
+    cells: int = 100
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        self.rng: random.Random = random.Random(0)
+        self.cell_elements: list[list[Element]] = [
+            [
+                self.describe_cell(cell, self.rng.randrange(256))
+                for cell in range(self.cells)
+            ]
+            for _ in range(self.panels)
+        ]
+        self.elements: list[Element] = [
+            self.describe_panel(panel) for panel in range(self.panels)
+        ]
+        reconcile(window.viewport, self.elements)
+
+    def describe_cell(self, cell: int, value: int) -> Element:
+        return Element(
+            GUIColorRectangle,
+            key=cell,
+            position=IVector2(cell * 8, 0),
+            size=IVector2(8, 8),
+            color=RGBAColor(r=value, g=value, b=255 - value, a=255),
+        )
+
+    def describe_panel(self, panel: int) -> Element:
+        return Element(
+            GUIComponent,
+            *self.cell_elements[panel],
+            key=panel,
+            position=IVector2(0, panel * 8),
+        )
+
+    def prepare(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        changed: set[int] = set()
+        for _ in range(self.panels * self.cells // 100):
+            panel: int = self.rng.randrange(self.panels)
+            cell: int = self.rng.randrange(self.cells)
+            self.cell_elements[panel][cell] = self.describe_cell(
+                cell, self.rng.randrange(256)
+            )
+            changed.add(panel)
+
+        self.elements = list(self.elements)
+        for panel in changed:
+            self.elements[panel] = self.describe_panel(panel)
+
+    def frame(self, app: ComPyGUIApp, window: Window, index: int) -> None:
+        reconcile(window.viewport, self.elements)
+        app.step(FRAME_DELTA)
+
+
+class Animation(Scene):
+    """2k GUIColorRectangle()s with their position and opacity animated by
+    the app's Animator(), restarted as soon as they finish
+    """
+
+    name = "animation"
+    frames = 120
+    count: int = 2_000
+
+    def build(self, app: ComPyGUIApp, window: Window) -> None:
+        self.rng: random.Random = random.Random(0)
+        for _ in range(self.count):
+            rectangle: GUIColorRectangle = GUIColorRectangle(
+                position=self.random_position(),
+                size=IVector2(16, 16),
+                color=random_color(self.rng),
+            )
+            rectangle.reparent(window.viewport)
+            self.restart(app, rectangle)
+
+    def random_position(self) -> IVector2:
+        return IVector2(
+            self.rng.randrange(self.window_size.x), self.rng.randrange(self.window_size.y)
+        )
+
+    def restart(self, app: ComPyGUIApp, rectangle: GUIColorRectangle) -> None:
+        duration: float = self.rng.uniform(0.25, 1.0)
+        app.animator.tween(
+            rectangle,
+            "position",
+            self.random_position(),
+            duration=duration,
+            easing=self.rng.choice(("linear", "ease_in_out", "ease_out_back")),
+            on_done=lambda tween: self.restart(app, rectangle),
+        )
+        app.animator.tween(
+            rectangle, "opacity", self.rng.random(), duration=duration, easing="linear"
+        )
+
+
+SCENES: dict[str, type[Scene]] = {
+    scene.name: scene
+    for scene in (
+        FlatRectangles,
+        DeepTree,
+        EventStorm,
+        ContinuousResize,
+        ListenerChurn,
+        Teardown,
+        Reorder,
+        VirtualList,
+        Reconcile,
+        Animation,
+    )
+}
@@ -0,0 +1,77 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+"""Tiled rendering benchmark
+
+Renders a 4K viewport full of translucent rectangles serially and in
+tiles, checks that both give the same pixels and compares frame times.
+"""
+
+import ctypes
+import random
+import time
+
+from compygui.compositor import tile_executor
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+from compygui.gui.colorrect import GUIColorRectangle
+from compygui.viewport import Viewport
+
+SIZE: IVector2 = IVector2(3840, 2160)
+RECTANGLES: int = 500
+FRAMES: int = 10
+
+
+def build(viewport: Viewport) -> None:
+    rng: random.Random = random.Random(0)
+    for _ in range(RECTANGLES):
+        GUIColorRectangle(
+            position=IVector2(rng.randrange(SIZE.x), rng.randrange(SIZE.y)),
+            size=IVector2(rng.randrange(64, 1024), rng.randrange(64, 1024)),
+            color=RGBAColor(
+                r=rng.randrange(256),
+                g=rng.randrange(256),
+                b=rng.randrange(256),
+                a=rng.randrange(32, 256),
+            ),
+        ).reparent(viewport)
+
+
+def frame_time(viewport: Viewport) -> float:
+    viewport.render(0)
+    start: float = time.perf_counter()
+    for _ in range(FRAMES):
+        viewport.render(0)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def pixels(viewport: Viewport) -> bytes:
+    surface = viewport._surface.contents
+    return ctypes.string_at(surface.pixels, surface.pitch * surface.h)
+
+
+def main() -> None:
+    serial: Viewport = Viewport(size=SIZE)
+    tiled: Viewport = Viewport(size=SIZE, tiled=True)
+    build(serial)
+    build(tiled)
+
+    serial_time: float = frame_time(serial)
+    tiled_time: float = frame_time(tiled)
+
+    print(f"serial: {serial_time * 1000:8.2f} ms/frame")
+    print(
+        f"tiled:  {tiled_time * 1000:8.2f} ms/frame "
+        f"({tile_executor()._max_workers} workers, {serial_time / tiled_time:.2f}x)"
+    )
+    print(f"identical: {pixels(serial) == pixels(tiled)}")
+
+
+if __name__ == "__main__":
+    main()
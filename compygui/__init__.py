@@ -13,6 +13,20 @@ from .misc import *
 from .viewport import *
 from .events import *
 from .guicomponent import *
+from .compositor import *
+from .profiler import *
+from .memory import *
+from .gcpolicy import *
+from .layout import *
+from .reconcile import *
+from .animation import *
+from .timers import *
+from .font import *
+from .images import *
+from .shapes import *
+from .recording import *
+from .batch import *
+from .snapshot import *
 
 from .datatypes.vector2 import *
 from .datatypes.rect2 import *
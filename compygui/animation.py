@@ -0,0 +1,405 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from typing import Any, Callable
+
+from compygui.component import Component
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2, Vector2
+from compygui.errors import ComPyGUIError
+from compygui.guicomponent import GUIComponent
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Easing curves only use arithmetic, so they work on floats and on NumPy
+# arrays alike
+
+
+def linear(t: Any) -> Any:
+    return t
+
+
+def ease_in(t: Any) -> Any:
+    return t * t
+
+
+def ease_out(t: Any) -> Any:
+    return t * (2 - t)
+
+
+def ease_in_out(t: Any) -> Any:
+    return t * t * (3 - 2 * t)
+
+
+def ease_in_cubic(t: Any) -> Any:
+    return t * t * t
+
+
+def ease_out_cubic(t: Any) -> Any:
+    u = 1 - t
+    return 1 - u * u * u
+
+
+def ease_in_out_cubic(t: Any) -> Any:
+    return t * t * t * (t * (6 * t - 15) + 10)
+
+
+def ease_out_back(t: Any) -> Any:
+    u = t - 1
+    return 1 + 2.70158 * u * u * u + 1.70158 * u * u
+
+
+EASINGS: dict[str, Callable[[Any], Any]] = {
+    "linear": linear,
+    "ease_in": ease_in,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+    "ease_in_cubic": ease_in_cubic,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_in_out_cubic": ease_in_out_cubic,
+    "ease_out_back": ease_out_back,
+}
+"""Easing curves by name. Every curve maps 0 to 0 and 1 to 1."""
+
+
+def _unpack(value: Any) -> tuple[float, float, float, float]:
+    if isinstance(value, (IVector2, Vector2)):
+        return (value.x, value.y, 0.0, 0.0)
+    if isinstance(value, RGBAColor):
+        return (value.r, value.g, value.b, value.a)
+    if isinstance(value, (int, float)):
+        return (value, 0.0, 0.0, 0.0)
+    raise ComPyGUIError(f"Can't animate a {value.__class__.__name__}")
+
+
+def _pack(kind: type, values: list[float]) -> Any:
+    if kind is IVector2:
+        return IVector2(round(values[0]), round(values[1]))
+    if kind is Vector2:
+        return Vector2(values[0], values[1])
+    if kind is RGBAColor:
+        return RGBAColor(
+            r=min(255, max(0, round(values[0]))),
+            g=min(255, max(0, round(values[1]))),
+            b=min(255, max(0, round(values[2]))),
+            a=min(255, max(0, round(values[3]))),
+        )
+    if kind is int:
+        return round(values[0])
+    return values[0]
+
+
+class Tween:
+    """One running animation of a property of a Component(), created with
+    Animator().tween(). Keep it to cancel() the animation or to check
+    whether it's done.
+    """
+
+    __slots__ = (
+        "component",
+        "property",
+        "kind",
+        "easing",
+        "on_done",
+        "done",
+        "_slot",
+        "_animator",
+    )
+
+    def __init__(
+        self,
+        animator: Animator,
+        component: Component,
+        property: str,
+        kind: type,
+        easing: Callable[[Any], Any],
+        on_done: Callable[[Tween], None] | None,
+    ) -> None:
+        self.component: Component = component
+        self.property: str = property
+        self.kind: type = kind
+        self.easing: Callable[[Any], Any] = easing
+        self.on_done: Callable[[Tween], None] | None = on_done
+        self.done: bool = False
+
+        self._slot: int = -1
+        self._animator: Animator = animator
+
+    def cancel(self) -> None:
+        """Stops the animation, leaving the property at its current value"""
+        if not self.done:
+            self._animator._remove(self)
+
+
+class Animator:
+    """Animates properties of Component()s (position, size, color, opacity,
+    or anything else that holds a number, an IVector2, a Vector2 or an
+    RGBAColor) from one value to another over time, with an easing curve.
+
+    ComPyGUIApp() has one (app.animator) that it updates with the frame
+    delta before every frame. All running tweens are evaluated together:
+    their start values, deltas and progress are kept in flat arrays, so
+    with NumPy, every frame is a few vectorized operations plus one
+    attribute assignment per tween. Only the animated components get
+    invalidated.
+
+    use_numpy: Whether to evaluate tweens with NumPy (defaults to whether
+        it's installed)
+    """
+
+    def __init__(self, *args, use_numpy: bool | None = None) -> None:
+        self.use_numpy: bool = numpy is not None if use_numpy is None else use_numpy
+        if self.use_numpy and numpy is None:
+            raise ComPyGUIError("Animator(use_numpy=True) requires NumPy")
+
+        # Struct of arrays, one slot per running tween (kept dense). With
+        # NumPy, these are preallocated arrays that only grow
+        self._tweens: list[Tween] = []
+        self._curves: list[Callable[[Any], Any]] = []
+        self._curve_ids: dict[Callable[[Any], Any], int] = {}
+        self._start: Any
+        self._delta: Any
+        self._elapsed: Any
+        self._duration: Any
+        self._curve: Any
+        if self.use_numpy:
+            self._start = numpy.zeros((16, 4))
+            self._delta = numpy.zeros((16, 4))
+            self._elapsed = numpy.zeros(16)
+            self._duration = numpy.ones(16)
+            self._curve = numpy.zeros(16, dtype=numpy.intp)
+        else:
+            self._start = []
+            self._delta = []
+            self._elapsed = []
+            self._duration = []
+            self._curve = []
+
+        self._by_property: dict[tuple[int, str], Tween] = {}
+
+    def __len__(self) -> int:
+        return len(self._tweens)
+
+    @property
+    def active(self) -> bool:
+        """Whether any tween is running"""
+        return bool(self._tweens)
+
+    def tween(
+        self,
+        component: Component,
+        property: str,
+        to: Any,
+        *args,
+        duration: float,
+        easing: str | Callable[[Any], Any] = "ease_in_out",
+        start: Any = None,
+        delay: float = 0.0,
+        on_done: Callable[[Tween], None] | None = None,
+    ) -> Tween:
+        """Starts animating a property of a component. A tween that is
+        already running on the same property is replaced.
+
+        component: The component to animate
+        property: The name of the attribute to animate ("position", "size",
+            "color", "opacity", ...)
+        to: The value to animate to
+        duration: How long the animation takes (in seconds of frame delta time)
+        easing: The easing curve, by name (see EASINGS) or as a function
+        start: The value to animate from (defaults to the current value)
+        delay: How long to wait before starting
+        on_done: Called with the Tween() once the animation finishes (not
+            when it's cancelled)
+        """
+
+        if start is None:
+            start = getattr(component, property)
+        curve: Callable[[Any], Any] = (
+            EASINGS[easing] if isinstance(easing, str) else easing
+        )
+        curve_id: int | None = self._curve_ids.get(curve)
+        if curve_id is None:
+            curve_id = self._curve_ids[curve] = len(self._curves)
+            self._curves.append(curve)
+
+        running: Tween | None = self._by_property.get((id(component), property))
+        if running is not None:
+            self._remove(running)
+
+        kind: type = type(to)
+        if kind is int and isinstance(start, float):
+            kind = float
+
+        tween: Tween = Tween(self, component, property, kind, curve, on_done)
+        begin: tuple[float, float, float, float] = _unpack(start)
+        end: tuple[float, float, float, float] = _unpack(to)
+        change: tuple[float, ...] = tuple(b - a for a, b in zip(begin, end))
+
+        slot: int = len(self._tweens)
+        tween._slot = slot
+        self._tweens.append(tween)
+        if self.use_numpy:
+            if slot == len(self._elapsed):
+                self._grow()
+            self._start[slot] = begin
+            self._delta[slot] = change
+            self._elapsed[slot] = -delay
+            self._duration[slot] = max(duration, 1e-9)
+            self._curve[slot] = curve_id
+        else:
+            self._start.append(begin)
+            self._delta.append(change)
+            self._elapsed.append(-delay)
+            self._duration.append(max(duration, 1e-9))
+            self._curve.append(curve_id)
+        self._by_property[(id(component), property)] = tween
+
+        return tween
+
+    def cancel(self, component: Component, property: str | None = None) -> None:
+        """Cancels the tweens running on a component
+
+        component: The component
+        property: Only cancel the tween of this property (None for all of them)
+        """
+
+        for tween in list(self._tweens):
+            if tween.component is component and (
+                property is None or tween.property == property
+            ):
+                self._remove(tween)
+
+    def _grow(self) -> None:
+        capacity: int = 2 * len(self._elapsed)
+        self._start = numpy.resize(self._start, (capacity, 4))
+        self._delta = numpy.resize(self._delta, (capacity, 4))
+        self._elapsed = numpy.resize(self._elapsed, capacity)
+        self._duration = numpy.resize(self._duration, capacity)
+        self._curve = numpy.resize(self._curve, capacity)
+
+    def _remove(self, tween: Tween) -> None:
+        # Swap the last slot into the removed one to keep the arrays dense
+        slot: int = tween._slot
+        last: int = len(self._tweens) - 1
+        if slot != last:
+            moved: Tween = self._tweens[last]
+            moved._slot = slot
+            self._tweens[slot] = moved
+            self._start[slot] = self._start[last]
+            self._delta[slot] = self._delta[last]
+            self._elapsed[slot] = self._elapsed[last]
+            self._duration[slot] = self._duration[last]
+            self._curve[slot] = self._curve[last]
+
+        self._tweens.pop()
+        if not self.use_numpy:
+            self._start.pop()
+            self._delta.pop()
+            self._elapsed.pop()
+            self._duration.pop()
+            self._curve.pop()
+
+        tween.done = True
+        tween._slot = -1
+        if self._by_property.get((id(tween.component), tween.property)) is tween:
+            del self._by_property[(id(tween.component), tween.property)]
+
+    def _progress_numpy(
+        self, delta: float
+    ) -> tuple[list[list[float]], list[bool], list[bool]]:
+        count: int = len(self._tweens)
+        elapsed = self._elapsed[:count]
+        elapsed += delta
+        duration = self._duration[:count]
+        t = numpy.clip(elapsed / duration, 0.0, 1.0)
+
+        curves = self._curve[:count]
+        first: int = int(curves[0])
+        if len(self._curves) == 1 or not (curves != first).any():
+            eased = self._curves[first](t)
+        else:
+            eased = numpy.empty_like(t)
+            for curve_id in numpy.unique(curves).tolist():
+                mask = curves == curve_id
+                eased[mask] = self._curves[curve_id](t[mask])
+
+        values = self._start[:count] + self._delta[:count] * eased[:, None]
+        return (
+            values.tolist(),
+            (elapsed >= 0).tolist(),
+            (elapsed >= duration).tolist(),
+        )
+
+    def _progress_python(
+        self, delta: float
+    ) -> tuple[list[list[float]], list[bool], list[bool]]:
+        values: list[list[float]] = []
+        started: list[bool] = []
+        finished: list[bool] = []
+        for slot in range(len(self._tweens)):
+            elapsed: float = self._elapsed[slot] + delta
+            self._elapsed[slot] = elapsed
+            duration: float = self._duration[slot]
+
+            t: float = min(1.0, max(0.0, elapsed / duration))
+            eased: float = self._curves[self._curve[slot]](t)
+            values.append(
+                [a + d * eased for a, d in zip(self._start[slot], self._delta[slot])]
+            )
+            started.append(elapsed >= 0)
+            finished.append(elapsed >= duration)
+        return values, started, finished
+
+    def update(self, delta: float) -> None:
+        """Advances every running tween, sets the animated properties and
+        finishes the tweens that are done
+
+        delta: The frame delta time
+        """
+
+        if not self._tweens:
+            return
+
+        if self.use_numpy:
+            values, started, done = self._progress_numpy(delta)
+        else:
+            values, started, done = self._progress_python(delta)
+
+        finished: list[Tween] = []
+        # Components with several animated properties get invalidated once
+        animated: dict[int, GUIComponent] = {}
+        for slot, tween in enumerate(self._tweens):
+            component: Component = tween.component
+            if component.destroyed:
+                finished.append(tween)
+                continue
+            if not started[slot]:
+                continue
+
+            setattr(component, tween.property, _pack(tween.kind, values[slot]))
+            if isinstance(component, GUIComponent):
+                animated[id(component)] = component
+
+            if done[slot]:
+                finished.append(tween)
+
+        for component in animated.values():
+            # Property setters (like opacity's) might have done it already
+            if not component.dirty:
+                component.invalidate()
+
+        for tween in finished:
+            self._remove(tween)
+        for tween in finished:
+            if tween.on_done is not None and not tween.component.destroyed:
+                tween.on_done(tween)
@@ -0,0 +1,324 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import ctypes
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable
+
+from sdl2 import SDL_INIT_VIDEO, SDL_ClearError, SDL_Init
+from sdl2.hints import SDL_HINT_VIDEODRIVER, SDL_SetHint
+from sdl2.sdlimage import IMG_SavePNG
+from sdl2.surface import SDL_MUSTLOCK, SDL_LockSurface, SDL_UnlockSurface
+
+from compygui.component import Component
+from compygui.datatypes.rgba import RGBAColor, RGBAMask
+from compygui.datatypes.vector2 import IVector2
+from compygui.errors import ComPyGUIError, SDLError, SDLErrorDetector
+from compygui.images import image_cache
+from compygui.viewport import Viewport
+
+FRAME_DELTA: float = 1 / 60
+
+
+class RenderJob:
+    """A layout to render offscreen with a BatchRenderer()
+
+    factory: Builds the layout - a function returning a GUIComponent() (or
+        a list of them) to put into the viewport. With worker processes, it
+        has to be picklable (a function defined at the top level of a
+        module that can be imported without side effects)
+    size: The size of the image
+    path: The .png or .bmp file to write the image to, or None to return
+        its pixels instead
+    args: Positional arguments for factory
+    bg_color: The background color
+    frames: How many frames to render before taking the image (defaults to
+        the depth of the layout, since every level of nesting shows up a
+        frame after the one below it)
+    """
+
+    __slots__ = ("factory", "size", "path", "args", "bg_color", "frames")
+
+    def __init__(
+        self,
+        factory: Callable[..., Any],
+        size: IVector2,
+        path: str | None = None,
+        *args,
+        bg_color: RGBAColor = RGBAColor.TBLACK(),
+        frames: int | None = None,
+    ) -> None:
+        self.factory: Callable[..., Any] = factory
+        self.size: IVector2 = size
+        self.path: str | None = path
+        self.args: tuple = args
+        self.bg_color: RGBAColor = bg_color
+        self.frames: int | None = frames
+
+
+# Per worker process: viewports (and so their surfaces) are reused by every
+# job of the same size and pixel format, and the shared memory block of the
+# current batch stays attached
+_viewports: dict[tuple[int, int, int, int, int, int], Viewport] = {}
+_memory: SharedMemory | None = None
+_mask: RGBAMask = RGBAMask.RGBA()
+_ready: bool = False
+
+
+def _set_mask(mask: tuple[int, int, int, int]) -> None:
+    global _mask
+    _mask = RGBAMask(r=mask[0], g=mask[1], b=mask[2], a=mask[3])
+
+
+def _init_worker(mask: tuple[int, int, int, int]) -> None:
+    """Sets up SDL (once) in a worker process"""
+
+    global _ready
+    _set_mask(mask)
+    if _ready:
+        return
+
+    SDL_SetHint(SDL_HINT_VIDEODRIVER, b"dummy")
+    if SDL_Init(SDL_INIT_VIDEO) != 0:
+        raise SDLError.from_sdl_geterror("Failed to initialize SDL2 library")
+    SDL_ClearError()
+
+    # There's no main loop to deliver background decodes
+    image_cache.background_threshold = None
+    _ready = True
+
+
+def _attach(name: str) -> SharedMemory:
+    global _memory
+    if _memory is None or _memory.name != name:
+        if _memory is not None:
+            _memory.close()
+        # Owned (and unlinked) by the process that created it
+        _memory = SharedMemory(name=name, track=False)
+    return _memory
+
+
+def _detach() -> None:
+    global _memory
+    if _memory is not None:
+        _memory.close()
+        _memory = None
+
+
+def _depth(components: list[Component]) -> int:
+    deepest: int = 0
+    stack: list[tuple[Component, int]] = [(component, 1) for component in components]
+    while stack:
+        node, depth = stack.pop()
+        deepest = max(deepest, depth)
+        stack.extend((child, depth + 1) for child in node.children)
+    return deepest
+
+
+def _render_job(task: tuple) -> None:
+    """Renders one job in a worker process, writing the image to its file
+    or to its place in the shared memory block
+    """
+
+    factory, args, size, bg_color, frames, path, memory, offset = task
+
+    key: tuple[int, int, int, int, int, int] = (
+        *size,
+        _mask.r,
+        _mask.g,
+        _mask.b,
+        _mask.a,
+    )
+    viewport: Viewport | None = _viewports.get(key)
+    if viewport is None:
+        viewport = _viewports[key] = Viewport(
+            size=IVector2(*size), mask=_mask, bg_color=bg_color
+        )
+    viewport.bg_color = bg_color
+
+    built: Any = factory(*args)
+    roots: list[Component] = (
+        list(built) if isinstance(built, (list, tuple)) else [built]
+    )
+    viewport.extend_children(roots)
+    try:
+        for _ in range(_depth(roots) if frames is None else max(1, frames)):
+            viewport.render(FRAME_DELTA)
+
+        if path is not None:
+            _save(viewport, path)
+        else:
+            _copy_pixels(viewport, _attach(memory), offset)
+    finally:
+        for root in roots:
+            root.destroy()
+
+
+def _save(viewport: Viewport, path: str) -> None:
+    extension: str = os.path.splitext(path)[1].lower()
+    if extension == ".bmp":
+        viewport.save_bmp(path)
+    elif extension == ".png":
+        with SDLErrorDetector(error_info=f"Failed to save {path!r}"):
+            IMG_SavePNG(viewport._surface, path.encode("utf-8"))
+    else:
+        raise ComPyGUIError(f"Can't save images as {extension!r} (only .png and .bmp)")
+
+
+def _copy_pixels(viewport: Viewport, memory: SharedMemory, offset: int) -> None:
+    """Copies the viewport's pixels (without row padding) into memory"""
+
+    surf = viewport._surface.contents  # type: ignore
+    row: int = surf.w * surf.format.contents.BytesPerPixel
+    target = (ctypes.c_char * (row * surf.h)).from_buffer(memory.buf, offset)
+
+    must_lock: bool = SDL_MUSTLOCK(surf)
+    if must_lock:
+        SDL_LockSurface(viewport._surface)
+    try:
+        address: int = ctypes.addressof(target)
+        if surf.pitch == row:
+            ctypes.memmove(address, surf.pixels, row * surf.h)
+        else:
+            for y in range(surf.h):
+                ctypes.memmove(address + y * row, surf.pixels + y * surf.pitch, row)
+    finally:
+        if must_lock:
+            SDL_UnlockSurface(viewport._surface)
+        # Holds an export of the buffer, which would keep it from closing
+        del target
+
+
+class BatchRenderer:
+    """Renders layouts offscreen - without an app or a window - into image
+    files or pixel buffers, spread over a pool of worker processes. Every
+    worker sets SDL up once and reuses its viewports (and their surfaces),
+    loaded fonts and decoded images across jobs. Pixels come back through
+    one shared memory block per batch instead of being pickled, and files
+    are written by the workers themselves.
+
+    workers: How many worker processes render jobs (defaults to the number
+        of CPUs, 0 renders them in this process)
+    mask: The pixel format of the images
+    """
+
+    def __init__(
+        self, *args, workers: int | None = None, mask: RGBAMask = RGBAMask.RGBA()
+    ) -> None:
+        self.mask: RGBAMask = mask
+        self.workers: int = (os.cpu_count() or 1) if workers is None else workers
+
+        self._executor: Executor | None = None
+
+    def __enter__(self) -> BatchRenderer:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=((self.mask.r, self.mask.g, self.mask.b, self.mask.a),),
+            )
+        return self._executor
+
+    def render(self, jobs: Iterable[RenderJob]) -> list[str | bytes]:
+        """Renders a batch of jobs and returns, for every job in order, the
+        path it was written to, or its pixels (row by row, laid out
+        according to the mask) if it has no path
+
+        jobs: The jobs to render
+        """
+
+        batch: list[RenderJob] = list(jobs)
+        if not batch:
+            return []
+
+        offsets: list[int] = []
+        total: int = 0
+        for job in batch:
+            offsets.append(total)
+            if job.path is None:
+                total += job.size.x * job.size.y * 4
+
+        memory: SharedMemory | None = None
+        if total:
+            memory = SharedMemory(create=True, size=total)
+        try:
+            tasks: list[tuple] = [
+                (
+                    job.factory,
+                    job.args,
+                    (job.size.x, job.size.y),
+                    job.bg_color,
+                    job.frames,
+                    job.path,
+                    None if memory is None else memory.name,
+                    offset,
+                )
+                for job, offset in zip(batch, offsets)
+            ]
+
+            if self.workers <= 0:
+                # In this process, nothing global may change for good: SDL
+                # isn't initialized here (software surfaces don't need it, and
+                # the app's windows would get the dummy driver), and only the
+                # batch itself skips background decodes
+                _set_mask((self.mask.r, self.mask.g, self.mask.b, self.mask.a))
+                threshold: int | None = image_cache.background_threshold
+                image_cache.background_threshold = None
+                try:
+                    for task in tasks:
+                        _render_job(task)
+                finally:
+                    image_cache.background_threshold = threshold
+                    _detach()
+            else:
+                chunksize: int = max(1, len(tasks) // (self.workers * 4))
+                # list() re-raises exceptions from the workers
+                list(self._pool().map(_render_job, tasks, chunksize=chunksize))
+
+            results: list[str | bytes] = []
+            for job, offset in zip(batch, offsets):
+                if job.path is not None:
+                    results.append(job.path)
+                else:
+                    size: int = job.size.x * job.size.y * 4
+                    results.append(bytes(memory.buf[offset : offset + size]))  # type: ignore
+            return results
+        finally:
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+
+    def close(self) -> None:
+        """Shuts the worker processes down"""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def render_batch(
+    jobs: Iterable[RenderJob], *args, workers: int | None = None
+) -> list[str | bytes]:
+    """Renders a batch of jobs with a temporary BatchRenderer() (see
+    BatchRenderer().render())
+
+    jobs: The jobs to render
+    workers: How many worker processes render jobs (defaults to the number of CPUs)
+    """
+
+    with BatchRenderer(workers=workers) as renderer:
+        return renderer.render(jobs)
@@ -8,6 +8,84 @@ https://github.com/FluffyKn1ght/compygui
 """
 
 from abc import ABC
+from typing import Any, Iterable, Iterator
+
+from sdl2.surface import SDL_Surface
+from compygui.datatypes.rect2 import IRect2
+from compygui.memory import free_surfaces
+
+
+class ChildList:
+    """The ordered children of a Component(), first drawn first (bottom of the
+    z-order). Backed by an insertion-ordered dict, so appending, removing
+    and membership checks are O(1) instead of O(n).
+
+    Reparent children through Component() methods instead of changing a
+    ChildList() directly, and don't reparent while iterating over one.
+
+    children: The starting children
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, children: Iterable[Component] = ()) -> None:
+        self._items: dict[Component, None] = dict.fromkeys(children)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator[Component]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[Component]:
+        return reversed(self._items)
+
+    def __contains__(self, child: object) -> bool:
+        return child in self._items
+
+    def __getitem__(self, index: int) -> Component:
+        """O(n) - prefer iterating"""
+        return list(self._items)[index]
+
+    def __repr__(self) -> str:
+        return f"ChildList({list(self._items)})"
+
+    def append(self, child: Component) -> None:
+        """Adds a child on top of the others (moves it there if it's already here)"""
+        self._items.pop(child, None)
+        self._items[child] = None
+
+    def extend(self, children: Iterable[Component]) -> None:
+        """Adds children on top of the others, in order"""
+        for child in children:
+            self.append(child)
+
+    def remove(self, child: Component) -> None:
+        """Removes a child. Raises ValueError if it isn't here"""
+        try:
+            del self._items[child]
+        except KeyError:
+            raise ValueError(f"{child} is not a child")
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+def _disconnect(listeners: list[Any]) -> None:
+    """Disconnects EventListener()s with one EventQueue().disconnect_many()
+    call per queue
+    """
+
+    queues: dict[int, tuple[Any, list[Any]]] = {}
+    for listener in listeners:
+        queues.setdefault(id(listener.queue), (listener.queue, []))[1].append(
+            listener
+        )
+    for queue, batch in queues.values():
+        queue.disconnect_many(batch)
 
 
 class Component(ABC):
@@ -19,6 +97,9 @@ class Component(ABC):
     as it's meant to serve as a base for other component types (however, you
     shouldn't have a reason to use anything besides Component() and GUIComponent()).
 
+    Components have an explicit lifecycle: their resources are only released
+    by destroy(), never by the garbage collector.
+
     *children: The children of the component
     """
 
@@ -26,15 +107,17 @@ class Component(ABC):
         self.destroyed: bool = False
 
         self._parent: Component | None = None
-        self._children: list[Component] = []
+        self._children: ChildList = ChildList()
+
+        # Identifies the Component() among its siblings, and the Element() it
+        # was last built from - both set by compygui.reconcile.reconcile()
+        self.key: Any = None
+        self._element: Any = None
 
         for child in children:
             if type(child) is Component:
                 child.reparent(self)
 
-    def __del__(self) -> None:
-        self.destroy()
-
     @property
     def parent(self) -> Component | None:
         return self._parent
@@ -46,7 +129,7 @@ class Component(ABC):
         )
 
     @property
-    def children(self) -> list[Component]:
+    def children(self) -> ChildList:
         return self._children
 
     @children.setter
@@ -57,11 +140,83 @@ class Component(ABC):
 
     def _add_child(self, child: Component) -> None:
         self._children.append(child)
+        self.invalidate_layout()
         self.add_child(child)
 
     def add_child(self, child: Component) -> None:
         pass
 
+    def add_children(self, children: list[Component]) -> None:
+        """Called (instead of add_child()) with every batch of children added
+        through extend_children() or replace_children()
+
+        children: The new children, in order
+        """
+
+        for child in children:
+            self.add_child(child)
+
+    def _adopt(self, children: Iterable[Component]) -> list[Component]:
+        """Detaches children from their old parents and points them to this
+        Component(). Returns the ones that weren't children of it before.
+        """
+
+        adopted: list[Component] = []
+        for child in children:
+            if child._parent is self:
+                continue
+            if child._parent is not None:
+                try:
+                    child._parent._children.remove(child)
+                except ValueError:
+                    pass
+                child._parent.invalidate_layout()
+            child._parent = self
+            adopted.append(child)
+        return adopted
+
+    def extend_children(self, children: Iterable[Component]) -> None:
+        """Adds a batch of children on top of the existing ones (moving the
+        ones that already are children to the top), setting them all up in
+        one pass (see add_children())
+
+        children: The children to add, in order
+        """
+
+        batch: list[Component] = list(children)
+        adopted: list[Component] = self._adopt(batch)
+        self._children.extend(batch)
+        self.invalidate_layout()
+
+        if adopted:
+            self.add_children(adopted)
+
+    def replace_children(self, children: Iterable[Component]) -> None:
+        """Replaces all children with a new ordered batch. Children that
+        aren't part of it anymore are detached (not destroyed), the ones that
+        stay keep their setup, and only the new ones get set up - so re-sorting
+        the children is O(n).
+
+        children: The new children, in order
+        """
+
+        batch: list[Component] = list(children)
+        kept: set[Component] = set(batch)
+        dropped: list[Component] = [
+            child for child in self._children if child not in kept
+        ]
+        for child in dropped:
+            child._parent = None
+
+        adopted: list[Component] = self._adopt(batch)
+        self._children = ChildList(batch)
+        self.invalidate_layout()
+
+        if dropped:
+            Component._detach_subtrees(dropped)
+        if adopted:
+            self.add_children(adopted)
+
     def reparent(self, to: Component | None) -> None:
         """Reparent this Component() to another Component()"""
 
@@ -71,12 +226,112 @@ class Component(ABC):
                 self._parent.children.remove(self)
             except ValueError:
                 pass
+            self._parent.invalidate_layout()
 
+        detached: bool = self._parent is not None and to is None
         self._parent = to
 
         if self._parent:
             self._parent._add_child(self)
+        elif detached:
+            Component._detach_subtrees([self])
 
-    def destroy(self) -> None:
-        """Cleans up and deletes the Component()"""
+    def invalidate(self, rect: IRect2 | None = None) -> None:
+        """Marks (part of) this Component() as needing to be re-drawn
+
+        rect: The dirty area, or None if the whole Component() is dirty
+        """
+
+        if self._parent:
+            self._parent.invalidate(rect)
+
+    def invalidate_layout(self) -> None:
+        """Marks this Component() as needing to be laid out again. Plain
+        Component()s have no layout of their own, so this is passed on to
+        the parent.
+        """
+
+        if self._parent:
+            self._parent.invalidate_layout()
+
+    def subtree(self) -> list[Component]:
+        """Returns this Component() and all of its descendants, parents
+        before their children
+        """
+
+        nodes: list[Component] = []
+        stack: list[Component] = [self]
+        while stack:
+            node: Component = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node._children))
+        return nodes
+
+    def _detach(self, listeners: list[Any]) -> None:
+        """Leaves the VCT as part of a subtree that was detached from it
+        (without being destroyed), so it gets set up again once it's added
+        back to one
+
+        listeners: A list to add this Component()'s EventListener()s to -
+            they get disconnected in bulk afterwards
+        """
         pass
+
+    @staticmethod
+    def _detach_subtrees(roots: list[Component]) -> None:
+        """Makes every Component() in the subtrees of roots leave the VCT,
+        disconnecting all of their EventListener()s in bulk
+
+        roots: The roots of the detached subtrees
+        """
+
+        listeners: list[Any] = []
+        for root in roots:
+            for node in root.subtree():
+                node._detach(listeners)
+        _disconnect(listeners)
+
+    def _release(self, listeners: list[Any], surfaces: list[SDL_Surface]) -> None:
+        """Releases the resources of this Component() alone (not of its
+        children) as part of destroy()
+
+        listeners: A list to add this Component()'s EventListener()s to -
+            they get disconnected in bulk afterwards
+        surfaces: A list to add this Component()'s (tracked) surfaces to -
+            they get freed in bulk afterwards
+        """
+        pass
+
+    def destroy(self) -> None:
+        """Cleans up and deletes the Component() and its whole subtree.
+
+        The subtree is detached from the parent once, every Component() in it
+        releases its resources, and then all of their EventListener()s are
+        disconnected with one EventQueue().disconnect_many() call per queue
+        and all of their surfaces are freed in one batch.
+        """
+
+        if self.destroyed:
+            return
+
+        if self._parent is not None:
+            try:
+                self._parent.children.remove(self)
+            except ValueError:
+                pass
+            self._parent.invalidate_layout()
+            self._parent = None
+
+        listeners: list[Any] = []
+        surfaces: list[SDL_Surface] = []
+        for node in self.subtree():
+            if node.destroyed:
+                continue
+
+            node._release(listeners, surfaces)
+            node.destroyed = True
+            node._parent = None
+            node._children = ChildList()
+
+        _disconnect(listeners)
+        free_surfaces(surfaces)
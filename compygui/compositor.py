@@ -0,0 +1,875 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import ctypes
+import os
+import sys
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from enum import Enum
+from typing import Iterable
+
+from sdl2.blendmode import (
+    SDL_BLENDMODE_ADD,
+    SDL_BLENDMODE_BLEND,
+    SDL_BLENDMODE_MUL,
+    SDL_BLENDMODE_NONE,
+)
+from sdl2.pixels import SDL_MapRGBA
+from sdl2.rect import SDL_Rect
+from sdl2.surface import (
+    SDL_BlitSurface,
+    SDL_CreateRGBSurface,
+    SDL_CreateRGBSurfaceFrom,
+    SDL_FillRect,
+    SDL_FreeSurface,
+    SDL_GetClipRect,
+    SDL_LowerBlit,
+    SDL_SetClipRect,
+    SDL_SetSurfaceAlphaMod,
+    SDL_SetSurfaceBlendMode,
+    SDL_SetSurfaceColorMod,
+    SDL_Surface,
+    SDL_UpperBlitScaled,
+)
+
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+from compygui.errors import ComPyGUIError, SDLErrorDetector
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BlendMode(Enum):
+    """How a GUIComponent() gets composited onto whatever is below it
+
+    NONE: Overwrite the destination pixels (alpha is copied, not blended)
+    NORMAL: Regular "source over destination" alpha blending
+    ADD: Additive blending (dst + src * src_alpha)
+    MULTIPLY: Multiplicative blending (src * dst + dst * (1 - src_alpha))
+    """
+
+    NONE = 0
+    NORMAL = 1
+    ADD = 2
+    MULTIPLY = 3
+
+    def as_sdl_blend_mode(self) -> int:
+        """Returns the matching SDL_BLENDMODE_* value"""
+        return {
+            BlendMode.NONE: SDL_BLENDMODE_NONE,
+            BlendMode.NORMAL: SDL_BLENDMODE_BLEND,
+            BlendMode.ADD: SDL_BLENDMODE_ADD,
+            BlendMode.MULTIPLY: SDL_BLENDMODE_MUL,
+        }[self]
+
+
+def has_numpy() -> bool:
+    """Returns whether the vectorized (NumPy) compositing path is available"""
+    return numpy is not None
+
+
+def channel_offsets(surface: SDL_Surface) -> tuple[int, int, int, int]:
+    """Returns the byte offsets of the R, G, B and A channels inside
+    one pixel of a 32-bit surface
+
+    surface: The (32-bit) surface to inspect
+    """
+
+    fmt = surface.contents.format.contents
+    if fmt.BytesPerPixel != 4:
+        raise ComPyGUIError(
+            f"Only 32-bit surfaces are supported, got {fmt.BitsPerPixel}-bit"
+        )
+
+    offsets: list[int] = []
+    for mask in (fmt.Rmask, fmt.Gmask, fmt.Bmask, fmt.Amask):
+        if not mask:
+            raise ComPyGUIError("Surface has no alpha channel")
+
+        shift: int = (mask & -mask).bit_length() - 1
+        offset: int = shift // 8
+        if sys.byteorder == "big":
+            offset = 3 - offset
+        offsets.append(offset)
+
+    return (offsets[0], offsets[1], offsets[2], offsets[3])
+
+
+def surface_array(surface: SDL_Surface) -> numpy.ndarray:
+    """Returns a zero-copy (height, width, 4) uint8 NumPy view over the
+    pixels of a 32-bit surface. The channel order is the surface's
+    in-memory byte order - use channel_offsets() to find R, G, B and A.
+
+    The surface must stay alive (and locked, if SDL_MUSTLOCK() says so)
+    for as long as the returned array is in use.
+
+    surface: The surface to create a view of
+    """
+
+    if numpy is None:
+        raise ComPyGUIError("NumPy is required for array access to surfaces")
+
+    surf = surface.contents
+    if surf.format.contents.BytesPerPixel != 4:
+        raise ComPyGUIError("Only 32-bit surfaces can be viewed as arrays")
+
+    if surf.w == 0 or surf.h == 0 or not surf.pixels:
+        return numpy.zeros((surf.h, surf.w, 4), dtype=numpy.uint8)
+
+    buf = (ctypes.c_uint8 * (surf.pitch * surf.h)).from_address(surf.pixels)
+    return numpy.lib.stride_tricks.as_strided(
+        numpy.frombuffer(buf, dtype=numpy.uint8),
+        shape=(surf.h, surf.w, 4),
+        strides=(surf.pitch, 4, 1),
+    )
+
+
+def pixel_dtype(surface: SDL_Surface) -> numpy.dtype:
+    """Returns a structured NumPy dtype with "r", "g", "b" and "a" uint8
+    fields laid out like the pixels of a 32-bit surface
+
+    surface: The (32-bit) surface to describe
+    """
+
+    if numpy is None:
+        raise ComPyGUIError("NumPy is required for array access to surfaces")
+
+    return numpy.dtype(
+        {
+            "names": ["r", "g", "b", "a"],
+            "formats": [numpy.uint8] * 4,
+            "offsets": list(channel_offsets(surface)),
+            "itemsize": 4,
+        }
+    )
+
+
+def surface_memoryview(surface: SDL_Surface) -> memoryview:
+    """Returns a zero-copy (height, pitch // 4) memoryview of the packed
+    32-bit pixels of a surface, for when NumPy is not available.
+    Each item is one pixel, laid out according to the surface's
+    RGBA mask. Rows may be padded past the surface's width.
+
+    surface: The (32-bit) surface to create a view of
+    """
+
+    surf = surface.contents
+    if surf.format.contents.BytesPerPixel != 4:
+        raise ComPyGUIError("Only 32-bit surfaces can be viewed as memory")
+
+    if surf.w == 0 or surf.h == 0 or not surf.pixels:
+        return memoryview(b"").cast("I")
+
+    buf = (ctypes.c_uint8 * (surf.pitch * surf.h)).from_address(surf.pixels)
+    return memoryview(buf).cast("B").cast("I", (surf.h, surf.pitch // 4))
+
+
+def _div255(x: numpy.ndarray) -> numpy.ndarray:
+    """Exact round(x / 255) for integer arrays in range(0, 255 * 255 + 1)"""
+    x = x + 128
+    return (x + (x >> 8)) >> 8
+
+
+def blend_arrays(
+    dst: numpy.ndarray,
+    src: numpy.ndarray,
+    mode: BlendMode,
+    *args,
+    dst_channels: tuple[int, int, int, int],
+    src_channels: tuple[int, int, int, int],
+    premultiplied: bool = False,
+    opacity: int = 255,
+) -> None:
+    """Blends src onto dst in place (vectorized)
+
+    dst: A (height, width, 4) uint8 array to blend onto
+    src: A (height, width, 4) or (4,) uint8 array to blend
+    mode: The blend mode to use
+    dst_channels: The R, G, B, A byte offsets of dst
+    src_channels: The R, G, B, A byte offsets of src
+    premultiplied: Whether the color channels of src are premultiplied by its alpha
+    opacity: The alpha (0-255) the whole of src is multiplied by
+    """
+
+    if mode == BlendMode.NONE:
+        for dc, sc in zip(dst_channels, src_channels):
+            dst[..., dc] = src[..., sc]
+        return
+
+    # Everything fits in 16 bits (255 * 255 + 255 < 2 ** 16), and going
+    # channel by channel keeps every array a view instead of a copy
+    s_a = src[..., src_channels[3]].astype(numpy.uint16)
+    if opacity < 255:
+        s_a = _div255(s_a * opacity)
+    inv_a = 255 - s_a
+
+    if mode == BlendMode.NORMAL:
+        d_a = dst[..., dst_channels[3]].astype(numpy.uint16)
+        dst[..., dst_channels[3]] = s_a + _div255(d_a * inv_a)
+
+    for dc, sc in zip(dst_channels[:3], src_channels[:3]):
+        s = src[..., sc].astype(numpy.uint16)
+        d = dst[..., dc].astype(numpy.uint16)
+        if premultiplied and opacity < 255:
+            s = _div255(s * opacity)
+
+        # Same as SDL's blitters, MULTIPLY uses the source color as-is
+        if not premultiplied and mode != BlendMode.MULTIPLY:
+            s = _div255(s * s_a)
+
+        if mode == BlendMode.NORMAL:
+            out = s + _div255(d * inv_a)
+        elif mode == BlendMode.ADD:
+            out = s + d
+        elif mode == BlendMode.MULTIPLY:
+            out = _div255(s * d) + _div255(d * inv_a)
+        else:
+            raise ValueError(f"Unsupported blend mode: {mode}")
+
+        dst[..., dc] = numpy.minimum(out, 255, out=out)
+
+
+def _clip(
+    rect: IRect2, clip: IRect2, src_offset: IVector2 = IVector2.ZERO()
+) -> tuple[IRect2, IVector2] | None:
+    """Clips a destination rectangle against a clip rectangle
+
+    Returns the clipped rectangle and the matching offset into the source,
+    or None if nothing is left to draw.
+    """
+
+    clipped: IRect2 | None = rect.intersection(clip)
+    if clipped is None:
+        return None
+
+    return (
+        clipped,
+        IVector2(src_offset.x + clipped.x - rect.x, src_offset.y + clipped.y - rect.y),
+    )
+
+
+def _clip_rect(dst: SDL_Surface) -> IRect2:
+    """Returns the SDL clip rectangle of a surface as an IRect2()"""
+    clip: SDL_Rect = dst.contents.clip_rect
+    return IRect2(clip.x, clip.y, clip.w, clip.h)
+
+
+def _composite_clipped(
+    src: SDL_Surface,
+    offset: IVector2,
+    dst: SDL_Surface,
+    rect: IRect2,
+    mode: BlendMode,
+    premultiplied: bool,
+    opacity: int = 255,
+) -> None:
+    """Composites the (already clipped) offset/rect area of src onto dst.
+    The blend mode of src must already be set for the SDL path.
+    """
+
+    if not premultiplied or mode == BlendMode.NONE:
+        with SDLErrorDetector(error_info="Failed to composite surface"):
+            SDL_SetSurfaceAlphaMod(src, opacity)
+            SDL_LowerBlit(
+                src,
+                SDL_Rect(x=offset.x, y=offset.y, w=rect.w, h=rect.h),
+                dst,
+                rect.as_sdl_rect(),
+            )
+        return
+
+    blend_arrays(
+        surface_array(dst)[rect.y : rect.y + rect.h, rect.x : rect.x + rect.w],
+        surface_array(src)[offset.y : offset.y + rect.h, offset.x : offset.x + rect.w],
+        mode,
+        dst_channels=channel_offsets(dst),
+        src_channels=channel_offsets(src),
+        premultiplied=True,
+        opacity=opacity,
+    )
+
+
+# The layers translucent fills get blitted from (in pieces of up to this
+# size), by pixel format. Per thread, since tiles get filled in parallel
+_FILL_LAYER_SIZE: int = 256
+_fill_layers: threading.local = threading.local()
+
+
+def _fill_layer(dst: SDL_Surface) -> SDL_Surface:
+    """Returns this thread's fill layer in the pixel format of dst"""
+
+    layers: dict[tuple[int, int, int, int], SDL_Surface] | None = getattr(
+        _fill_layers, "layers", None
+    )
+    if layers is None:
+        layers = _fill_layers.layers = {}
+
+    fmt = dst.contents.format.contents
+    masks: tuple[int, int, int, int] = (fmt.Rmask, fmt.Gmask, fmt.Bmask, fmt.Amask)
+    layer: SDL_Surface | None = layers.get(masks)
+    if layer is None:
+        with SDLErrorDetector(error_info="Failed to create fill layer"):
+            layer = layers[masks] = SDL_CreateRGBSurface(
+                0, _FILL_LAYER_SIZE, _FILL_LAYER_SIZE, 32, *masks
+            )
+    return layer
+
+
+def _fill_clipped(
+    dst: SDL_Surface, rect: IRect2, color: RGBAColor, mode: BlendMode
+) -> None:
+    """Fills an (already clipped) rectangle of dst with a color"""
+
+    opaque: bool = color.a == 255 and mode == BlendMode.NORMAL
+    if mode == BlendMode.NONE or opaque:
+        with SDLErrorDetector(error_info="Failed to fill rectangle"):
+            SDL_FillRect(
+                dst,
+                rect.as_sdl_rect(),
+                SDL_MapRGBA(dst.contents.format, color.r, color.g, color.b, color.a),
+            )
+        return
+
+    # SDL's blitters have SIMD paths for "over" blending, NumPy is faster
+    # for the rest
+    if numpy is not None and mode != BlendMode.NORMAL:
+        blend_arrays(
+            surface_array(dst)[rect.y : rect.y + rect.h, rect.x : rect.x + rect.w],
+            numpy.array([color.r, color.g, color.b, color.a], dtype=numpy.uint8),
+            mode,
+            dst_channels=channel_offsets(dst),
+            src_channels=(0, 1, 2, 3),
+        )
+        return
+
+    layer: SDL_Surface = _fill_layer(dst)
+    size: int = _FILL_LAYER_SIZE
+    with SDLErrorDetector(error_info="Failed to fill rectangle"):
+        SDL_FillRect(
+            layer,
+            SDL_Rect(0, 0, min(rect.w, size), min(rect.h, size)),
+            SDL_MapRGBA(layer.contents.format, color.r, color.g, color.b, color.a),
+        )
+        SDL_SetSurfaceBlendMode(layer, mode.as_sdl_blend_mode())
+        right: int = rect.x + rect.w
+        bottom: int = rect.y + rect.h
+        for y in range(rect.y, bottom, size):
+            for x in range(rect.x, right, size):
+                SDL_BlitSurface(
+                    layer,
+                    SDL_Rect(0, 0, min(size, right - x), min(size, bottom - y)),
+                    dst,
+                    SDL_Rect(x, y, 0, 0),
+                )
+
+
+def composite(
+    src: SDL_Surface,
+    dst: SDL_Surface | DisplayList,
+    position: IVector2,
+    mode: BlendMode = BlendMode.NORMAL,
+    *args,
+    premultiplied: bool = False,
+    opacity: float = 1.0,
+) -> None:
+    """Composites the whole of src onto dst at position
+
+    Straight-alpha compositing goes through SDL's (SIMD) blitters.
+    Premultiplied-alpha surfaces are not supported by SDL's software
+    blitters, so they are composited with NumPy instead.
+
+    src: The surface to composite
+    dst: The surface to composite onto, or a DisplayList() to record into
+    position: The top-left position of src on dst
+    mode: The blend mode to use
+    premultiplied: Whether the color channels of src are premultiplied by its alpha
+    opacity: How opaque src is drawn, from 0 to 1 (multiplies its alpha)
+    """
+
+    if premultiplied and mode != BlendMode.NONE and numpy is None:
+        raise ComPyGUIError("Compositing premultiplied surfaces requires NumPy")
+
+    alpha: int = min(255, max(0, round(opacity * 255)))
+    if alpha == 0:
+        return
+
+    if isinstance(dst, DisplayList):
+        dst.composite(src, position, mode, premultiplied=premultiplied, opacity=alpha)
+        return
+
+    surf = src.contents
+    clipped = _clip(IRect2(position.x, position.y, surf.w, surf.h), _clip_rect(dst))
+    if clipped is None:
+        return
+    rect, offset = clipped
+
+    with SDLErrorDetector(error_info="Failed to composite surface"):
+        SDL_SetSurfaceBlendMode(src, mode.as_sdl_blend_mode())
+    _composite_clipped(src, offset, dst, rect, mode, premultiplied, alpha)
+
+
+def fill(
+    dst: SDL_Surface | DisplayList,
+    rect: IRect2,
+    color: RGBAColor,
+    mode: BlendMode = BlendMode.NORMAL,
+) -> None:
+    """Fills a rectangle of dst with a color, respecting its alpha
+
+    Unlike SDL_FillRect(), which writes raw pixels, this blends
+    translucent colors onto dst according to mode.
+
+    dst: The surface to fill, or a DisplayList() to record into
+    rect: The rectangle to fill
+    color: The (straight alpha) color to fill with
+    mode: The blend mode to use
+    """
+
+    if isinstance(dst, DisplayList):
+        dst.fill(rect, color, mode)
+        return
+
+    clipped = _clip(rect, _clip_rect(dst))
+    if clipped is None:
+        return
+
+    _fill_clipped(dst, clipped[0], color, mode)
+
+
+def _composite_batch_clipped(
+    src: SDL_Surface,
+    pieces: Iterable[tuple[IRect2, IVector2]],
+    dst: SDL_Surface,
+    clip: IRect2,
+    mode: BlendMode,
+    tint: RGBAColor | None,
+    opacity: int,
+) -> None:
+    """Blits every piece of src onto dst, with the blend mode, tint and
+    opacity set only once
+    """
+
+    with SDLErrorDetector(error_info="Failed to composite surface"):
+        SDL_SetSurfaceBlendMode(src, mode.as_sdl_blend_mode())
+        if tint is None:
+            SDL_SetSurfaceColorMod(src, 255, 255, 255)
+        else:
+            SDL_SetSurfaceColorMod(src, tint.r, tint.g, tint.b)
+            opacity = opacity * tint.a // 255
+        SDL_SetSurfaceAlphaMod(src, opacity)
+
+        # Clipped inline, blitting through the same two rectangles, since
+        # batches can be thousands of pieces long
+        clip_x0, clip_y0 = clip.x, clip.y
+        clip_x1, clip_y1 = clip.x + clip.w, clip.y + clip.h
+        src_rect: SDL_Rect = SDL_Rect()
+        dst_rect: SDL_Rect = SDL_Rect()
+        for rect, offset in pieces:
+            x0: int = rect.x if rect.x > clip_x0 else clip_x0
+            y0: int = rect.y if rect.y > clip_y0 else clip_y0
+            x1: int = rect.x + rect.w
+            y1: int = rect.y + rect.h
+            if x1 > clip_x1:
+                x1 = clip_x1
+            if y1 > clip_y1:
+                y1 = clip_y1
+            if x1 <= x0 or y1 <= y0:
+                continue
+
+            src_rect.x = offset.x + x0 - rect.x
+            src_rect.y = offset.y + y0 - rect.y
+            src_rect.w = dst_rect.w = x1 - x0
+            src_rect.h = dst_rect.h = y1 - y0
+            dst_rect.x = x0
+            dst_rect.y = y0
+            SDL_LowerBlit(src, src_rect, dst, dst_rect)
+
+
+def composite_batch(
+    src: SDL_Surface,
+    dst: SDL_Surface | DisplayList,
+    pieces: list[tuple[IRect2, IVector2]],
+    mode: BlendMode = BlendMode.NORMAL,
+    *args,
+    tint: RGBAColor | None = None,
+    opacity: float = 1.0,
+) -> None:
+    """Composites many areas of one (straight alpha) surface onto dst at
+    once, like the glyphs of a string from a glyph atlas. The surface's
+    blend mode, tint and opacity are only set once for the whole batch.
+
+    src: The surface to composite areas of
+    dst: The surface to composite onto, or a DisplayList() to record into
+    pieces: (destination rectangle, top-left position in src) of every area
+    mode: The blend mode to use
+    tint: A color the color channels of src are multiplied by (its alpha
+        multiplies the opacity)
+    opacity: How opaque src is drawn, from 0 to 1
+    """
+
+    alpha: int = min(255, max(0, round(opacity * 255)))
+    if alpha == 0 or not pieces:
+        return
+
+    if isinstance(dst, DisplayList):
+        dst.composite_batch(src, pieces, mode, tint=tint, opacity=alpha)
+        return
+
+    _composite_batch_clipped(src, pieces, dst, _clip_rect(dst), mode, tint, alpha)
+
+
+def _nine_slice_pieces(
+    size: IVector2, rect: IRect2, insets: tuple[int, int, int, int], center: bool
+) -> list[tuple[IRect2, IRect2]]:
+    """Returns (source area, destination rectangle) of every slice"""
+
+    left, top, right, bottom = insets
+    # Corners get squeezed if the rectangle is smaller than they are
+    if left + right > rect.w:
+        left = rect.w * left // (left + right)
+        right = rect.w - left
+    if top + bottom > rect.h:
+        top = rect.h * top // (top + bottom)
+        bottom = rect.h - top
+
+    src_x: tuple[int, ...] = (0, insets[0], size.x - insets[2], size.x)
+    src_y: tuple[int, ...] = (0, insets[1], size.y - insets[3], size.y)
+    dst_x: tuple[int, ...] = (
+        rect.x,
+        rect.x + left,
+        rect.x + rect.w - right,
+        rect.x + rect.w,
+    )
+    dst_y: tuple[int, ...] = (
+        rect.y,
+        rect.y + top,
+        rect.y + rect.h - bottom,
+        rect.y + rect.h,
+    )
+
+    pieces: list[tuple[IRect2, IRect2]] = []
+    for row in range(3):
+        for column in range(3):
+            if row == column == 1 and not center:
+                continue
+            area: IRect2 = IRect2(
+                src_x[column],
+                src_y[row],
+                src_x[column + 1] - src_x[column],
+                src_y[row + 1] - src_y[row],
+            )
+            target: IRect2 = IRect2(
+                dst_x[column],
+                dst_y[row],
+                dst_x[column + 1] - dst_x[column],
+                dst_y[row + 1] - dst_y[row],
+            )
+            if area.w > 0 and area.h > 0 and target.w > 0 and target.h > 0:
+                pieces.append((area, target))
+    return pieces
+
+
+def _nine_slice_clipped(
+    src: SDL_Surface,
+    pieces: list[tuple[IRect2, IRect2]],
+    dst: SDL_Surface,
+    clip: IRect2,
+    mode: BlendMode,
+    opacity: int,
+) -> None:
+    """Blits (and stretches) the slices of src onto dst within clip"""
+
+    old_clip: SDL_Rect = SDL_Rect()
+    with SDLErrorDetector(error_info="Failed to composite nine-slice"):
+        SDL_SetSurfaceBlendMode(src, mode.as_sdl_blend_mode())
+        SDL_SetSurfaceColorMod(src, 255, 255, 255)
+        SDL_SetSurfaceAlphaMod(src, opacity)
+
+        SDL_GetClipRect(dst, old_clip)
+        SDL_SetClipRect(dst, clip.as_sdl_rect())
+        try:
+            for area, target in pieces:
+                # Same-sized slices are plain blits
+                SDL_UpperBlitScaled(
+                    src, area.as_sdl_rect(), dst, target.as_sdl_rect()
+                )
+        finally:
+            SDL_SetClipRect(dst, old_clip)
+
+
+def composite_nine_slice(
+    src: SDL_Surface,
+    dst: SDL_Surface | DisplayList,
+    rect: IRect2,
+    insets: tuple[int, int, int, int],
+    mode: BlendMode = BlendMode.NORMAL,
+    *args,
+    opacity: float = 1.0,
+    center: bool = True,
+) -> None:
+    """Composites a (straight alpha) surface onto a rectangle of dst as a
+    nine-slice: its corners are copied as they are, its edges are stretched
+    along the rectangle's sides and its center is stretched over the rest
+
+    src: The surface to slice
+    dst: The surface to composite onto, or a DisplayList() to record into
+    rect: The rectangle to cover
+    insets: The (left, top, right, bottom) sizes of the corners/edges of src
+    mode: The blend mode to use
+    opacity: How opaque src is drawn, from 0 to 1
+    center: Whether to draw the center slice at all
+    """
+
+    alpha: int = min(255, max(0, round(opacity * 255)))
+    if alpha == 0 or rect.w <= 0 or rect.h <= 0:
+        return
+
+    surf = src.contents
+    pieces: list[tuple[IRect2, IRect2]] = _nine_slice_pieces(
+        IVector2(surf.w, surf.h), rect, insets, center
+    )
+
+    if isinstance(dst, DisplayList):
+        dst.composite_nine_slice(src, rect, pieces, mode, opacity=alpha)
+        return
+
+    _nine_slice_clipped(src, pieces, dst, _clip_rect(dst), mode, alpha)
+
+
+_FILL: int = 0
+_COMPOSITE: int = 1
+_BATCH: int = 2
+_NINE_SLICE: int = 3
+
+_tile_executor: ThreadPoolExecutor | None = None
+
+
+def tile_executor() -> ThreadPoolExecutor:
+    """Returns the shared thread pool used for tiled rasterization,
+    creating it (with one worker per CPU core) if needed
+    """
+
+    global _tile_executor
+    if _tile_executor is None:
+        _tile_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="compygui-tile"
+        )
+    return _tile_executor
+
+
+def _shadow_surface(surface: SDL_Surface) -> SDL_Surface:
+    """Creates a new surface header that shares the pixels of surface"""
+
+    surf = surface.contents
+    fmt = surf.format.contents
+    with SDLErrorDetector(error_info="Failed to create shadow surface"):
+        return SDL_CreateRGBSurfaceFrom(
+            surf.pixels,
+            surf.w,
+            surf.h,
+            fmt.BitsPerPixel,
+            surf.pitch,
+            fmt.Rmask,
+            fmt.Gmask,
+            fmt.Bmask,
+            fmt.Amask,
+        )
+
+
+class DisplayList:
+    """A recording of fill() and composite() calls that can be played back
+    onto a surface later - either in one go, or split into tiles that get
+    rasterized concurrently.
+
+    Passing a DisplayList() instead of a surface to fill() or composite()
+    (and so, to GUIComponent().render()) records the call instead of
+    drawing it. Components that draw onto their render() target with raw
+    SDL calls can't be recorded.
+    """
+
+    def __init__(self) -> None:
+        self.commands: list[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def fill(self, rect: IRect2, color: RGBAColor, mode: BlendMode) -> None:
+        """Records a fill() call"""
+        self.commands.append((_FILL, rect, color, mode))
+
+    def composite(
+        self,
+        src: SDL_Surface,
+        position: IVector2,
+        mode: BlendMode,
+        *args,
+        premultiplied: bool = False,
+        opacity: int = 255,
+    ) -> None:
+        """Records a composite() call (opacity is an alpha from 0 to 255)"""
+        surf = src.contents
+        self.commands.append(
+            (
+                _COMPOSITE,
+                IRect2(position.x, position.y, surf.w, surf.h),
+                src,
+                mode,
+                premultiplied,
+                opacity,
+            )
+        )
+
+    def composite_batch(
+        self,
+        src: SDL_Surface,
+        pieces: list[tuple[IRect2, IVector2]],
+        mode: BlendMode,
+        *args,
+        tint: RGBAColor | None = None,
+        opacity: int = 255,
+    ) -> None:
+        """Records a composite_batch() call (opacity is an alpha from 0 to 255)"""
+        bounds: IRect2 = pieces[0][0]
+        for rect, _ in pieces:
+            bounds = bounds.union(rect)
+        self.commands.append((_BATCH, bounds, src, mode, pieces, tint, opacity))
+
+    def composite_nine_slice(
+        self,
+        src: SDL_Surface,
+        rect: IRect2,
+        pieces: list[tuple[IRect2, IRect2]],
+        mode: BlendMode,
+        *args,
+        opacity: int = 255,
+    ) -> None:
+        """Records a composite_nine_slice() call (opacity is an alpha from 0
+        to 255, pieces are the (source area, destination rectangle) of
+        every slice)
+        """
+        self.commands.append((_NINE_SLICE, rect, src, mode, pieces, opacity))
+
+    def clear(self) -> None:
+        """Removes every recorded command"""
+        self.commands.clear()
+
+    def _run(
+        self,
+        commands: Iterable[tuple],
+        dst: SDL_Surface,
+        clip: IRect2,
+        sources: dict[int, SDL_Surface] | None = None,
+    ) -> None:
+        for command in commands:
+            clipped = _clip(command[1], clip)
+            if clipped is None:
+                continue
+            rect, offset = clipped
+
+            if command[0] == _FILL:
+                _fill_clipped(dst, rect, command[2], command[3])
+                continue
+
+            src: SDL_Surface = command[2]
+            if sources is not None:
+                address: int = ctypes.addressof(src.contents)
+                if address not in sources:
+                    sources[address] = _shadow_surface(src)
+                src = sources[address]
+
+            if command[0] == _BATCH:
+                _composite_batch_clipped(
+                    src, command[4], dst, clip, command[3], command[5], command[6]
+                )
+                continue
+            if command[0] == _NINE_SLICE:
+                _nine_slice_clipped(
+                    src, command[4], dst, clip, command[3], command[5]
+                )
+                continue
+
+            with SDLErrorDetector(error_info="Failed to composite surface"):
+                SDL_SetSurfaceBlendMode(src, command[3].as_sdl_blend_mode())
+            _composite_clipped(
+                src, offset, dst, rect, command[3], command[4], command[5]
+            )
+
+    def execute(self, dst: SDL_Surface) -> None:
+        """Plays back every recorded command onto dst
+
+        dst: The surface to draw onto
+        """
+
+        self._run(self.commands, dst, _clip_rect(dst))
+
+    def execute_tiled(
+        self,
+        dst: SDL_Surface,
+        tile_size: IVector2,
+        executor: Executor | None = None,
+    ) -> None:
+        """Plays back every recorded command onto dst, split into tiles
+        that are rasterized concurrently. Commands are binned into the
+        tiles they touch, and each tile plays back its commands in the
+        recorded order, so the result is identical to execute().
+
+        dst: The surface to draw onto
+        tile_size: The size of one tile
+        executor: The executor to rasterize tiles on (defaults to tile_executor())
+        """
+
+        bounds: IRect2 = _clip_rect(dst)
+        columns: int = max(1, -(-bounds.w // tile_size.x))
+        rows: int = max(1, -(-bounds.h // tile_size.y))
+
+        bins: dict[tuple[int, int], list[tuple]] = {}
+        for command in self.commands:
+            rect: IRect2 | None = command[1].intersection(bounds)
+            if rect is None:
+                continue
+
+            col0: int = (rect.x - bounds.x) // tile_size.x
+            col1: int = (rect.x + rect.w - 1 - bounds.x) // tile_size.x
+            row0: int = (rect.y - bounds.y) // tile_size.y
+            row1: int = (rect.y + rect.h - 1 - bounds.y) // tile_size.y
+            for row in range(row0, min(row1, rows - 1) + 1):
+                for col in range(col0, min(col1, columns - 1) + 1):
+                    bins.setdefault((col, row), []).append(command)
+
+        def run_tile(tile: tuple[int, int]) -> None:
+            clip: IRect2 | None = IRect2(
+                bounds.x + tile[0] * tile_size.x,
+                bounds.y + tile[1] * tile_size.y,
+                tile_size.x,
+                tile_size.y,
+            ).intersection(bounds)
+            if clip is None:
+                return
+
+            # SDL keeps per-blit state inside the surfaces, so every tile
+            # blits between its own surface headers over the shared pixels
+            tile_dst: SDL_Surface = _shadow_surface(dst)
+            sources: dict[int, SDL_Surface] = {}
+            try:
+                self._run(bins[tile], tile_dst, clip, sources)
+            finally:
+                for src in sources.values():
+                    SDL_FreeSurface(src)
+                SDL_FreeSurface(tile_dst)
+
+        if executor is None:
+            executor = tile_executor()
+
+        # list() re-raises exceptions from the workers
+        list(executor.map(run_tile, bins))
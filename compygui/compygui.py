@@ -8,21 +8,40 @@ https://github.com/FluffyKn1ght/compygui
 """
 
 from abc import abstractmethod, ABC
+from concurrent.futures import ThreadPoolExecutor
+import os
 import time
 
-from sdl2 import SDL_INIT_VIDEO, SDL_Init, SDL_Quit
+from sdl2 import SDL_INIT_VIDEO, SDL_ClearError, SDL_Init, SDL_Quit
+from sdl2.hints import SDL_HINT_VIDEODRIVER, SDL_SetHint
+from sdl2.mouse import SDL_MOUSEWHEEL_FLIPPED
 from sdl2.events import (
+    SDL_MOUSEWHEEL,
     SDL_QUIT,
     SDL_WINDOWEVENT,
     SDL_Event,
     SDL_PollEvent,
+    SDL_WaitEventTimeout,
     SDL_WindowEvent,
 )
-from sdl2.video import SDL_WINDOWEVENT_CLOSE, SDL_GetWindowID, SDL_GetWindowTitle
+from sdl2.video import (
+    SDL_WINDOWEVENT_CLOSE,
+    SDL_WINDOWEVENT_SIZE_CHANGED,
+    SDL_GetWindowTitle,
+)
 
-from compygui.errors import ComPyGUIError, SDLErrorDetector
+from compygui.animation import Animator
+from compygui.datatypes.vector2 import IVector2, Vector2
+from compygui.errors import ComPyGUIError, SDLError, SDLErrorDetector
 from compygui.events import Event, EventOrigin, EventQueue, EventType
+from compygui.gcpolicy import FrameGCPolicy
+from compygui.images import image_cache
+from compygui.memory import tracker
 from compygui.misc import dummy
+from compygui.profiler import FrameProfiler
+from compygui.recording import InputLog, InputRecorder
+from compygui.shapes import shape_cache
+from compygui.timers import TimerScheduler
 from compygui.window import Window
 
 
@@ -32,6 +51,25 @@ class ComPyGUIApp(ABC):
     title: The name of the app
     silence_license_info: If True, the "ComPyGUI is under GPL v3" notice won't be printed
     framerate: The target rendering framerate
+    window_render_workers: How many worker threads rasterize the viewports of
+        different windows at the same time (0 rasterizes them one after another).
+        Uploading and presenting always happens on the main thread
+    headless: If True, SDL's dummy video driver is used and windows get no
+        renderer - everything is only rendered to the windows' viewports.
+        Useful for CI, benchmarks and rendering snapshots, together with step()
+        and BaseViewport().read_pixels()
+    profiler: The FrameProfiler() used to time frames (a disabled one is
+        created if None). Enable it with app.profiler.enabled = True
+    memory_budget: If not None, sets the budget (in bytes) of
+        compygui.memory.tracker. Cached surfaces get evicted between frames
+        while the tracked surfaces and textures take up more than that
+    gc_policy: If not None, the FrameGCPolicy() that takes over garbage
+        collection after setup(), so collections happen between frames
+        instead of at random points inside of them
+    idle_timeout: If not None, the main loop waits for the next frame's
+        deadline instead of starting it right away, and while the app is
+        idle (see is_idle()), it sleeps for up to this many seconds, waking
+        up as soon as input arrives or a timer (see app.timers) is due
     """
 
     NOTICE: str = """
@@ -59,29 +97,60 @@ please see <https://www.gnu.org/licenses/>.
         title: str = "ComPyGUI App",
         silence_license_info: bool = False,
         framerate: int = 60,
+        window_render_workers: int = 0,
+        headless: bool = False,
+        profiler: FrameProfiler | None = None,
+        memory_budget: int | None = None,
+        gc_policy: FrameGCPolicy | None = None,
+        idle_timeout: float | None = None,
     ) -> None:
         self.destroyed: bool = False
 
         if not silence_license_info:
             ComPyGUIApp._print_license_info()
 
-        with SDLErrorDetector(error_info="Failed to initialize SDL2 library"):
-            SDL_Init(SDL_INIT_VIDEO)
+        self.headless: bool = headless
+        if headless:
+            SDL_SetHint(SDL_HINT_VIDEODRIVER, b"dummy")
+
+        # SDL_Init() can leave harmless errors behind (e.g. with the dummy
+        # video driver), so check its return value instead
+        if SDL_Init(SDL_INIT_VIDEO) != 0:
+            raise SDLError.from_sdl_geterror("Failed to initialize SDL2 library")
+        SDL_ClearError()
 
         self.title: str = title
         self.framerate: int = framerate
+        self.frame: int = 0
+        self.profiler: FrameProfiler = profiler or FrameProfiler()
+        if memory_budget is not None:
+            tracker.budget = memory_budget
 
         self.windows: list[Window] = []
         self.running: bool = False
-        self.event_queue = EventQueue()
+        self._set_up: bool = False
+        self.gc_policy: FrameGCPolicy | None = gc_policy
+        self.idle_timeout: float | None = idle_timeout
+        self.event_queue = EventQueue(profiler=self.profiler)
+        self.animator: Animator = Animator()
+        self.timers: TimerScheduler = TimerScheduler()
+        self.recorder: InputRecorder | None = None
+        """The InputRecorder() input is being recorded with, if any (see
+        start_recording())"""
+
+        self._render_executor: ThreadPoolExecutor | None = None
+        if window_render_workers > 0:
+            self._render_executor = ThreadPoolExecutor(
+                max_workers=min(window_render_workers, os.cpu_count() or 1),
+                thread_name_prefix="compygui-window",
+            )
 
-        self._last_frame_time: float = time.thread_time()
+        self._last_frame_time: float = time.perf_counter()
+        # Time spent waiting while idle, which timers count but animations don't
+        self._idle_time: float = 0.0
 
         self.event_queue.connect(self, self.on_window_destroy, EventType.WINDOW_DESTROY)
 
-    def __del__(self):
-        self.quit()
-
     @staticmethod
     def _print_license_info() -> None:
         print(
@@ -97,28 +166,192 @@ NOTICE and LICENSE files for more information
 
     def _mainloop(self) -> None:
         while self.running:
-            event = SDL_Event()
-            with SDLErrorDetector(on_error=dummy):
-                SDL_PollEvent(event)
+            deadline: float = time.perf_counter() + 1 / self.framerate
+
+            self.profiler.next_frame()
+            with self.profiler.span("frame"):
+                with self.profiler.span("events"):
+                    self._poll_events()
+
+                curtime: float = time.perf_counter()
+                self._frame(curtime - self._last_frame_time)
+                self._last_frame_time = curtime
+
+            self._after_frame(deadline)
+            self._wait(deadline)
+
+    def _setup_once(self) -> None:
+        """Sets the app up (and installs the GC policy) if that didn't happen yet"""
+
+        if self._set_up:
+            return
+
+        self.setup()
+        self._set_up = True
+
+        if self.gc_policy is not None:
+            self.gc_policy.install(self.profiler)
+
+    def _after_frame(self, deadline: float) -> None:
+        """Uses the time left until the next frame for housekeeping
+
+        deadline: The time.perf_counter() value by which the next frame should start
+        """
+
+        if self.gc_policy is not None:
+            self.gc_policy.after_frame(deadline)
+
+    def is_idle(self) -> bool:
+        """Returns whether the next frame would look the same as the last
+        one: nothing is being animated or decoded, and no window's viewport
+        has been invalidated (or needs to be laid out) since it was last rendered
+        """
+
+        if self.animator.active or image_cache.pending:
+            return False
+        return not any(window.viewport.needs_redraw for window in self.windows)
+
+    def _wait(self, deadline: float) -> None:
+        """Waits for the next frame if idle_timeout is set (see ComPyGUIApp())
+
+        deadline: The time.perf_counter() value by which the next frame should start
+        """
+
+        if self.idle_timeout is None:
+            return
+
+        idle: bool = self.is_idle()
+        until: float = deadline
+        if idle:
+            until = max(deadline, time.perf_counter() + self.idle_timeout)
+
+        # Wake up in time for the next timer
+        next_timer: float | None = self.timers.time_until_next()
+        if next_timer is not None:
+            until = min(until, max(deadline, time.perf_counter() + next_timer))
+
+        timeout: int = int((until - time.perf_counter()) * 1000)
+        if timeout > 0:
+            # Returns early (without taking it out of the queue) on input
+            SDL_WaitEventTimeout(None, timeout)
+
+        if idle:
+            # Time spent idle isn't animation time, but timers have to
+            # count it or they'd never come due
+            now: float = time.perf_counter()
+            self._idle_time += now - self._last_frame_time
+            self._last_frame_time = now
+
+    def _poll_events(self) -> None:
+        """Translates all pending SDL events into app events, and takes in
+        the images that finished decoding in the background
+        """
 
+        image_cache.poll()
+
+        event = SDL_Event()
+        with SDLErrorDetector(on_error=dummy):
+            while SDL_PollEvent(event):
                 if event.type == SDL_WINDOWEVENT:
                     if event.window.event == SDL_WINDOWEVENT_CLOSE:
-                        self.event_queue.fire(
-                            EventType.APP_WINDOW_CLOSE,
-                            event_origin=EventOrigin.APP,
-                            window_id=event.window.windowID,
+                        self._fire_input(
+                            EventType.APP_WINDOW_CLOSE, event.window.windowID
+                        )
+                    elif event.window.event == SDL_WINDOWEVENT_SIZE_CHANGED:
+                        self._fire_input(
+                            EventType.APP_WINDOW_RESIZE,
+                            event.window.windowID,
+                            size=IVector2(event.window.data1, event.window.data2),
                         )
+                elif event.type == SDL_MOUSEWHEEL:
+                    flip: int = (
+                        -1 if event.wheel.direction == SDL_MOUSEWHEEL_FLIPPED else 1
+                    )
+                    self._fire_input(
+                        EventType.APP_MOUSE_WHEEL,
+                        event.wheel.windowID,
+                        delta=Vector2(
+                            event.wheel.preciseX * flip, event.wheel.preciseY * flip
+                        ),
+                        position=IVector2(event.wheel.mouseX, event.wheel.mouseY),
+                    )
+
+    def _fire_input(self, evtype: str, window_id: int, **data) -> None:
+        """Fires an app event translated from input, routed to the window
+        with window_id, and records it if input is being recorded
+
+        evtype: The type of the event
+        window_id: The SDL window ID of the window the event is for
+        **data: The rest of the event data
+        """
 
-            curtime: float = time.thread_time()
-            self.event_queue.fire(
-                EventType.APP_RENDER,
-                event_origin=EventOrigin.APP,
-                delta=curtime - self._last_frame_time,
-            )
+        if self.recorder is not None:
+            index: int = -1
+            for i, win in enumerate(self.windows):
+                if win.id == window_id:
+                    index = i
+                    break
+            self.recorder.record_event(evtype, index, data)
+
+        self.event_queue.fire(
+            evtype,
+            event_origin=EventOrigin.APP,
+            event_key=window_id,
+            window_id=window_id,
+            **data,
+        )
+
+    def _frame(self, delta: float) -> None:
+        """Renders every window and ticks the app event queue
+
+        delta: The time since the last frame
+        """
+
+        idle: float = self._idle_time
+        self._idle_time = 0.0
+        if self.recorder is not None:
+            self.recorder.record_frame(delta, idle)
 
-            self._last_frame_time = curtime
+        with self.profiler.span("timers"):
+            self.timers.advance(delta + idle)
 
-            self.event_queue.tick()
+        with self.profiler.span("animate"):
+            self.animator.update(delta)
+
+        with self.profiler.span("rasterize"):
+            rasterized: bool = self._rasterize_windows(delta)
+
+        self.event_queue.fire(
+            EventType.APP_RENDER,
+            event_origin=EventOrigin.APP,
+            delta=delta,
+            rasterized=rasterized,
+        )
+
+        self.event_queue.tick()
+
+        shape_cache.trim()
+        tracker.enforce_budget()
+
+        self.frame += 1
+
+    def _rasterize_windows(self, delta: float) -> bool:
+        """Rasterizes the viewports of all visible windows on the render
+        worker pool. Returns False (and does nothing) if there's no pool or
+        not enough windows for it to help, in which case each Window()
+        rasterizes itself when it gets the APP_RENDER event.
+        """
+
+        if self._render_executor is None:
+            return False
+
+        visible: list[Window] = [win for win in self.windows if win.visible]
+        if len(visible) < 2:
+            return False
+
+        # list() re-raises exceptions from the workers
+        list(self._render_executor.map(lambda win: win.rasterize(delta), visible))
+        return True
 
     def _get_window_by_id(self, id: int) -> Window | None:
         """Gets a Window from a window ID
@@ -127,7 +360,7 @@ NOTICE and LICENSE files for more information
         """
 
         for win in self.windows:
-            if id == SDL_GetWindowID(win._window):
+            if id == win.id:
                 return win
 
         return None
@@ -143,6 +376,9 @@ NOTICE and LICENSE files for more information
         except KeyError:
             kwargs["title"] = self.title
 
+        kwargs.setdefault("headless", self.headless)
+        kwargs.setdefault("profiler", self.profiler)
+
         win: Window = Window(*args, app_event_queue=self.event_queue, **kwargs)
         self.register_window(win)
 
@@ -164,24 +400,139 @@ NOTICE and LICENSE files for more information
             self.running = False
 
     def run(self) -> None:
-        """Launches the app"""
+        """Launches the app and quits it once the main loop ends"""
         if self.running:
             raise ComPyGUIError("App is already running")
 
-        self.setup()
+        self._setup_once()
+
         self.running = True
-        self._mainloop()
+        try:
+            self._mainloop()
+        finally:
+            self.quit()
+
+    def step(self, delta: float) -> None:
+        """Runs exactly one frame of the app with a fixed delta time,
+        (setting the app up first if needed) instead of running the main loop.
+
+        Meant for headless apps - stepping with the same deltas always
+        renders the same frames (images decoding in the background are
+        waited for before the frame, instead of showing up whenever they're
+        done).
+
+        delta: The delta time to render the frame with
+        """
+
+        if self.running:
+            raise ComPyGUIError("Can't step an app that is already running")
+
+        self._setup_once()
+        deadline: float = time.perf_counter() + 1 / self.framerate
+
+        self.profiler.next_frame()
+        with self.profiler.span("frame"):
+            with self.profiler.span("events"):
+                # Frames mustn't depend on how fast images decode
+                image_cache.poll(wait=True)
+                self._poll_events()
+            self._frame(delta)
+
+        self._after_frame(deadline)
+
+    def start_recording(self, path: str) -> InputRecorder:
+        """Starts recording the app events translated from input (window
+        closes and resizes, mouse wheel), along with the delta time of every
+        frame (and the time waited while idle before it), into a compact
+        binary log that replay() plays back. Start
+        recording before the app is set up (before run() or the first
+        step()), so the replay starts from the same state.
+
+        path: The path of the log file to write
+        """
+
+        self.stop_recording()
+        self.recorder = InputRecorder(path)
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        """Stops recording input and finishes the log, if input is being recorded"""
+
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def replay(
+        self, log: InputLog | str, *args, delta: float | None = None
+    ) -> list[float]:
+        """Plays back input recorded with start_recording() instead of
+        polling it: every recorded frame fires its recorded events (routed
+        to the window with the same index in app.windows) and is then run
+        like step() runs it. Returns how long every frame took, in seconds.
+
+        Meant for headless apps - replaying a log on a fresh instance of the
+        app that recorded it always renders the same frames, so a recorded
+        slow interaction becomes a benchmark that can be profiled (see
+        app.profiler) or a regression test.
+
+        log: The InputLog() or the path of its file
+        delta: If not None, every frame is run with this delta time instead
+            of the recorded one
+        """
+
+        if self.running:
+            raise ComPyGUIError("Can't replay input in an app that is already running")
+
+        if isinstance(log, str):
+            log = InputLog.load(log)
+
+        self._setup_once()
+
+        times: list[float] = []
+        for recorded in log:
+            start: float = time.perf_counter()
+            deadline: float = start + 1 / self.framerate
+
+            self.profiler.next_frame()
+            with self.profiler.span("frame"):
+                with self.profiler.span("events"):
+                    # Frames mustn't depend on how fast images decode
+                    image_cache.poll(wait=True)
+                    for event in recorded.events:
+                        window_id: int = 0
+                        if 0 <= event.window < len(self.windows):
+                            window_id = self.windows[event.window].id
+                        self._fire_input(event.type, window_id, **event.data)
+                # Timers get the time the app was idle for while recording
+                self._idle_time = recorded.idle
+                self._frame(recorded.delta if delta is None else delta)
+
+            times.append(time.perf_counter() - start)
+            self._after_frame(deadline)
+
+        return times
 
     def quit(self) -> None:
-        """Cleans up and closes the app"""
+        """Cleans up and closes the app. Every window (and everything in
+        them) is destroyed right away - nothing is left to the garbage collector
+        """
         if self.destroyed:
             return
 
-        win_idx: int = 0
-        for window in self.windows:
+        self.stop_recording()
+        self.timers.clear()
+
+        # Destroyed windows remove themselves from self.windows
+        # (see on_window_destroy())
+        for window in list(self.windows):
             window.destroy()
-            del self.windows[win_idx]
-            win_idx += 1
+        self.destroyed = True
+
+        if self._render_executor is not None:
+            self._render_executor.shutdown()
+
+        if self.gc_policy is not None:
+            self.gc_policy.uninstall()
 
         SDL_Quit()
 
@@ -22,6 +22,12 @@ class Rect2:
         self.w: float = w
         self.h: float = h
 
+    def __eq__(self, w: object) -> bool:
+        if not isinstance(w, Rect2) and not isinstance(w, IRect2):
+            return NotImplemented
+
+        return (self.x, self.y, self.w, self.h) == (w.x, w.y, w.w, w.h)
+
     @staticmethod
     def from_vectors(topleft: Vector2 | IVector2, size: Vector2 | IVector2) -> Rect2:
         """Creates a Rect2() from two Vector2()s/IVector2()s
@@ -92,6 +98,12 @@ class IRect2:
         self.w: int = w
         self.h: int = h
 
+    def __eq__(self, w: object) -> bool:
+        if not isinstance(w, Rect2) and not isinstance(w, IRect2):
+            return NotImplemented
+
+        return (self.x, self.y, self.w, self.h) == (w.x, w.y, w.w, w.h)
+
     @staticmethod
     def from_vectors(topleft: IVector2, size: IVector2) -> IRect2:
         """Creates an IRect2() from two IVector2()s
@@ -127,6 +139,29 @@ class IRect2:
         """Returns an IRect2() generated by rounding this Rect2()"""
         return Rect2(self.x, self.y, self.w, self.h)
 
+    def offset(self, by: IVector2) -> IRect2:
+        """Returns a copy of this IRect2() moved by an IVector2()"""
+        return IRect2(self.x + by.x, self.y + by.y, self.w, self.h)
+
+    def intersection(self, other: IRect2) -> IRect2 | None:
+        """Returns the overlapping part of two IRect2()s, or None if they don't overlap"""
+        x0: int = max(self.x, other.x)
+        y0: int = max(self.y, other.y)
+        x1: int = min(self.x + self.w, other.x + other.w)
+        y1: int = min(self.y + self.h, other.y + other.h)
+
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return IRect2(x0, y0, x1 - x0, y1 - y0)
+
+    def union(self, other: IRect2) -> IRect2:
+        """Returns the smallest IRect2() that contains both IRect2()s"""
+        x0: int = min(self.x, other.x)
+        y0: int = min(self.y, other.y)
+        x1: int = max(self.x + self.w, other.x + other.w)
+        y1: int = max(self.y + self.h, other.y + other.h)
+        return IRect2(x0, y0, x1 - x0, y1 - y0)
+
     def as_sdl_rect(self) -> SDL_Rect:
         """Returns an SDL_Rect structure with the values of this IRect2()"""
         return SDL_Rect(x=self.x, y=self.y, w=self.w, h=self.h)
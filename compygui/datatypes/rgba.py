@@ -11,6 +11,12 @@ class RGBAMask:
         self.b: int = b
         self.a: int = a
 
+    def __eq__(self, w: object) -> bool:
+        if not isinstance(w, RGBAMask):
+            return NotImplemented
+
+        return (self.r, self.g, self.b, self.a) == (w.r, w.g, w.b, w.a)
+
     @staticmethod
     def RGBA() -> RGBAMask:
         """Equivalent to RGBAMask(r=0xFF000000, g=0x00FF0000, b=0x0000FF00, a=0x000000FF)"""
@@ -47,6 +53,12 @@ class RGBAColor:
         self.b: int = b
         self.a: int = a
 
+    def __eq__(self, w: object) -> bool:
+        if not isinstance(w, RGBAColor):
+            return NotImplemented
+
+        return (self.r, self.g, self.b, self.a) == (w.r, w.g, w.b, w.a)
+
     @staticmethod
     def WHITE() -> RGBAColor:
         """Equivalent to RGBAColor(r=255, g=255, b=255, a=255)"""
@@ -16,6 +16,12 @@ class IVector2:
         self.x: int = x
         self.y: int = y
 
+    def __eq__(self, w: Any) -> bool:
+        if not isinstance(w, Vector2) and not isinstance(w, IVector2):
+            return NotImplemented
+
+        return self.x == w.x and self.y == w.y
+
     def __add__(self, w: Any) -> IVector2:
         if not isinstance(w, Vector2) and not isinstance(w, IVector2):
             raise ValueError(
@@ -105,6 +111,12 @@ class Vector2:
         self.x: float = x
         self.y: float = y
 
+    def __eq__(self, w: Any) -> bool:
+        if not isinstance(w, Vector2) and not isinstance(w, IVector2):
+            return NotImplemented
+
+        return self.x == w.x and self.y == w.y
+
     def __add__(self, w: Any) -> Vector2:
         if not isinstance(w, Vector2) and not isinstance(w, IVector2):
             raise ValueError(
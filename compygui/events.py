@@ -9,10 +9,11 @@ https://github.com/FluffyKn1ght/compygui
 
 import uuid
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 from compygui.component import Component
 from compygui.errors import ComPyGUIError
+from compygui.profiler import FrameProfiler
 
 
 class EventType:
@@ -24,13 +25,17 @@ class EventType:
     UNKNOWN: str = "?"
 
     G_RENDER: str = "render"
+    G_MOUSE_WHEEL: str = "mouse_wheel"
 
     APP_RENDER: str = "app.render"
     APP_WINDOW_CLOSE: str = "app.window_close"
+    APP_WINDOW_RESIZE: str = "app.window_resize"
+    APP_MOUSE_WHEEL: str = "app.mouse_wheel"
 
     WINDOW_DESTROY: str = "window.destroy"
 
     GUI_CREATED: str = "gui.created"
+    GUI_BATCH_CREATED: str = "gui.batch_created"
     GUI_DESTROY: str = "gui.destroy"
     GUI_SIZE_CHANGED: str = "gui.size_changed"
 
@@ -58,6 +63,7 @@ class Event:
     type: The type of the event
     event_expires_in: How many EventQueue() ticks does this event last
     event_origin: The origin of the event
+    event_key: The routing key of the event (see EventQueue().fire()), if any
     **evdata: Event data, stored in the Event().data property as a dict[str, Any]
     """
 
@@ -67,12 +73,14 @@ class Event:
         *args,
         event_expires_in: int = 1,
         event_origin: Component | EventOrigin,
+        event_key: Any = None,
         **evdata,
     ) -> None:
         self.type: str = type
         self.data: dict[str, Any] = evdata
         self.expires_in: int = event_expires_in
         self.origin: Component | EventOrigin = event_origin
+        self.key: Any = event_key
 
         self.age: int = 0
 
@@ -88,9 +96,11 @@ class EventListener:
     callback: The function that will be called with an Event() once that Event() is fired
     type: The type of Event()s that this EventListener() listens to
     condition: An optional function that accepts an Event() and returns whether that event should be processed by the main callback
+    key: The routing key this EventListener() is subscribed with (None to get every Event() of its type)
     oneshot: If True, then the EventListener() will self-destruct after one event
     disconnect: Which function to call then disconnecting this EventListener()
     instance: The class instance this EventListener() is linked to
+    queue: The EventQueue() this EventListener() is connected to, if any
     """
 
     def __init__(
@@ -99,16 +109,20 @@ class EventListener:
         callback: Callable[[Event]],
         type: str,
         condition: Callable[[Event], bool] | None = None,
+        key: Any = None,
         oneshot: bool,
         disconnect: Callable[[EventListener]],
         instance: Any,
+        queue: EventQueue | None = None,
     ) -> None:
         self.callback: Callable[[Event]] = callback
         self.type: str = type
         self.condition: Callable[[Event], bool] | None = condition
+        self.key: Any = key
         self.oneshot: bool = oneshot
         self._disconnect: Callable[[EventListener]] = disconnect
         self.instance: Any = instance
+        self.queue: EventQueue | None = queue
 
         self.uuid: uuid.UUID = uuid.uuid4()
         self.valid: bool = True
@@ -127,11 +141,52 @@ class EventListener:
 
 
 class EventQueue:
-    """An event queue that handles listener connection/disconnection"""
+    """An event queue that handles listener connection/disconnection
+
+    Listeners can subscribe with a routing key (a window ID, a component,
+    ...), and events can be fired with one: a keyed event is looked up by
+    its (type, key) and only goes to the listeners subscribed with that key,
+    plus the ones of its type that have no key - without going through, or
+    calling the conditions of, any other listener. Events fired without a
+    key are broadcast to every listener of their type, keyed or not.
+
+    profiler: The FrameProfiler() that times listener callbacks, if any
+    max_events: How many events can be queued at once (None for no limit)
+    max_listeners: How many listeners can be connected at once (None for no limit)
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        *args,
+        profiler: FrameProfiler | None = None,
+        max_events: int | None = 1024,
+        max_listeners: int | None = 1024,
+    ):
         self.events: list[Event] = []
         self._listeners: list[EventListener] = []
+        # How many listeners there are for each event type, so events that
+        # nothing listens to don't have to go through all listeners
+        self._type_counts: dict[str, int] = {}
+        # The listeners for each (type, key), in the order they were connected
+        # - (type, None) holds the ones without a key
+        self._routes: dict[tuple[str, Any], list[EventListener]] = {}
+        # Listeners disconnected one at a time stay in _listeners and their
+        # routes (fire() skips them) until enough pile up to compact them
+        # all in one pass - see disconnect()
+        self._dead: set[EventListener] = set()
+        self.profiler: FrameProfiler | None = profiler
+        self.time: float = 0.0
+        """How far the owner of the queue has advanced it, in seconds -
+        Viewport() advances its VCT's queue by every frame's delta, which
+        throttled subtrees (see GUIComponent().max_update_hz) go by"""
+
+        self.max_events: int | None = max_events
+        self.max_listeners: int | None = max_listeners
+
+    @property
+    def listener_count(self) -> int:
+        """How many EventListener()s are connected to this EventQueue()"""
+        return len(self._listeners) - len(self._dead)
 
     def connect(
         self,
@@ -140,6 +195,7 @@ class EventQueue:
         for_event: str,
         *args,
         condition: Callable[[Event], bool] | None = None,
+        key: Any = None,
         oneshot: bool = False,
     ) -> EventListener:
         """Creates and connects an EventListener() to this EventQueue()
@@ -149,6 +205,8 @@ class EventQueue:
         for_event: The type of Event()s that this EventListener() will listen to
         condition: An optional function that accepts an Event() and returns whether that event
             should be processed by the main callback
+        key: If not None, the EventListener() only gets events fired with
+            this key (and broadcast ones) - see fire()
         oneshot: If True, then the EventListener() will self-destruct after one event
         """
 
@@ -156,51 +214,139 @@ class EventQueue:
             callback=callback,
             type=for_event,
             condition=condition,
+            key=key,
             oneshot=oneshot,
             disconnect=self.disconnect,
             instance=instance,
+            queue=self,
         )
         self._listeners.append(listener)
+        self._type_counts[for_event] = self._type_counts.get(for_event, 0) + 1
+        self._routes.setdefault((for_event, key), []).append(listener)
         return listener
 
+    def connect_many(
+        self, connections: Iterable[tuple[Any, Callable[[Event]], str]]
+    ) -> list[EventListener]:
+        """Creates and connects a batch of EventListener()s at once
+
+        connections: (instance, callback, for_event) for every EventListener()
+            (see connect())
+        """
+
+        listeners: list[EventListener] = [
+            EventListener(
+                callback=callback,
+                type=for_event,
+                oneshot=False,
+                disconnect=self.disconnect,
+                instance=instance,
+                queue=self,
+            )
+            for instance, callback, for_event in connections
+        ]
+
+        self._listeners = self._listeners + listeners
+        for listener in listeners:
+            self._type_counts[listener.type] = (
+                self._type_counts.get(listener.type, 0) + 1
+            )
+            self._routes.setdefault((listener.type, None), []).append(listener)
+        return listeners
+
+    def _unroute(self, listeners: Iterable[EventListener]) -> None:
+        """Removes disconnected listeners from their routes"""
+
+        doomed: dict[tuple[str, Any], set[EventListener]] = {}
+        for listener in listeners:
+            doomed.setdefault((listener.type, listener.key), set()).add(listener)
+
+        for route, gone in doomed.items():
+            kept: list[EventListener] = [
+                listener for listener in self._routes[route] if listener not in gone
+            ]
+            if kept:
+                self._routes[route] = kept
+            else:
+                del self._routes[route]
+
     def fire(
-        self, evtype: str, *args, event_origin: Component | EventOrigin, **evdata
-    ) -> None:
+        self,
+        evtype: str,
+        *args,
+        event_origin: Component | EventOrigin,
+        event_key: Any = None,
+        **evdata,
+    ) -> Event:
         """Creates an "fires" an event, triggering the appropriate listeners and
-        adding it to the event queue.
+        adding it to the event queue. Returns the Event(), so listeners can
+        pass results back through its data.
 
         evtype: The type of the event to fire
         event_origin: The origin of the event
+        event_key: If not None, the event only goes to the listeners subscribed
+            with this key (in the order they were connected), and then to the
+            listeners of its type that have no key. If None, it's broadcast
+            to every listener of its type
         **evdata: Any other kwargs that will get interpreted as event data (arguments)
         """
 
-        if len(self.events) >= 1024:
-            raise OverflowError("Event queue size limit reached (1024 events)")
+        if self.max_events is not None and len(self.events) >= self.max_events:
+            raise OverflowError(
+                f"Event queue size limit reached ({self.max_events} events)"
+            )
 
-        if len(self._listeners) >= 1024:
+        if self.max_listeners is not None and self.listener_count >= self.max_listeners:
             raise OverflowError(
-                "Event listener array size limit reached (1024 event listeners)"
+                f"Event listener array size limit reached ({self.max_listeners} event listeners)"
             )
 
-        event: Event = Event(evtype, *args, **evdata, event_origin=event_origin)
+        event: Event = Event(
+            evtype, *args, **evdata, event_origin=event_origin, event_key=event_key
+        )
         self.events.append(event)
 
-        for listener in self._listeners:
+        if not self._type_counts.get(event.type):
+            return event
+
+        profiler: FrameProfiler | None = self.profiler
+        if profiler is not None and not (profiler.enabled and profiler.trace_listeners):
+            profiler = None
+
+        targets: Iterable[EventListener] = self._listeners
+        if event_key is not None:
+            targets = self._routes.get((evtype, event_key), []) + self._routes.get(
+                (evtype, None), []
+            )
+
+        for listener in targets:
             if listener.type == event.type:
+                if not listener.valid:
+                    if listener not in self._dead and listener in self._listeners:
+                        raise ComPyGUIError(
+                            f"[ComPyGUI BUG] Invalid (disconnected) listener in EventQueue()._listeners at index {self._listeners.index(listener)}"
+                        )
+                    # Disconnected, but not compacted yet (or disconnected by
+                    # an earlier callback of this fire())
+                    continue
+
                 if listener.condition:
                     if not listener.condition(event):
                         continue
 
-                if not listener.valid:
-                    raise ComPyGUIError(
-                        f"[ComPyGUI BUG] Invalid (disconnected) listener in EventQueue()._listeners at index {self._listeners.index(listener)}"
-                    )
-
-                listener.callback(event)
+                if profiler is not None:
+                    with profiler.listener_span(
+                        f"{event.type} -> {listener.callback.__qualname__}"
+                    ):
+                        listener.callback(event)
+                else:
+                    listener.callback(event)
 
                 if listener.oneshot:
                     listener.disconnect()
 
+        return event
+
     def disconnect(self, listener_or_uuid: EventListener | uuid.UUID) -> None:
         """Disconnects an EventListener() from this EventQueue()"""
 
@@ -209,16 +355,62 @@ class EventQueue:
             listener = listener_or_uuid
         elif isinstance(listener_or_uuid, uuid.UUID):
             for lis in self._listeners:
-                if lis.uuid == listener_or_uuid:
+                if lis.uuid == listener_or_uuid and lis not in self._dead:
                     listener = lis
 
         if listener is None:
             raise ValueError(f"Unable to find listener from UUID {listener_or_uuid}")
 
-        if not listener.valid and not listener in self._listeners:
+        if listener.queue is not self:
+            raise ValueError(f"Listener {listener} is not connected to this queue")
+
+        if not listener.valid or listener in self._dead:
             raise ValueError(f"Listener {listener} has already been disconnected")
 
-        self._listeners.remove(listener)
+        # Only marked as dead here, so disconnecting doesn't cost a pass over
+        # all listeners. Once the dead ones make up half of _listeners, they're
+        # all removed at once, which keeps fire() from wading through them
+        listener.valid = False
+        self._type_counts[listener.type] -= 1
+        self._dead.add(listener)
+        if len(self._dead) * 2 >= len(self._listeners):
+            self._compact()
+
+    def _compact(self, doomed: Iterable[EventListener] = ()) -> None:
+        """Removes the dead listeners (and doomed) from _listeners and their
+        routes in a single pass"""
+
+        gone: set[EventListener] = self._dead.union(doomed)
+        # Not removed in-place, since fire() might be iterating over the list
+        self._listeners = [
+            listener for listener in self._listeners if listener not in gone
+        ]
+        self._dead = set()
+        self._unroute(gone)
+
+    def disconnect_many(self, listeners: Iterable[EventListener]) -> None:
+        """Disconnects a batch of EventListener()s from this EventQueue() at once,
+        in a single pass over the connected listeners
+
+        listeners: The EventListener()s to disconnect
+        """
+
+        doomed: set[EventListener] = set(listeners)
+        if not doomed:
+            return
+
+        for listener in doomed:
+            if listener.queue is not self or not listener.valid:
+                raise ValueError(
+                    "Some of the listeners aren't connected to this queue"
+                )
+
+        for listener in doomed:
+            listener.valid = False
+            self._type_counts[listener.type] -= 1
+
+        # Takes the listeners disconnected one at a time along with them
+        self._compact(doomed)
 
     def tick(self) -> None:
         """Updates the ages of all events in the queue and clears out the expired oness"""
@@ -226,5 +418,4 @@ class EventQueue:
         for event in self.events:
             event.age += 1
 
-            if event.age >= event.expires_in:
-                self.events.remove(event)
+        self.events = [event for event in self.events if event.age < event.expires_in]
@@ -0,0 +1,531 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import ctypes
+import os
+import threading
+from collections import OrderedDict
+
+from sdl2.blendmode import SDL_BLENDMODE_NONE
+from sdl2.pixels import SDL_Color
+from sdl2.rect import SDL_Rect
+from sdl2.sdlttf import (
+    TTF_CloseFont,
+    TTF_FontAscent,
+    TTF_FontHeight,
+    TTF_FontLineSkip,
+    TTF_GetFontKerningSizeGlyphs32,
+    TTF_GlyphMetrics32,
+    TTF_Init,
+    TTF_OpenFontIndex,
+    TTF_RenderGlyph32_Blended,
+    TTF_WasInit,
+)
+from sdl2.surface import (
+    SDL_FreeSurface,
+    SDL_LowerBlit,
+    SDL_SetSurfaceBlendMode,
+    SDL_Surface,
+)
+
+from compygui.compositor import BlendMode, composite_batch, surface_array
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+from compygui.errors import ComPyGUIError, SDLError, SDLErrorDetector
+from compygui.memory import create_surface, free_surface, tracker
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Glyph:
+    """The metrics of one character of a Font(), and where its bitmap is
+    in the font's GlyphAtlas() (if it's in there right now)
+
+    advance: How far the pen moves after drawing the glyph
+    offset: The top-left corner of the bitmap, relative to the pen position
+        on the top of the line
+    size: The size of the bitmap (zero for glyphs without ink, like spaces)
+    page: The atlas page the bitmap is on, or None if it isn't rasterized
+        (or got evicted)
+    position: The top-left corner of the bitmap on its page
+    blank: Whether the glyph was rasterized and turned out to have no ink
+    """
+
+    __slots__ = ("char", "advance", "offset", "size", "page", "position", "blank")
+
+    def __init__(self, char: str, advance: int) -> None:
+        self.char: str = char
+        self.advance: int = advance
+        self.offset: IVector2 = IVector2.ZERO()
+        self.size: IVector2 = IVector2.ZERO()
+        self.page: AtlasPage | None = None
+        self.position: IVector2 = IVector2.ZERO()
+        self.blank: bool = False
+
+
+class AtlasPage:
+    """One surface of a GlyphAtlas(), filled with glyphs shelf by shelf"""
+
+    __slots__ = ("surface", "size", "glyphs", "stamp", "_shelves", "_bottom")
+
+    def __init__(self, owner: GlyphAtlas, size: IVector2) -> None:
+        self.surface: SDL_Surface = create_surface(owner, size)
+        self.size: IVector2 = size
+        self.glyphs: list[Glyph] = []
+        self.stamp: int = 0
+
+        # [y, height, x of the free space] of every shelf
+        self._shelves: list[list[int]] = []
+        self._bottom: int = 0
+
+    @property
+    def bytes(self) -> int:
+        return self.surface.contents.pitch * self.surface.contents.h
+
+    def place(self, size: IVector2) -> IVector2 | None:
+        """Finds room for a bitmap, or returns None if the page is full"""
+
+        for shelf in self._shelves:
+            # Shelves fit glyphs of up to their height, wasting at most a quarter
+            if size.y <= shelf[1] and size.y * 4 >= shelf[1] * 3:
+                if shelf[2] + size.x <= self.size.x:
+                    position: IVector2 = IVector2(shelf[2], shelf[0])
+                    shelf[2] += size.x + 1
+                    return position
+
+        if self._bottom + size.y > self.size.y or size.x > self.size.x:
+            return None
+
+        self._shelves.append([self._bottom, size.y, size.x + 1])
+        position = IVector2(0, self._bottom)
+        self._bottom += size.y + 1
+        return position
+
+
+class GlyphAtlas:
+    """The rasterized glyphs of one Font(), packed onto a few shared
+    surfaces (pages), so text gets drawn as a batch of blits from a page
+    instead of being rendered again.
+
+    When the pages would take up more than budget bytes, the least recently
+    used page is freed (its glyphs get rasterized again when they're needed).
+    The atlas is also registered to the memory tracker as an evictor.
+
+    Windows can be rasterized on different threads at the same time (see
+    ComPyGUIApp()'s window_render_workers), so the atlas and the caches of
+    its Font() are guarded by the atlas' lock.
+
+    page_size: The size of one page (glyphs that don't fit get a page of their own)
+    budget: How many bytes the pages may take up
+    """
+
+    def __init__(
+        self, *args, page_size: IVector2 = IVector2(256, 256), budget: int = 2 << 20
+    ) -> None:
+        self.page_size: IVector2 = page_size
+        self.budget: int = budget
+        self.pages: list[AtlasPage] = []
+
+        self.rasterized: int = 0
+        """How many glyphs have been rasterized into the atlas so far"""
+        self.evicted: int = 0
+        """How many pages have been evicted so far"""
+
+        # Ticks with every Font().draw(). Pages used by the current draw
+        # are never evicted
+        self.clock: int = 0
+
+        self.lock: threading.RLock = threading.RLock()
+        """Held while the atlas (or its Font()) is used"""
+
+        tracker.add_evictor(self.evict)
+
+    @property
+    def bytes(self) -> int:
+        """How many bytes the pages take up"""
+        return sum(page.bytes for page in self.pages)
+
+    def add(self, glyph: Glyph, bitmap: SDL_Surface, area: IRect2) -> None:
+        """Copies (an area of) a rendered glyph onto a page
+
+        glyph: The Glyph() whose bitmap it is
+        bitmap: The rendered glyph
+        area: The part of bitmap to keep
+        """
+
+        page, position = self._allocate(area.size())
+        with SDLErrorDetector(error_info="Failed to add glyph to atlas"):
+            SDL_SetSurfaceBlendMode(bitmap, SDL_BLENDMODE_NONE)
+            SDL_LowerBlit(
+                bitmap,
+                area.as_sdl_rect(),
+                page.surface,
+                SDL_Rect(x=position.x, y=position.y, w=area.w, h=area.h),
+            )
+
+        glyph.page = page
+        glyph.position = position
+        page.glyphs.append(glyph)
+        page.stamp = self.clock
+        self.rasterized += 1
+
+    def _allocate(self, size: IVector2) -> tuple[AtlasPage, IVector2]:
+        # Newest pages first - older ones are usually full
+        for page in reversed(self.pages):
+            position: IVector2 | None = page.place(size)
+            if position is not None:
+                return page, position
+
+        page_size: IVector2 = IVector2(
+            max(self.page_size.x, size.x), max(self.page_size.y, size.y)
+        )
+        needed: int = page_size.x * page_size.y * 4
+        over: int = self.bytes + needed - self.budget
+        if over > 0:
+            self._evict(over, self.clock)
+
+        page: AtlasPage = AtlasPage(self, page_size)
+        self.pages.append(page)
+        return page, page.place(size)  # type: ignore
+
+    def _free_page(self, page: AtlasPage) -> int:
+        for glyph in page.glyphs:
+            glyph.page = None
+        freed: int = page.bytes
+        free_surface(page.surface)
+        self.pages.remove(page)
+        self.evicted += 1
+        return freed
+
+    def _evict(self, wanted: int, keep: int | None) -> int:
+        freed: int = 0
+        for page in sorted(self.pages, key=lambda page: page.stamp):
+            if freed >= wanted or page.stamp == keep:
+                break
+            freed += self._free_page(page)
+        return freed
+
+    def evict(self, wanted: int) -> int:
+        """Frees least recently used pages until at least wanted bytes are
+        freed. Returns how many bytes were freed. Registered to the memory
+        tracker as an evictor.
+
+        wanted: How many bytes to free
+        """
+
+        with self.lock:
+            return self._evict(wanted, None)
+
+    def clear(self) -> None:
+        """Frees every page"""
+        with self.lock:
+            for page in list(self.pages):
+                self._free_page(page)
+
+    def destroy(self) -> None:
+        """Frees every page and unregisters the atlas from the memory tracker"""
+        self.clear()
+        tracker.remove_evictor(self.evict)
+
+
+def _ink_area(bitmap: SDL_Surface) -> IRect2:
+    """Returns the part of a rendered glyph that isn't fully transparent"""
+
+    surf = bitmap.contents
+    if numpy is None:
+        return IRect2(0, 0, surf.w, surf.h)
+
+    # TTF_RenderGlyph32_Blended() renders ARGB8888 - alpha is the high byte
+    pixels = surface_array(bitmap).view(numpy.uint32)[:, : surf.w, 0]
+    ink = pixels >> 24 != 0
+    rows = numpy.flatnonzero(ink.any(axis=1))
+    if not len(rows):
+        return IRect2(0, 0, 0, 0)
+    columns = numpy.flatnonzero(ink.any(axis=0))
+    return IRect2(
+        int(columns[0]),
+        int(rows[0]),
+        int(columns[-1] - columns[0] + 1),
+        int(rows[-1] - rows[0] + 1),
+    )
+
+
+class Font:
+    """A TrueType font at one size, rendered with SDL2_ttf. Every glyph is
+    rasterized once into the font's GlyphAtlas() and drawn from there, and
+    the layout of every string that gets measured or drawn (its glyphs and
+    their positions, including kerning) is cached, so drawing and measuring
+    text that was seen before doesn't touch SDL2_ttf at all.
+
+    Use load_font() to share Font()s (and their atlases) between components
+    - they can be used from several threads at once (see GlyphAtlas()).
+
+    Text is laid out glyph by glyph (with pair kerning) - there's no
+    complex shaping (ligatures, right-to-left text, ...).
+
+    path: The path of the font file
+    size: The size in points
+    index: Which face of the font file to use
+    atlas_budget: How many bytes the glyph atlas may take up
+    run_cache_size: How many laid out strings are cached
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        *args,
+        index: int = 0,
+        atlas_budget: int = 2 << 20,
+        run_cache_size: int = 4096,
+    ) -> None:
+        if not TTF_WasInit() and TTF_Init() != 0:
+            raise SDLError.from_sdl_geterror("Failed to initialize SDL2_ttf")
+
+        self._font = TTF_OpenFontIndex(path.encode("utf-8"), size, index)
+        if not self._font:
+            raise SDLError.from_sdl_geterror(f"Failed to open font {path!r}")
+
+        self.path: str = path
+        self.size: int = size
+        self.index: int = index
+        self.closed: bool = False
+
+        self.height: int = TTF_FontHeight(self._font)
+        self.ascent: int = TTF_FontAscent(self._font)
+        self.line_skip: int = TTF_FontLineSkip(self._font)
+
+        self.atlas: GlyphAtlas = GlyphAtlas(budget=atlas_budget)
+        self.run_cache_size: int = run_cache_size
+
+        self._glyphs: dict[str, Glyph] = {}
+        # text -> (width, [(glyph, x), ...])
+        self._runs: OrderedDict[str, tuple[int, list[tuple[Glyph, int]]]] = (
+            OrderedDict()
+        )
+
+    def __repr__(self) -> str:
+        return f"<Font {os.path.basename(self.path)} {self.size}pt>"
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ComPyGUIError(f"{self!r} has been closed")
+
+    def glyph(self, char: str) -> Glyph:
+        """Returns the Glyph() of a character (without rasterizing it)
+
+        char: The character
+        """
+
+        with self.atlas.lock:
+            glyph: Glyph | None = self._glyphs.get(char)
+            if glyph is not None:
+                return glyph
+
+            self._check_open()
+            return self._load_glyph(char)
+
+    def _load_glyph(self, char: str) -> Glyph:
+        minx, maxx, miny, maxy, advance = (ctypes.c_int() for _ in range(5))
+        if (
+            TTF_GlyphMetrics32(
+                self._font,
+                ord(char),
+                ctypes.byref(minx),
+                ctypes.byref(maxx),
+                ctypes.byref(miny),
+                ctypes.byref(maxy),
+                ctypes.byref(advance),
+            )
+            != 0
+        ):
+            # Not in the font - SDL2_ttf draws its "missing glyph" box
+            advance.value = 0
+
+        glyph = Glyph(char, advance.value)
+        self._glyphs[char] = glyph
+        return glyph
+
+    def _rasterize(self, glyph: Glyph) -> None:
+        with SDLErrorDetector(error_info=f"Failed to render glyph {glyph.char!r}"):
+            bitmap: SDL_Surface = TTF_RenderGlyph32_Blended(
+                self._font, ord(glyph.char), SDL_Color(255, 255, 255, 255)
+            )
+
+        try:
+            area: IRect2 = _ink_area(bitmap)
+            glyph.offset = IVector2(area.x, area.y)
+            glyph.size = IVector2(area.w, area.h)
+            if area.w and area.h:
+                self.atlas.add(glyph, bitmap, area)
+            else:
+                glyph.blank = True
+        finally:
+            SDL_FreeSurface(bitmap)
+
+    def layout(self, text: str) -> tuple[int, list[tuple[Glyph, int]]]:
+        """Returns the width of a line of text, and every Glyph() in it with
+        its x position. Cached.
+
+        text: The text (without line breaks)
+        """
+
+        with self.atlas.lock:
+            run: tuple[int, list[tuple[Glyph, int]]] | None = self._runs.get(text)
+            if run is not None:
+                self._runs.move_to_end(text)
+                return run
+
+            self._check_open()
+            return self._layout(text)
+
+    def _layout(self, text: str) -> tuple[int, list[tuple[Glyph, int]]]:
+        glyphs: list[tuple[Glyph, int]] = []
+        x: int = 0
+        previous: int = 0
+        for char in text:
+            codepoint: int = ord(char)
+            if previous:
+                x += TTF_GetFontKerningSizeGlyphs32(self._font, previous, codepoint)
+            glyph: Glyph = self.glyph(char)
+            glyphs.append((glyph, x))
+            x += glyph.advance
+            previous = codepoint
+
+        run: tuple[int, list[tuple[Glyph, int]]] = (x, glyphs)
+        self._runs[text] = run
+        if len(self._runs) > self.run_cache_size:
+            self._runs.popitem(last=False)
+        return run
+
+    def measure(self, text: str) -> IVector2:
+        """Returns the size of (possibly multi-line) text
+
+        text: The text
+        """
+
+        lines: list[str] = text.split("\n")
+        return IVector2(
+            max(self.layout(line)[0] for line in lines),
+            self.line_skip * (len(lines) - 1) + self.height,
+        )
+
+    def draw(
+        self,
+        dst: SDL_Surface,
+        text: str,
+        position: IVector2,
+        *args,
+        color: RGBAColor,
+        opacity: float = 1.0,
+        mode: BlendMode = BlendMode.NORMAL,
+    ) -> None:
+        """Draws a line of text onto a surface, from the glyph atlas. Glyphs
+        that aren't in the atlas yet get rasterized first.
+
+        dst: The surface to draw onto
+        text: The text (without line breaks)
+        position: The top-left corner of the line
+        color: The color of the text
+        opacity: How opaque the text is, from 0 to 1
+        mode: The blend mode to use
+        """
+
+        # Held until the glyphs are drawn, so their pages can't get evicted
+        # (or moved around) by another thread in the meantime
+        with self.atlas.lock:
+            self._draw(dst, text, position, color, opacity, mode)
+
+    def _draw(
+        self,
+        dst: SDL_Surface,
+        text: str,
+        position: IVector2,
+        color: RGBAColor,
+        opacity: float,
+        mode: BlendMode,
+    ) -> None:
+        self.atlas.clock += 1
+        clock: int = self.atlas.clock
+
+        pieces: dict[int, tuple[AtlasPage, list[tuple[IRect2, IVector2]]]] = {}
+        for glyph, x in self.layout(text)[1]:
+            page: AtlasPage | None = glyph.page
+            if page is None:
+                if glyph.blank:
+                    continue
+                self._rasterize(glyph)
+                page = glyph.page
+                if page is None:
+                    continue
+
+            page.stamp = clock
+            batch = pieces.get(id(page))
+            if batch is None:
+                batch = pieces[id(page)] = (page, [])
+            batch[1].append(
+                (
+                    IRect2(
+                        position.x + x + glyph.offset.x,
+                        position.y + glyph.offset.y,
+                        glyph.size.x,
+                        glyph.size.y,
+                    ),
+                    glyph.position,
+                )
+            )
+
+        for page, batch_pieces in pieces.values():
+            composite_batch(
+                page.surface, dst, batch_pieces, mode, tint=color, opacity=opacity
+            )
+
+    def close(self) -> None:
+        """Frees the glyph atlas and closes the font"""
+
+        with self.atlas.lock:
+            if self.closed:
+                return
+
+            self.atlas.destroy()
+            TTF_CloseFont(self._font)
+            self.closed = True
+            self._glyphs.clear()
+            self._runs.clear()
+
+        key: tuple[str, int, int] = (os.path.abspath(self.path), self.size, self.index)
+        with _fonts_lock:
+            if _fonts.get(key) is self:
+                del _fonts[key]
+
+
+_fonts: dict[tuple[str, int, int], Font] = {}
+_fonts_lock: threading.Lock = threading.Lock()
+
+
+def load_font(path: str, size: int, *args, index: int = 0) -> Font:
+    """Returns the shared Font() of a font file at a size, opening it if
+    it isn't open yet. Components using the same font and size share one
+    glyph atlas this way.
+
+    path: The path of the font file
+    size: The size in points
+    index: Which face of the font file to use
+    """
+
+    key: tuple[str, int, int] = (os.path.abspath(path), size, index)
+    with _fonts_lock:
+        font: Font | None = _fonts.get(key)
+        if font is None:
+            font = _fonts[key] = Font(path, size, index=index)
+        return font
@@ -0,0 +1,148 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import gc
+import time
+from typing import Any
+
+from compygui.profiler import FrameProfiler
+
+
+class FrameGCPolicy:
+    """Moves CPython's cyclic garbage collection out of the middle of frames.
+
+    Once installed (ComPyGUIApp() does that after setup() if it's given one),
+    the policy freezes everything allocated so far (the long-lived component
+    tree, windows, ...) so it's never scanned again, and disables automatic
+    collection. After every frame, it runs the oldest due collection that is
+    expected to fit in the time left until the frame's deadline. Every
+    collection - scheduled or not - is reported to the FrameProfiler() as a
+    "gc" span.
+
+    max_pending: How many young objects can pile up before a young collection
+        is run even if there's no time left in the frame (so memory stays bounded).
+        Older generations are collected anyway once they're 4 times overdue
+    min_slack: Collections are never started with less time than this left (seconds)
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_pending: int = 50_000,
+        min_slack: float = 0.0005,
+    ) -> None:
+        self.max_pending: int = max_pending
+        self.min_slack: float = min_slack
+
+        self.installed: bool = False
+        self.profiler: FrameProfiler | None = None
+
+        # Expected pause (seconds) of a collection of every generation,
+        # updated with every collection
+        self.estimates: list[float] = [0.0005, 0.002, 0.02]
+        self.collections: list[int] = [0, 0, 0]
+        self.forced: int = 0
+
+        # How many collections of the previous generation (or allocations,
+        # for the youngest one) make a collection due
+        self._due: tuple[int, int, int] = (1, 10, 10)
+        self._was_enabled: bool = True
+        self._gc_start: int = 0
+
+    def install(self, profiler: FrameProfiler | None = None) -> None:
+        """Freezes the current object graph and takes over garbage collection
+
+        profiler: The FrameProfiler() to report collections to
+        """
+
+        if self.installed:
+            return
+
+        self.profiler = profiler
+        # Newer CPython versions ignore (and report 0 for) some thresholds
+        thresholds: tuple[int, ...] = gc.get_threshold()
+        self._due = (1, thresholds[1] or 10, thresholds[2] or 10)
+        self._was_enabled = gc.isenabled()
+
+        gc.callbacks.append(self._on_gc)
+        self.freeze()
+        gc.disable()
+
+        self.installed = True
+
+    def uninstall(self) -> None:
+        """Gives garbage collection back to CPython"""
+
+        if not self.installed:
+            return
+
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        gc.unfreeze()
+        if self._was_enabled:
+            gc.enable()
+
+        self.installed = False
+
+    def freeze(self) -> None:
+        """Collects everything once and moves all surviving objects into
+        the permanent generation. Call this again after building a large,
+        long-lived part of the UI.
+        """
+
+        start: float = time.perf_counter()
+        gc.collect()
+        # Full collections only get cheaper once everything is frozen
+        self.estimates[2] = time.perf_counter() - start
+        gc.freeze()
+
+    def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter_ns()
+        elif self.profiler is not None and self.profiler.enabled:
+            self.profiler.record("gc", "gc", self._gc_start, time.perf_counter_ns())
+
+    def _collect(self, generation: int) -> None:
+        start: float = time.perf_counter()
+        gc.collect(generation)
+        pause: float = time.perf_counter() - start
+
+        self.estimates[generation] = 0.75 * self.estimates[generation] + 0.25 * pause
+        self.collections[generation] += 1
+
+    def after_frame(self, deadline: float) -> None:
+        """Runs a garbage collection if one is due and fits before the deadline
+
+        deadline: The time.perf_counter() value by which the next frame
+            should start
+        """
+
+        if not self.installed:
+            return
+
+        counts: tuple[int, int, int] = gc.get_count()
+        slack: float = deadline - time.perf_counter()
+
+        if slack >= self.min_slack:
+            # Oldest generation first, since it collects the younger ones too
+            for generation in (2, 1, 0):
+                due: bool = counts[generation] >= self._due[generation]
+                if due and self.estimates[generation] <= slack:
+                    self._collect(generation)
+                    return
+
+        for generation in (2, 1):
+            if counts[generation] >= 4 * self._due[generation]:
+                self.forced += 1
+                self._collect(generation)
+                return
+
+        if counts[0] >= self.max_pending:
+            self.forced += 1
+            self._collect(0)
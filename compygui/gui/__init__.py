@@ -1 +1,7 @@
 from .colorrect import *
+from .layouts import *
+from .perfhud import *
+from .text import *
+from .image import *
+from .panel import *
+from .virtuallist import *
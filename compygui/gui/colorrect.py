@@ -1,8 +1,10 @@
-from sdl2.surface import SDL_FillRect, SDL_Surface
+from sdl2.surface import SDL_Surface
+from compygui.compositor import DisplayList, fill
 from compygui.datatypes.rect2 import IRect2
 from compygui.datatypes.rgba import RGBAColor
 from compygui.datatypes.vector2 import IVector2, Vector2
 from compygui.guicomponent import GUIComponent
+from compygui.layout import Constraints
 
 
 class GUIColorRectangle(GUIComponent):
@@ -11,26 +13,46 @@ class GUIColorRectangle(GUIComponent):
     ) -> None:
         super().__init__(*children, **kwargs)
 
-        self.size: IVector2
+        self._size: IVector2 = IVector2.ZERO()
         self._relsize: Vector2 | None = None
 
         if isinstance(size, IVector2):
-            self.size = size
+            self._size = size
         elif isinstance(size, Vector2):
             self._relsize = size
 
         self.color: RGBAColor = color
 
-    def setup(self) -> None:
+    @property
+    def size(self) -> IVector2:
+        return self._size
+
+    @size.setter
+    def size(self, to: IVector2 | Vector2) -> None:
+        if isinstance(to, IVector2):
+            self._size = to
+            self._relsize = None
+        else:
+            self._relsize = to
+        self.invalidate_layout()
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        super().measure(constraints)
         if self._relsize:
-            self.size = (self._relsize * self.get_viewport_size()).rounded()
-
-    def calculate(self, delta: int) -> IVector2:
-        return self.size
-
-    def render(self, delta: int, to: SDL_Surface) -> None:
-        SDL_FillRect(
+            # Re-resolved whenever the viewport gets resized
+            self._size = (self._relsize * self.get_viewport_size()).rounded()
+        return self._size
+
+    def render(self, delta: int, to: SDL_Surface | DisplayList) -> None:
+        color: RGBAColor = self.color
+        if self.opacity < 1:
+            color = RGBAColor(
+                r=color.r, g=color.g, b=color.b, a=round(color.a * self.opacity)
+            )
+
+        fill(
             to,
-            IRect2.from_vectors(self.topleft, self.calcd_size).as_sdl_rect(),
-            self.color.as_int(8),
+            IRect2.from_vectors(self.topleft, self.calcd_size),
+            color,
+            self.blend_mode,
         )
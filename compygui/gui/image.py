@@ -0,0 +1,146 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from sdl2.surface import SDL_Surface
+from compygui.compositor import DisplayList, composite, fill
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+from compygui.events import EventListener
+from compygui.guicomponent import GUIComponent
+from compygui.images import ImageCache, ImageHandle, image_cache
+from compygui.layout import Constraints
+
+
+class GUIImage(GUIComponent):
+    """An image file, decoded through SDL2_image into a shared ImageCache()
+    - a thousand GUIImage()s of the same icon share one decoded surface,
+    which they composite straight onto their parent. GUIImage()s don't
+    have a surface of their own, so they don't show children.
+
+    Big images are decoded in the background: until they're ready, the
+    GUIImage() shows a placeholder (with the given size, or no size at all).
+
+    path: The path of the image file
+    size: The size to show the image at (it's scaled once, when it's
+        decoded), or None for its own size
+    placeholder: The color shown while the image is being decoded (or if it
+        couldn't be)
+    background: Whether to decode the image on a worker thread (defaults to
+        whether it's big, see ImageCache())
+    cache: The ImageCache() to load the image through
+    """
+
+    def __init__(
+        self,
+        *children,
+        path: str,
+        size: IVector2 | None = None,
+        placeholder: RGBAColor = RGBAColor(r=128, g=128, b=128, a=64),
+        background: bool | None = None,
+        cache: ImageCache = image_cache,
+        **kwargs,
+    ) -> None:
+        self._size: IVector2 | None = size
+        self._background: bool | None = background
+        self._cache: ImageCache = cache
+        self._handle: ImageHandle | None = None
+        self.placeholder: RGBAColor = placeholder
+
+        super().__init__(*children, **kwargs)
+
+        self._path: str = path
+        self._load()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @path.setter
+    def path(self, to: str) -> None:
+        if to == self._path:
+            return
+        self._path = to
+        self._load()
+
+    @property
+    def size(self) -> IVector2 | None:
+        return self._size
+
+    @size.setter
+    def size(self, to: IVector2 | None) -> None:
+        self._size = to
+        self._load()
+        self.invalidate_layout()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the image is decoded"""
+        return self._handle is not None and self._handle.ready
+
+    def _load(self) -> None:
+        old: ImageHandle | None = self._handle
+        self._handle = self._cache.acquire(
+            self._path, size=self._size, background=self._background
+        )
+        if old is not None:
+            # Released after acquiring, so re-acquiring the same image
+            # doesn't free it in between
+            old.release()
+
+        self._handle.when_done(self._loaded)
+
+    def _loaded(self, handle: ImageHandle) -> None:
+        if handle is not self._handle:
+            return
+        if self._size is None:
+            self.invalidate_layout()
+        self.invalidate()
+
+    def _recreate_surface(self, size: IVector2) -> None:
+        # The image is composited straight from the cache
+        super()._recreate_surface(IVector2.ZERO())
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        super().measure(constraints)
+        if self._size is not None:
+            return self._size
+        if self._handle is not None and self._handle.size is not None:
+            return self._handle.size
+        return IVector2.ZERO()
+
+    def render(self, delta: int, to: SDL_Surface | DisplayList) -> None:
+        if to is self._surface:
+            return
+
+        surface: SDL_Surface | None = (
+            None if self._handle is None else self._handle.surface
+        )
+        if surface is not None:
+            composite(
+                surface, to, self.topleft, self.blend_mode, opacity=self.opacity
+            )
+            return
+
+        size: IVector2 = self._calculated_size
+        if size.x and size.y and self.placeholder.a:
+            color: RGBAColor = self.placeholder
+            if self.opacity < 1:
+                color = RGBAColor(
+                    r=color.r, g=color.g, b=color.b, a=round(color.a * self.opacity)
+                )
+            fill(to, IRect2.from_vectors(self.topleft, size), color, self.blend_mode)
+
+    def _release(
+        self, listeners: list[EventListener], surfaces: list[SDL_Surface]
+    ) -> None:
+        if self._handle is not None:
+            self._handle.release()
+            self._handle = None
+        super()._release(listeners, surfaces)
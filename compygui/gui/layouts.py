@@ -0,0 +1,380 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from compygui.datatypes.vector2 import IVector2, Vector2
+from compygui.guicomponent import GUIComponent
+from compygui.layout import (
+    DEFAULT_LAYOUT_PARAMS,
+    UNBOUNDED,
+    Constraints,
+    Direction,
+    LayoutParams,
+)
+
+
+class GUILayout(GUIComponent):
+    """Base class of the layout containers: GUIComponent()s that size and
+    position their (visible) children themselves, by their layout_params.
+    Children's positions are overwritten on every layout pass.
+
+    size: The size of the container - an IVector2 for a fixed size, a Vector2
+        for a size relative to the viewport, or None to size it by its
+        content (or, for containers that fill space, by its constraints)
+    padding: Space in pixels between the edges of the container and its children
+    """
+
+    def __init__(
+        self,
+        *children,
+        size: IVector2 | Vector2 | None = None,
+        padding: int = 0,
+        **kwargs,
+    ) -> None:
+        super().__init__(*children, **kwargs)
+
+        self._size: IVector2 | Vector2 | None = size
+        self._padding: int = padding
+
+    @property
+    def size(self) -> IVector2 | Vector2 | None:
+        return self._size
+
+    @size.setter
+    def size(self, to: IVector2 | Vector2 | None) -> None:
+        self._size = to
+        self.invalidate_layout()
+
+    @property
+    def padding(self) -> int:
+        return self._padding
+
+    @padding.setter
+    def padding(self, to: int) -> None:
+        self._padding = to
+        self.invalidate_layout()
+
+    def _laid_out(self) -> list[GUIComponent]:
+        return [
+            child
+            for child in self.children
+            if isinstance(child, GUIComponent) and child.visible
+        ]
+
+    def _fixed_size(self, constraints: Constraints, fill: bool) -> IVector2 | None:
+        """Returns the size of the container if it doesn't depend on the
+        content, or None if it does
+
+        fill: Whether a container without a size fills the constraints
+            (on the bounded axes)
+        """
+
+        if isinstance(self._size, IVector2):
+            return constraints.constrain(self._size)
+        if isinstance(self._size, Vector2):
+            return constraints.constrain(
+                (self._size * self.get_viewport_size()).rounded()
+            )
+        if fill and all(constraints.bounded):
+            return constraints.max
+        return None
+
+    def _inner(self, size: IVector2) -> IVector2:
+        return IVector2(
+            max(0, size.x - 2 * self._padding), max(0, size.y - 2 * self._padding)
+        )
+
+    def _place(self, child: GUIComponent, topleft: IVector2) -> None:
+        # Positions are relative to the child's own anchor point
+        position: IVector2 = IVector2(
+            topleft.x + round(child.anchor_point.x * child._layout_size.x),
+            topleft.y + round(child.anchor_point.y * child._layout_size.y),
+        )
+        if position != child.position:
+            child.position = position
+            self.invalidate()
+
+
+class GUIAnchorLayout(GUILayout):
+    """A container that aligns every child to a point of itself, given by
+    the child's LayoutParams().anchor and offset. Without a size, it fills
+    its constraints (or fits its content if they're unbounded).
+    """
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        size: IVector2 | None = self._fixed_size(constraints, fill=True)
+        children: Constraints = (
+            Constraints.unbounded()
+            if size is None
+            else Constraints.loose(self._inner(size))
+        )
+
+        content: IVector2 = IVector2.ZERO()
+        for child in self._laid_out():
+            child_size: IVector2 = child.layout(children)
+            offset: IVector2 = (child.layout_params or DEFAULT_LAYOUT_PARAMS).offset
+            content = IVector2(
+                max(content.x, child_size.x + max(offset.x, 0)),
+                max(content.y, child_size.y + max(offset.y, 0)),
+            )
+
+        if size is None:
+            size = IVector2(
+                content.x + 2 * self._padding, content.y + 2 * self._padding
+            )
+        return size
+
+    def arrange(self, size: IVector2) -> None:
+        inner: IVector2 = self._inner(size)
+        for child in self._laid_out():
+            params: LayoutParams = child.layout_params or DEFAULT_LAYOUT_PARAMS
+            child_size: IVector2 = child._layout_size
+            self._place(
+                child,
+                IVector2(
+                    self._padding
+                    + round((inner.x - child_size.x) * params.anchor.x)
+                    + params.offset.x,
+                    self._padding
+                    + round((inner.y - child_size.y) * params.anchor.y)
+                    + params.offset.y,
+                ),
+            )
+
+
+class GUIStackLayout(GUILayout):
+    """A container that puts its children one after another along an axis.
+    Without a size, it fits its content.
+
+    direction: The main axis the children are stacked along
+    spacing: Space in pixels between two children
+    align: Where children are aligned on the cross axis (0 = start, 1 = end),
+        unless their LayoutParams() say otherwise
+    """
+
+    def __init__(
+        self,
+        *children,
+        direction: Direction = Direction.VERTICAL,
+        spacing: int = 0,
+        align: float = 0.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(*children, **kwargs)
+
+        self._direction: Direction = direction
+        self._spacing: int = spacing
+        self._align: float = align
+
+    @property
+    def direction(self) -> Direction:
+        return self._direction
+
+    @direction.setter
+    def direction(self, to: Direction) -> None:
+        self._direction = to
+        self.invalidate_layout()
+
+    @property
+    def spacing(self) -> int:
+        return self._spacing
+
+    @spacing.setter
+    def spacing(self, to: int) -> None:
+        self._spacing = to
+        self.invalidate_layout()
+
+    @property
+    def align(self) -> float:
+        return self._align
+
+    @align.setter
+    def align(self, to: float) -> None:
+        self._align = to
+        self.invalidate_layout()
+
+    def _axes(self, vector: IVector2) -> tuple[int, int]:
+        """Splits a vector into its (main, cross) axis parts"""
+        if self._direction == Direction.HORIZONTAL:
+            return (vector.x, vector.y)
+        return (vector.y, vector.x)
+
+    def _vector(self, main: int, cross: int) -> IVector2:
+        """The opposite of _axes()"""
+        if self._direction == Direction.HORIZONTAL:
+            return IVector2(main, cross)
+        return IVector2(cross, main)
+
+    def _child_constraints(
+        self, child: GUIComponent, main: tuple[int, int], cross: int | None
+    ) -> Constraints:
+        """main: The (min, max) size on the main axis
+        cross: The inner cross size of the container, if it's known
+        """
+
+        params: LayoutParams = child.layout_params or DEFAULT_LAYOUT_PARAMS
+        cross_min: int = cross if params.stretch and cross is not None else 0
+        cross_max: int = cross if cross is not None else UNBOUNDED
+        return Constraints(
+            min=self._vector(main[0], cross_min), max=self._vector(main[1], cross_max)
+        )
+
+    def _known_cross(self, constraints: Constraints) -> int | None:
+        size: IVector2 | None = self._fixed_size(constraints, fill=False)
+        if size is not None:
+            return self._axes(self._inner(size))[1]
+
+        cross_max: int = self._axes(constraints.max)[1]
+        if cross_max < UNBOUNDED:
+            return max(0, cross_max - 2 * self._padding)
+        return None
+
+    def _fit(
+        self, constraints: Constraints, children: list[GUIComponent], cross: int | None
+    ) -> IVector2:
+        """Returns the size of the container around its laid out children"""
+
+        size: IVector2 | None = self._fixed_size(constraints, fill=False)
+        if size is not None:
+            return size
+
+        main: int = sum(self._axes(child._layout_size)[0] for child in children)
+        main += self._spacing * max(0, len(children) - 1)
+        if cross is None or not any(
+            (child.layout_params or DEFAULT_LAYOUT_PARAMS).stretch for child in children
+        ):
+            cross = max(
+                (self._axes(child._layout_size)[1] for child in children), default=0
+            )
+        return self._vector(main + 2 * self._padding, cross + 2 * self._padding)
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        cross: int | None = self._known_cross(constraints)
+        children: list[GUIComponent] = self._laid_out()
+
+        stretched: list[GUIComponent] = []
+        for child in children:
+            if cross is None and (child.layout_params or DEFAULT_LAYOUT_PARAMS).stretch:
+                # Stretched to the widest of the others, once that's known
+                stretched.append(child)
+            else:
+                child.layout(self._child_constraints(child, (0, UNBOUNDED), cross))
+
+        if stretched:
+            cross = max(
+                (
+                    self._axes(child._layout_size)[1]
+                    for child in children
+                    if child not in stretched
+                ),
+                default=0,
+            )
+            for child in stretched:
+                child.layout(self._child_constraints(child, (0, UNBOUNDED), cross))
+
+        return self._fit(constraints, children, cross)
+
+    def _arrange_from(self, size: IVector2, start: int, gap: int) -> None:
+        inner_cross: int = self._axes(self._inner(size))[1]
+        main: int = self._padding + start
+        for child in self._laid_out():
+            params: LayoutParams = child.layout_params or DEFAULT_LAYOUT_PARAMS
+            child_main, child_cross = self._axes(child._layout_size)
+            align: float = self._align if params.align is None else params.align
+
+            self._place(
+                child,
+                self._vector(
+                    main,
+                    self._padding + round((inner_cross - child_cross) * align),
+                ),
+            )
+            main += child_main + gap
+
+    def arrange(self, size: IVector2) -> None:
+        self._arrange_from(size, 0, self._spacing)
+
+
+class GUIFlexLayout(GUIStackLayout):
+    """A stack that fills its constraints on the main axis (unless it has a
+    size) and shares the space its children leave over between the ones
+    with a LayoutParams().flex, in proportion to it. Without flexible
+    children, the space is distributed according to justify.
+
+    justify: What happens to left over space on the main axis: 0 puts it
+        after the children, 1 before them, 0.5 around them, and None
+        between them
+    """
+
+    def __init__(self, *children, justify: float | None = 0.0, **kwargs) -> None:
+        super().__init__(*children, **kwargs)
+        self._justify: float | None = justify
+
+    @property
+    def justify(self) -> float | None:
+        return self._justify
+
+    @justify.setter
+    def justify(self, to: float | None) -> None:
+        self._justify = to
+        self.invalidate_layout()
+
+    def _main_size(self, constraints: Constraints) -> int | None:
+        size: IVector2 | None = self._fixed_size(constraints, fill=False)
+        if size is not None:
+            return self._axes(size)[0]
+
+        main_max: int = self._axes(constraints.max)[0]
+        return main_max if main_max < UNBOUNDED else None
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        main_size: int | None = self._main_size(constraints)
+        if main_size is None:
+            # Nothing to share, so this is just a stack
+            return super().measure(constraints)
+
+        cross: int | None = self._known_cross(constraints)
+        children: list[GUIComponent] = self._laid_out()
+
+        flexible: list[tuple[GUIComponent, float]] = []
+        used: int = self._spacing * max(0, len(children) - 1)
+        for child in children:
+            flex: float = (child.layout_params or DEFAULT_LAYOUT_PARAMS).flex
+            if flex > 0:
+                flexible.append((child, flex))
+            else:
+                used += self._axes(
+                    child.layout(self._child_constraints(child, (0, UNBOUNDED), cross))
+                )[0]
+
+        free: int = max(0, main_size - 2 * self._padding - used)
+        total_flex: float = sum(flex for _, flex in flexible)
+        shared: float = 0.0
+        given: int = 0
+        for child, flex in flexible:
+            # Hand out whole pixels without losing any to rounding
+            shared += free * flex / total_flex
+            share: int = round(shared) - given
+            given += share
+            child.layout(self._child_constraints(child, (share, share), cross))
+
+        size: IVector2 = self._fit(constraints, children, cross)
+        return self._vector(main_size, self._axes(size)[1])
+
+    def arrange(self, size: IVector2) -> None:
+        children: list[GUIComponent] = self._laid_out()
+        used: int = sum(self._axes(child._layout_size)[0] for child in children)
+        used += self._spacing * max(0, len(children) - 1)
+        free: int = max(0, self._axes(self._inner(size))[0] - used)
+
+        if self._justify is None and len(children) > 1:
+            self._arrange_from(
+                size, 0, self._spacing + free // (len(children) - 1)
+            )
+        else:
+            self._arrange_from(size, round(free * (self._justify or 0.0)), self._spacing)
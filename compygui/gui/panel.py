@@ -0,0 +1,198 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from sdl2.surface import SDL_Surface
+from compygui.compositor import BlendMode, DisplayList, composite_nine_slice, fill
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2, Vector2
+from compygui.events import Event, EventListener
+from compygui.gui.colorrect import GUIColorRectangle
+from compygui.guicomponent import GUIComponent
+from compygui.images import ImageCache, ImageHandle, image_cache
+from compygui.layout import Constraints
+from compygui.shapes import DropShadow, draw_rounded_rect, draw_shadow
+
+
+class GUIPanel(GUIColorRectangle):
+    """A rectangle with rounded corners, a border and a drop shadow. It's
+    drawn from pieces cached in the shared ShapeCache() (see
+    compygui.shapes), so resizing a GUIPanel() (or having a hundred of them)
+    doesn't rasterize anything - only a new radius, border or color does.
+    The shadow is drawn outside of the GUIPanel()'s own area.
+
+    size: The size of the panel (a Vector2 is relative to the viewport)
+    color: The fill color
+    radius: The radius of the corners (before scaling)
+    border_width: The width of the border (before scaling)
+    border_color: The color of the border, or None for no border
+    shadow: The shadow the panel casts, or None for no shadow
+    scale: The scale radius, border_width and the shadow are drawn at
+        (the size of the panel isn't scaled)
+    """
+
+    def __init__(
+        self,
+        *children,
+        size: IVector2 | Vector2,
+        color: RGBAColor,
+        radius: int = 0,
+        border_width: int = 0,
+        border_color: RGBAColor | None = None,
+        shadow: DropShadow | None = None,
+        scale: float = 1.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(*children, size=size, color=color, **kwargs)
+
+        self.radius: int = radius
+        self.border_width: int = border_width
+        self.border_color: RGBAColor | None = border_color
+        self.shadow: DropShadow | None = shadow
+        self.scale: float = scale
+
+    def _render(self, event: Event) -> None:
+        if self.children and self._surface and self._visible and not self._held_back():
+            # The children are drawn onto the panel's own surface every
+            # frame, so translucent ones would pile up on last frame's pixels
+            size: IVector2 = self._calculated_size
+            fill(
+                self._surface,
+                IRect2(0, 0, size.x, size.y),
+                RGBAColor.ZERO(),
+                BlendMode.NONE,
+            )
+        super()._render(event)
+
+    def render(self, delta: int, to: SDL_Surface | DisplayList) -> None:
+        if to is self._surface:
+            return
+
+        rect: IRect2 = IRect2.from_vectors(self.topleft, self.calcd_size)
+        scale: float = self.scale
+        radius: int = round(self.radius * scale)
+
+        if self.shadow is not None:
+            shadow: DropShadow = self.shadow
+            if scale != 1:
+                shadow = DropShadow(
+                    color=shadow.color,
+                    blur=round(shadow.blur * scale),
+                    offset=IVector2(
+                        round(shadow.offset.x * scale), round(shadow.offset.y * scale)
+                    ),
+                    spread=round(shadow.spread * scale),
+                )
+            draw_shadow(to, rect, shadow, radius=radius, opacity=self.opacity)
+
+        draw_rounded_rect(
+            to,
+            rect,
+            self.color,
+            radius=radius,
+            border_width=round(self.border_width * scale),
+            border_color=self.border_color,
+            mode=self.blend_mode,
+            opacity=self.opacity,
+        )
+
+        if self.children:
+            # The children were rendered onto the panel's own surface
+            GUIComponent.render(self, delta, to)
+
+
+class GUINineSlice(GUIComponent):
+    """An image file stretched over any size as a nine-slice: its corners
+    are drawn as they are, its edges are stretched along the sides and its
+    center over the rest. The image is shared through an ImageCache() like
+    GUIImage()'s, and the GUINineSlice() doesn't have a surface of its own,
+    so it doesn't show children.
+
+    size: The size to stretch the image to (a Vector2 is relative to the viewport)
+    path: The path of the image file
+    insets: The (left, top, right, bottom) sizes of the image's corners/edges
+    center: Whether to draw the center of the image
+    cache: The ImageCache() to load the image through
+    """
+
+    def __init__(
+        self,
+        *children,
+        size: IVector2 | Vector2,
+        path: str,
+        insets: tuple[int, int, int, int],
+        center: bool = True,
+        cache: ImageCache = image_cache,
+        **kwargs,
+    ) -> None:
+        self._handle: ImageHandle | None = None
+
+        super().__init__(*children, **kwargs)
+
+        self._size: IVector2 = IVector2.ZERO()
+        self._relsize: Vector2 | None = None
+        if isinstance(size, IVector2):
+            self._size = size
+        else:
+            self._relsize = size
+
+        self.insets: tuple[int, int, int, int] = insets
+        self.center: bool = center
+
+        self._handle = cache.acquire(path)
+        self._handle.when_done(lambda handle: self.invalidate())
+
+    @property
+    def size(self) -> IVector2:
+        return self._size
+
+    @size.setter
+    def size(self, to: IVector2 | Vector2) -> None:
+        if isinstance(to, IVector2):
+            self._size = to
+            self._relsize = None
+        else:
+            self._relsize = to
+        self.invalidate_layout()
+
+    def _recreate_surface(self, size: IVector2) -> None:
+        # The image is composited straight from the cache
+        super()._recreate_surface(IVector2.ZERO())
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        super().measure(constraints)
+        if self._relsize:
+            self._size = (self._relsize * self.get_viewport_size()).rounded()
+        return self._size
+
+    def render(self, delta: int, to: SDL_Surface | DisplayList) -> None:
+        if to is self._surface or self._handle is None:
+            return
+
+        surface: SDL_Surface | None = self._handle.surface
+        if surface is None:
+            return
+
+        composite_nine_slice(
+            surface,
+            to,
+            IRect2.from_vectors(self.topleft, self._calculated_size),
+            self.insets,
+            self.blend_mode,
+            opacity=self.opacity,
+            center=self.center,
+        )
+
+    def _release(
+        self, listeners: list[EventListener], surfaces: list[SDL_Surface]
+    ) -> None:
+        if self._handle is not None:
+            self._handle.release()
+            self._handle = None
+        super()._release(listeners, surfaces)
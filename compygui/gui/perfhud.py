@@ -0,0 +1,305 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from collections import deque
+
+from sdl2.surface import SDL_Surface
+from compygui.compositor import BlendMode, composite, fill
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+from compygui.events import Event, EventListener, EventQueue
+from compygui.guicomponent import GUIComponent
+from compygui.memory import create_surface, free_surface, tracker
+from compygui.profiler import FrameProfiler
+
+# A tiny 3x5 bitmap font - every glyph is 5 rows of 3 bits (4 = left pixel)
+_FONT: dict[str, tuple[int, ...]] = {
+    "0": (7, 5, 5, 5, 7),
+    "1": (2, 6, 2, 2, 7),
+    "2": (7, 1, 7, 4, 7),
+    "3": (7, 1, 3, 1, 7),
+    "4": (5, 5, 7, 1, 1),
+    "5": (7, 4, 7, 1, 7),
+    "6": (7, 4, 7, 5, 7),
+    "7": (7, 1, 1, 2, 2),
+    "8": (7, 5, 7, 5, 7),
+    "9": (7, 5, 7, 1, 7),
+    "A": (2, 5, 7, 5, 5),
+    "B": (6, 5, 6, 5, 6),
+    "C": (3, 4, 4, 4, 3),
+    "D": (6, 5, 5, 5, 6),
+    "E": (7, 4, 6, 4, 7),
+    "F": (7, 4, 6, 4, 4),
+    "G": (3, 4, 5, 5, 3),
+    "H": (5, 5, 7, 5, 5),
+    "I": (7, 2, 2, 2, 7),
+    "J": (1, 1, 1, 5, 2),
+    "K": (5, 5, 6, 5, 5),
+    "L": (4, 4, 4, 4, 7),
+    "M": (5, 7, 7, 5, 5),
+    "N": (6, 5, 5, 5, 5),
+    "O": (2, 5, 5, 5, 2),
+    "P": (6, 5, 6, 4, 4),
+    "Q": (2, 5, 5, 6, 3),
+    "R": (6, 5, 6, 5, 5),
+    "S": (3, 4, 2, 1, 6),
+    "T": (7, 2, 2, 2, 2),
+    "U": (5, 5, 5, 5, 7),
+    "V": (5, 5, 5, 5, 2),
+    "W": (5, 5, 7, 7, 5),
+    "X": (5, 5, 2, 5, 5),
+    "Y": (5, 5, 2, 2, 2),
+    "Z": (7, 1, 2, 4, 7),
+    ".": (0, 0, 0, 0, 2),
+    ":": (0, 2, 0, 2, 0),
+    "%": (5, 1, 2, 4, 5),
+    "/": (1, 1, 2, 4, 4),
+    "-": (0, 0, 7, 0, 0),
+}
+
+# Every glyph is 3 pixels wide and 5 tall, plus 1 pixel of spacing
+_ADVANCE: int = 4
+_LINE_HEIGHT: int = 6
+_PADDING: int = 2
+_GRAPH_HEIGHT: int = 24
+
+
+class GUIPerfHUD(GUIComponent):
+    """An overlay that shows how well the app is performing: FPS, a graph of
+    recent frame times, the time spent in each frame phase, the memory taken
+    up by tracked surfaces and textures, the listener count and the event queue depth.
+
+    The overlay is drawn into its own surface and only re-drawn every
+    update_interval seconds - every other frame, it's only composited - so it
+    barely shows up in the numbers it reports. Use Window().toggle_perf_hud()
+    to show it on a window.
+
+    profiler: The FrameProfiler() to show the phase breakdown of (only shown
+        while the profiler is enabled)
+    app_events: The app's EventQueue(), whose listeners and queued events get
+        counted together with the ones of the VCT
+    update_interval: How often (in seconds of frame delta time) the overlay
+        gets re-drawn
+    history: How many frames the frame time graph shows
+    scale: The size of one overlay pixel on the screen
+    budget: The frame time (in seconds) to compare frames against. The graph
+        is scaled to twice this
+    """
+
+    PHASES: tuple[str, ...] = (
+        "events",
+        "timers",
+        "animate",
+        "rasterize",
+        "layout",
+        "paint",
+        "upload",
+        "present",
+        "gc",
+    )
+    """The profiler spans shown in the phase breakdown"""
+
+    BACKGROUND: RGBAColor = RGBAColor(r=0, g=0, b=0, a=176)
+    TEXT: RGBAColor = RGBAColor(r=255, g=255, b=255, a=255)
+    GOOD: RGBAColor = RGBAColor(r=64, g=224, b=96, a=255)
+    SLOW: RGBAColor = RGBAColor(r=240, g=200, b=48, a=255)
+    BAD: RGBAColor = RGBAColor(r=240, g=64, b=64, a=255)
+    BUDGET: RGBAColor = RGBAColor(r=128, g=128, b=128, a=255)
+
+    def __init__(
+        self,
+        *children,
+        profiler: FrameProfiler | None = None,
+        app_events: EventQueue | None = None,
+        update_interval: float = 0.25,
+        history: int = 120,
+        scale: int = 2,
+        budget: float = 1 / 60,
+        **kwargs,
+    ) -> None:
+        kwargs.setdefault("position", IVector2(8, 8))
+        super().__init__(*children, **kwargs)
+
+        self.profiler: FrameProfiler | None = profiler
+        self.app_events: EventQueue | None = app_events
+        self.update_interval: float = update_interval
+        self.scale: int = scale
+        self.budget: float = budget
+
+        self.frame_times: deque[float] = deque(maxlen=history)
+        self._since_update: float = 0.0
+        self._stale: bool = True
+        # Pre-rendered glyphs of the bitmap font, in TEXT color
+        self._glyphs: dict[str, SDL_Surface] = {}
+        tracker.add_evictor(self.evict_glyphs)
+
+        lines: int = 4 + len(self.PHASES)
+        self.size: IVector2 = IVector2(
+            history + 2 * _PADDING,
+            lines * _LINE_HEIGHT + _GRAPH_HEIGHT + 2 * _PADDING + 2,
+        )
+
+    def calculate(self, delta: int) -> IVector2:
+        return IVector2(self.size.x * self.scale, self.size.y * self.scale)
+
+    def _recreate_surface(self, size: IVector2) -> None:
+        super()._recreate_surface(size)
+        self._stale = True
+
+    def _render(self, event: Event) -> None:
+        delta: float = event.data["delta"]
+        self.frame_times.append(delta)
+        self._since_update += delta
+
+        super()._render(event)
+
+        if self._stale or self._since_update >= self.update_interval:
+            self.redraw()
+            self._since_update = 0.0
+            self._stale = False
+
+    def _fill(self, x: int, y: int, w: int, h: int, color: RGBAColor) -> None:
+        fill(
+            self._surface,
+            IRect2(x * self.scale, y * self.scale, w * self.scale, h * self.scale),
+            color,
+            BlendMode.NONE,
+        )
+
+    def _glyph(self, char: str) -> SDL_Surface | None:
+        glyph: SDL_Surface | None = self._glyphs.get(char)
+        if glyph is not None or char not in _FONT:
+            return glyph
+
+        glyph = create_surface(
+            self, IVector2(3 * self.scale, 5 * self.scale), mask=self._rgba_mask
+        )
+        for row, bits in enumerate(_FONT[char]):
+            for column in range(3):
+                if bits & (4 >> column):
+                    fill(
+                        glyph,
+                        IRect2(
+                            column * self.scale, row * self.scale, self.scale, self.scale
+                        ),
+                        self.TEXT,
+                        BlendMode.NONE,
+                    )
+
+        self._glyphs[char] = glyph
+        return glyph
+
+    def _text(self, x: int, y: int, text: str) -> None:
+        for char in text.upper():
+            glyph: SDL_Surface | None = self._glyph(char)
+            if glyph is not None:
+                composite(glyph, self._surface, IVector2(x * self.scale, y * self.scale))
+            x += _ADVANCE
+
+    def evict_glyphs(self, wanted: int) -> int:
+        """Frees the pre-rendered glyphs (they get re-created when needed).
+        Registered to the memory tracker as an evictor.
+
+        wanted: How many bytes the tracker wants freed
+        """
+
+        freed: int = 0
+        for glyph in self._glyphs.values():
+            freed += glyph.contents.pitch * glyph.contents.h
+            free_surface(glyph)
+        self._glyphs.clear()
+        return freed
+
+    def _frame_color(self, frame_time: float) -> RGBAColor:
+        if frame_time <= self.budget * 1.05:
+            return self.GOOD
+        elif frame_time <= self.budget * 2:
+            return self.SLOW
+        return self.BAD
+
+    def _queue_stats(self) -> tuple[int, int]:
+        queues: list[EventQueue] = [self.tree_events]
+        if self.app_events is not None:
+            queues.append(self.app_events)
+        return (
+            sum(queue.listener_count for queue in queues),
+            sum(len(queue.events) for queue in queues),
+        )
+
+    def redraw(self) -> None:
+        """Re-draws the overlay with the current numbers"""
+
+        if not self._surface:
+            return
+
+        self._fill(0, 0, self.size.x, self.size.y, self.BACKGROUND)
+        x: int = _PADDING
+        y: int = _PADDING
+
+        times: list[float] = list(self.frame_times)
+        total: float = sum(times)
+        fps: float = len(times) / total if total > 0 else 0.0
+        worst: float = max(times, default=0.0)
+        self._text(x, y, f"FPS {fps:.1f}")
+        y += _LINE_HEIGHT
+        self._text(
+            x,
+            y,
+            f"AVG {total / max(len(times), 1) * 1000:.1f} MAX {worst * 1000:.1f} MS",
+        )
+        y += _LINE_HEIGHT
+
+        # Frame time graph, scaled so that the budget is at half the height
+        for index, frame_time in enumerate(times):
+            height: int = min(
+                _GRAPH_HEIGHT,
+                max(1, round(frame_time / (self.budget * 2) * _GRAPH_HEIGHT)),
+            )
+            self._fill(
+                x + index,
+                y + _GRAPH_HEIGHT - height,
+                1,
+                height,
+                self._frame_color(frame_time),
+            )
+        self._fill(
+            x, y + _GRAPH_HEIGHT // 2, self.frame_times.maxlen or 0, 1, self.BUDGET
+        )
+        y += _GRAPH_HEIGHT + 2
+
+        summary: dict[str, dict[str, float]] = {}
+        if self.profiler is not None and self.profiler.enabled:
+            summary = self.profiler.summary()
+        for phase in self.PHASES:
+            stats: dict[str, float] | None = summary.get(phase)
+            value: str = f"{stats['mean'] * 1000:.2f} MS" if stats else "-"
+            self._text(x, y, f"{phase:<10}{value}")
+            y += _LINE_HEIGHT
+
+        self._text(
+            x,
+            y,
+            f"MEMORY {tracker.current_bytes / (1024 * 1024):.1f} "
+            f"PEAK {tracker.peak_bytes / (1024 * 1024):.1f} MB",
+        )
+        y += _LINE_HEIGHT
+
+        listeners, queued = self._queue_stats()
+        self._text(x, y, f"LISTENERS {listeners} QUEUED {queued}")
+
+        self.invalidate()
+
+    def _release(
+        self, listeners: list[EventListener], surfaces: list[SDL_Surface]
+    ) -> None:
+        tracker.remove_evictor(self.evict_glyphs)
+        surfaces.extend(self._glyphs.values())
+        self._glyphs.clear()
+        super()._release(listeners, surfaces)
@@ -0,0 +1,142 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from sdl2.surface import SDL_Surface
+from compygui.compositor import BlendMode, DisplayList, fill
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+from compygui.font import Font
+from compygui.guicomponent import GUIComponent
+from compygui.layout import Constraints
+
+
+class GUIText(GUIComponent):
+    """A (possibly multi-line) piece of text, drawn from its Font()'s glyph
+    atlas. The text is drawn into the GUIText()'s own surface only when it
+    changes - every other frame, it's only composited - and its size comes
+    from the font's cached line widths.
+
+    text: The text ("\\n" starts a new line)
+    font: The Font() to draw it with (see compygui.font.load_font())
+    color: The color of the text
+    align: Where shorter lines are aligned (0 = left, 0.5 = center, 1 = right)
+    """
+
+    def __init__(
+        self,
+        *children,
+        text: str,
+        font: Font,
+        color: RGBAColor = RGBAColor.WHITE(),
+        align: float = 0.0,
+        **kwargs,
+    ) -> None:
+        self._text: str = text
+        self._lines: list[str] = text.split("\n")
+        self._font: Font = font
+        self._color: RGBAColor = color
+        self._align: float = align
+        self._stale: bool = True
+
+        super().__init__(*children, **kwargs)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, to: str) -> None:
+        if to == self._text:
+            return
+        self._text = to
+        self._lines = to.split("\n")
+        self._restyle(relayout=True)
+
+    @property
+    def font(self) -> Font:
+        return self._font
+
+    @font.setter
+    def font(self, to: Font) -> None:
+        self._font = to
+        self._restyle(relayout=True)
+
+    @property
+    def color(self) -> RGBAColor:
+        return self._color
+
+    @color.setter
+    def color(self, to: RGBAColor) -> None:
+        self._color = to
+        self._restyle()
+
+    @property
+    def align(self) -> float:
+        return self._align
+
+    @align.setter
+    def align(self, to: float) -> None:
+        self._align = to
+        self._restyle()
+
+    def _restyle(self, relayout: bool = False) -> None:
+        self._stale = True
+        if relayout:
+            self.invalidate_layout()
+        self.invalidate()
+
+    def _recreate_surface(self, size: IVector2) -> None:
+        super()._recreate_surface(size)
+        self._stale = True
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        super().measure(constraints)
+        return self._font.measure(self._text)
+
+    def redraw(self) -> None:
+        """Draws the text into the GUIText()'s surface"""
+
+        if not self._surface:
+            return
+
+        size: IVector2 = self._calculated_size
+        # Transparent, but already in the text's color: blending glyphs
+        # onto it keeps the color channels as they are, so the surface
+        # stays straight alpha (blending onto black would darken the
+        # antialiased edges)
+        color: RGBAColor = self._color
+        fill(
+            self._surface,
+            IRect2(0, 0, size.x, size.y),
+            RGBAColor(r=color.r, g=color.g, b=color.b, a=0),
+            BlendMode.NONE,
+        )
+
+        y: int = 0
+        for line in self._lines:
+            if line:
+                width: int = self._font.layout(line)[0]
+                self._font.draw(
+                    self._surface,
+                    line,
+                    IVector2(round((size.x - width) * self._align), y),
+                    color=self._color,
+                )
+            y += self._font.line_skip
+
+        self._stale = False
+
+    def render(self, delta: int, to: SDL_Surface | DisplayList) -> None:
+        if to is self._surface:
+            if self._stale:
+                self.redraw()
+            return
+
+        super().render(delta, to)
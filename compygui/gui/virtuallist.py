@@ -0,0 +1,481 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import Callable
+
+from sdl2.surface import SDL_Surface
+from compygui.component import Component
+from compygui.datatypes.vector2 import IVector2
+from compygui.events import Event, EventListener, EventType
+from compygui.guicomponent import GUIComponent
+
+
+class RowHeightIndex:
+    """A lazily measured prefix-sum index of variable row heights.
+
+    Rows are grouped into blocks of BLOCK_SIZE. A Fenwick tree over the block
+    heights gives the offset of any block (and the block at any offset) in
+    O(log n). Blocks that were never looked at count with an estimated
+    height, and only the heights of the most recently used blocks are kept,
+    so memory only grows by a few bytes per block - not per row.
+
+    count: The number of rows
+    height_of: Returns the height of a row (must return the same value until
+        invalidate() is called for that row)
+    estimate: The height assumed for rows that weren't measured yet
+    cache_blocks: How many blocks of measured row heights are kept
+    """
+
+    BLOCK_SIZE: int = 256
+
+    def __init__(
+        self,
+        count: int,
+        height_of: Callable[[int], int],
+        estimate: int,
+        cache_blocks: int = 64,
+    ) -> None:
+        self.height_of: Callable[[int], int] = height_of
+        self.estimate: int = estimate
+        self.cache_blocks: int = cache_blocks
+        self.reset(count)
+
+    def reset(self, count: int) -> None:
+        """Forgets every measured height
+
+        count: The (new) number of rows
+        """
+
+        self.count: int = count
+        blocks: int = -(-count // self.BLOCK_SIZE)
+
+        self._totals: array = array(
+            "q",
+            (
+                self._block_len(block) * self.estimate
+                for block in range(blocks)
+            ),
+        )
+        self._measured: bytearray = bytearray(blocks)
+        self._heights: OrderedDict[int, array] = OrderedDict()
+        self.total: int = sum(self._totals)
+
+        # 1-based Fenwick tree, built in O(n)
+        self._tree: array = array("q", bytes(8 * (blocks + 1)))
+        for index in range(1, blocks + 1):
+            self._tree[index] += self._totals[index - 1]
+            parent: int = index + (index & -index)
+            if parent <= blocks:
+                self._tree[parent] += self._tree[index]
+
+    def _block_len(self, block: int) -> int:
+        return min(self.BLOCK_SIZE, self.count - block * self.BLOCK_SIZE)
+
+    def _add(self, block: int, delta: int) -> None:
+        self._totals[block] += delta
+        self.total += delta
+        index: int = block + 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def _prefix(self, block: int) -> int:
+        """The total height of every block before this one"""
+
+        total: int = 0
+        while block > 0:
+            total += self._tree[block]
+            block -= block & -block
+        return total
+
+    def _block_heights(self, block: int) -> array:
+        heights: array | None = self._heights.get(block)
+        if heights is not None:
+            self._heights.move_to_end(block)
+            return heights
+
+        start: int = block * self.BLOCK_SIZE
+        heights = array(
+            "q",
+            (self.height_of(row) for row in range(start, start + self._block_len(block))),
+        )
+        if not self._measured[block]:
+            self._measured[block] = 1
+            self._add(block, sum(heights) - self._totals[block])
+
+        self._heights[block] = heights
+        if len(self._heights) > self.cache_blocks:
+            self._heights.popitem(last=False)
+        return heights
+
+    def height(self, row: int) -> int:
+        """Returns the height of a row
+
+        row: The index of the row
+        """
+
+        block, index = divmod(row, self.BLOCK_SIZE)
+        return self._block_heights(block)[index]
+
+    def offset_of(self, row: int) -> int:
+        """Returns the offset of the top of a row
+
+        row: The index of the row
+        """
+
+        block, index = divmod(row, self.BLOCK_SIZE)
+        if index == 0:
+            return self._prefix(block)
+
+        heights: array = self._block_heights(block)
+        return self._prefix(block) + sum(heights[:index])
+
+    def row_at(self, offset: int) -> int:
+        """Returns the index of the row at an offset (clamped to the rows)
+
+        offset: The offset to look up
+        """
+
+        if self.count == 0:
+            return 0
+
+        blocks: int = len(self._totals)
+        block: int = 0
+        remaining: int = max(0, offset)
+
+        step: int = 1 << blocks.bit_length()
+        while step:
+            if block + step <= blocks and self._tree[block + step] <= remaining:
+                block += step
+                remaining -= self._tree[block]
+            step >>= 1
+
+        # Measuring a block can change its height, so it might not contain
+        # the offset anymore - then it's in one of the next blocks
+        while block < blocks:
+            for index, height in enumerate(self._block_heights(block)):
+                if remaining < height:
+                    return block * self.BLOCK_SIZE + index
+                remaining -= height
+            block += 1
+
+        return self.count - 1
+
+    def invalidate(self, row: int | None = None) -> None:
+        """Marks a row (or every row) as needing to be measured again
+
+        row: The index of the row, or None for every row
+        """
+
+        if row is None:
+            self.reset(self.count)
+            return
+
+        block: int = row // self.BLOCK_SIZE
+        self._heights.pop(block, None)
+        if self._measured[block]:
+            self._measured[block] = 0
+            self._add(
+                block, self._block_len(block) * self.estimate - self._totals[block]
+            )
+
+
+class GUIVirtualList(GUIComponent):
+    """A scrolling list (or grid) of any number of items that only creates
+    components for the rows that are actually visible.
+
+    Row components are created with create_row() and filled in with
+    bind_row(row, item). When a row scrolls out of view, its component is
+    hidden and re-used (bound again) for a row that scrolls into view, so
+    memory use and frame time depend on the size of the list on screen,
+    not on item_count.
+
+    size: The size of the list on screen
+    item_count: How many items there are
+    create_row: Creates a new (empty) row component
+    bind_row: Fills a row component in with an item, by index
+    row_height: The height of every row, or a function that returns the height
+        of a row by index (rows are measured lazily, see RowHeightIndex())
+    estimated_row_height: The height assumed for rows that weren't measured yet
+    columns: How many items are in one row (each gets size.x // columns pixels)
+    overscan: How many extra rows are kept bound above and below the visible ones
+    wheel_step: How many pixels one mouse wheel step scrolls
+    """
+
+    def __init__(
+        self,
+        *children,
+        size: IVector2,
+        item_count: int,
+        create_row: Callable[[], GUIComponent],
+        bind_row: Callable[[GUIComponent, int]],
+        row_height: int | Callable[[int], int],
+        estimated_row_height: int = 24,
+        columns: int = 1,
+        overscan: int = 2,
+        wheel_step: int = 48,
+        **kwargs,
+    ) -> None:
+        super().__init__(*children, **kwargs)
+
+        self.size: IVector2 = size
+        self.create_row: Callable[[], GUIComponent] = create_row
+        self.bind_row: Callable[[GUIComponent, int]] = bind_row
+        self.columns: int = columns
+        self.overscan: int = overscan
+        self.wheel_step: int = wheel_step
+
+        self.scroll_offset: int = 0
+        self.item_count: int = item_count
+
+        self._fixed_height: int | None = None
+        self._heights: RowHeightIndex | None = None
+        if isinstance(row_height, int):
+            self._fixed_height = row_height
+        else:
+            self._heights = RowHeightIndex(
+                self.line_count, row_height, estimated_row_height
+            )
+
+        self._rows: dict[int, GUIComponent] = {}
+        self._spare: list[GUIComponent] = []
+        self._rebound: list[GUIComponent] = []
+        self._rows_dirty: bool = True
+
+        self._wheel_listener: EventListener | None = None
+
+    @property
+    def line_count(self) -> int:
+        """How many rows of (up to columns) items there are"""
+        return -(-self.item_count // self.columns)
+
+    def line_height(self, line: int) -> int:
+        if self._heights is None:
+            return self._fixed_height  # type: ignore
+        return self._heights.height(line)
+
+    def line_offset(self, line: int) -> int:
+        if self._heights is None:
+            return line * self._fixed_height  # type: ignore
+        return self._heights.offset_of(line)
+
+    def line_at(self, offset: int) -> int:
+        if self._heights is None:
+            return min(
+                max(0, offset // max(self._fixed_height, 1)),  # type: ignore
+                max(self.line_count - 1, 0),
+            )
+        return self._heights.row_at(offset)
+
+    @property
+    def content_height(self) -> int:
+        """The (estimated, for rows that weren't measured yet) height of all rows"""
+
+        if self._heights is None:
+            return self.line_count * self._fixed_height  # type: ignore
+        return self._heights.total
+
+    @property
+    def max_scroll(self) -> int:
+        return max(0, self.content_height - self.size.y)
+
+    def scroll_to(self, offset: int) -> None:
+        """Scrolls the list so that offset is at its top edge
+
+        offset: The scroll offset in pixels (clamped to the content)
+        """
+
+        offset = min(max(0, round(offset)), self.max_scroll)
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            self._rows_dirty = True
+            self.invalidate()
+
+    def scroll_by(self, delta: int) -> None:
+        """Scrolls the list by a number of pixels (positive scrolls down)"""
+        self.scroll_to(self.scroll_offset + delta)
+
+    def scroll_to_item(self, item: int) -> None:
+        """Scrolls the list so that an item's row is at its top edge
+
+        item: The index of the item
+        """
+        self.scroll_to(self.line_offset(item // self.columns))
+
+    def set_item_count(self, count: int) -> None:
+        """Changes how many items there are and re-binds every row
+
+        count: The new item count
+        """
+
+        self.item_count = count
+        if self._heights is not None:
+            self._heights.reset(self.line_count)
+        self.refresh()
+        self.scroll_to(self.scroll_offset)
+
+    def refresh(self, item: int | None = None) -> None:
+        """Re-binds (and re-measures) the row of an item, or every row.
+        Call this when the items change.
+
+        item: The index of the item, or None for every item
+        """
+
+        items: list[int] = list(self._rows) if item is None else [item]
+        for index in items:
+            row: GUIComponent | None = self._rows.pop(index, None)
+            if row is not None:
+                self._spare.append(row)
+
+        if self._heights is not None:
+            if item is None:
+                self._heights.invalidate()
+            else:
+                self._heights.invalidate(item // self.columns)
+
+        self._rows_dirty = True
+        self.invalidate()
+
+    def visible_items(self) -> range:
+        """Returns the indices of the items that currently have a row"""
+
+        if not self._rows:
+            return range(0)
+        return range(min(self._rows), max(self._rows) + 1)
+
+    def setup(self) -> None:
+        self._wheel_listener = self.tree_events.connect(
+            self, self._on_mouse_wheel, EventType.G_MOUSE_WHEEL
+        )
+
+    def _detach(self, listeners: list[EventListener]) -> None:
+        if self._wheel_listener is not None:
+            listeners.append(self._wheel_listener)
+            self._wheel_listener = None
+        super()._detach(listeners)
+
+    def _release(
+        self, listeners: list[EventListener], surfaces: list[SDL_Surface]
+    ) -> None:
+        if self._wheel_listener is not None:
+            listeners.append(self._wheel_listener)
+            self._wheel_listener = None
+        super()._release(listeners, surfaces)
+
+    def _on_mouse_wheel(self, event: Event) -> None:
+        position: IVector2 = event.data["position"] - self.viewport_topleft
+        if (
+            self.visible
+            and 0 <= position.x < self.size.x
+            and 0 <= position.y < self.size.y
+        ):
+            event.data["target"] = self
+
+    def handle_mouse_wheel(self, event: Event) -> None:
+        """Scrolls the list when the mouse wheel is used over it"""
+        self.scroll_by(round(-event.data["delta"].y * self.wheel_step))
+
+    def calculate(self, delta: int) -> IVector2:
+        return self.size
+
+    def _layout(self) -> None:
+        """Binds rows to the items that are visible and positions them"""
+
+        self._rows_dirty = False
+
+        wanted: dict[int, IVector2] = {}
+        if self.item_count > 0:
+            cell_width: int = self.size.x // self.columns
+            bottom: int = self.scroll_offset + self.size.y
+
+            line: int = max(0, self.line_at(self.scroll_offset) - self.overscan)
+            top: int = self.line_offset(line)
+            after: int = 0
+            while line < self.line_count and after <= self.overscan:
+                for column in range(self.columns):
+                    item: int = line * self.columns + column
+                    if item >= self.item_count:
+                        break
+                    wanted[item] = IVector2(
+                        column * cell_width, top - self.scroll_offset
+                    )
+
+                top += self.line_height(line)
+                line += 1
+                if top >= bottom:
+                    after += 1
+
+        for item in [item for item in self._rows if item not in wanted]:
+            self._spare.append(self._rows.pop(item))
+
+        created: list[GUIComponent] = []
+        for item, position in wanted.items():
+            row: GUIComponent | None = self._rows.get(item)
+            if row is None:
+                if self._spare:
+                    row = self._spare.pop()
+                else:
+                    row = self.create_row()
+                    created.append(row)
+
+                self.bind_row(row, item)
+                row.visible = True
+                self._rows[item] = row
+                self._rebound.append(row)
+
+            row.position = position
+
+        if created:
+            self.extend_children(created)
+
+        # Keep a few spare rows around for the next scroll, hide the rest
+        keep: int = 2 * self.overscan * self.columns
+        for row in self._spare[keep:]:
+            row.destroy()
+        del self._spare[keep:]
+        for row in self._spare:
+            row.visible = False
+
+    def _render(self, event: Event) -> None:
+        if not self.visible:
+            return
+
+        if self._rows_dirty:
+            self._layout()
+
+        # Rows that were just (re-)bound are rendered right away, so the
+        # list doesn't composite what they showed for their previous item
+        for row in self._rebound:
+            if row.render_listener is not None and not row.destroyed:
+                row._render(event)
+                self._skip_render(row.render_listener, event)
+        self._rebound.clear()
+
+        super()._render(event)
+
+    @staticmethod
+    def _skip_render(listener: EventListener, event: Event) -> None:
+        """Makes a row's own G_RENDER listener skip the event it was already
+        rendered for (its listener runs after the list's)
+
+        listener: The row's render listener
+        event: The G_RENDER event the row was rendered for
+        """
+
+        condition: Callable[[Event], bool] | None = listener.condition
+
+        def skip(fired: Event) -> bool:
+            listener.condition = condition
+            if fired is event:
+                return False
+            return condition is None or condition(fired)
+
+        listener.condition = skip
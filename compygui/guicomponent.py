@@ -8,25 +8,44 @@ https://github.com/FluffyKn1ght/compygui
 """
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, contextmanager
 from enum import Enum
 from types import NoneType
-from typing import Any
+from typing import Any, Iterator
 
 from sdl2.surface import (
-    SDL_BlitSurface,
-    SDL_CreateRGBSurface,
-    SDL_FreeSurface,
+    SDL_MUSTLOCK,
+    SDL_LockSurface,
+    SDL_SetSurfaceBlendMode,
     SDL_Surface,
+    SDL_UnlockSurface,
 )
 from compygui.component import Component
+from compygui.compositor import (
+    BlendMode,
+    DisplayList,
+    composite,
+    has_numpy,
+    pixel_dtype,
+    surface_array,
+    surface_memoryview,
+)
 from compygui.datatypes.rect2 import IRect2
 from compygui.datatypes.rgba import RGBAMask
 from compygui.datatypes.vector2 import IVector2, Vector2
 from compygui.errors import ComPyGUIError, SDLErrorDetector
 from compygui.events import Event, EventListener, EventOrigin, EventQueue, EventType
+from compygui.layout import Constraints, LayoutParams
+from compygui.memory import create_surface, free_surface
+from compygui.profiler import NULL_SPAN, FrameProfiler
+from compygui.timers import UpdateThrottle
 
 
 class GUIComponent(Component):
+    # Bumped whenever a GUIComponent() joins a parent or gets (un)throttled,
+    # so every GUIComponent() knows to look up its throttles again
+    _throttle_generation: int = 0
+
     def __init__(
         self,
         *children,
@@ -34,15 +53,45 @@ class GUIComponent(Component):
         _bit_depth: int = 32,
         position: IVector2,
         anchor_point: Vector2 = Vector2.ZERO(),
+        blend_mode: BlendMode = BlendMode.NORMAL,
+        premultiplied: bool = False,
+        opacity: float = 1.0,
+        visible: bool = True,
+        layout_params: LayoutParams | None = None,
+        max_update_hz: float | None = None,
     ) -> None:
+        self._throttle: UpdateThrottle | None = (
+            None if max_update_hz is None else UpdateThrottle(max_update_hz)
+        )
+        # The throttles of this GUIComponent() and its ancestors, outermost first
+        self._throttles: tuple[UpdateThrottle, ...] = ()
+        self._throttles_generation: int = -1
+
+        # Adding children invalidates the layout, so this has to exist first
+        self._layout_dirty: bool = True
+        self._constraints: Constraints | None = None
+        self._layout_size: IVector2 = IVector2.ZERO()
+        # The size_dependents of the viewport get_viewport_size() was called in
+        self._size_dependents: Any = None
+
         super().__init__(*children)
 
+        self._visible: bool = visible
+        self._layout_params: LayoutParams | None = layout_params
+
         self._surface: SDL_Surface | None = None
         self._rgba_mask: RGBAMask = _rgba_mask
         self._bit_depth: int = _bit_depth
 
+        self.blend_mode: BlendMode = blend_mode
+        self.premultiplied: bool = premultiplied
+        self._opacity: float = opacity
+
         self._calculated_size: IVector2 = IVector2.ZERO()
 
+        self.dirty: bool = True
+        self._dirty_rects: list[IRect2] = []
+
         self.tree_events: EventQueue
 
         self.position: IVector2 = position
@@ -50,11 +99,107 @@ class GUIComponent(Component):
 
         self._recreate_surface(self.calcd_size)
 
-        self.render_listener: EventListener
+        self.render_listener: EventListener | None = None
 
     @property
     def topleft(self) -> IVector2:
-        return self.position - (self.anchor_point * self.calcd_size).rounded()
+        anchor: Vector2 = self.anchor_point
+        if not anchor.x and not anchor.y:
+            return self.position
+
+        size: IVector2 = self._calculated_size
+        return IVector2(
+            self.position.x - int(round(anchor.x * size.x)),
+            self.position.y - int(round(anchor.y * size.y)),
+        )
+
+    @property
+    def visible(self) -> bool:
+        """Invisible components are neither rendered nor composited (so
+        neither are their children, even though they still render) and
+        take up no space in layout containers"""
+        return self._visible
+
+    @visible.setter
+    def visible(self, to: bool) -> None:
+        if to != self._visible:
+            self._visible = to
+            if self.parent is not None:
+                self.parent.invalidate_layout()
+
+    @property
+    def opacity(self) -> float:
+        """How opaque the GUIComponent() is composited, from 0 to 1"""
+        return self._opacity
+
+    @opacity.setter
+    def opacity(self, to: float) -> None:
+        if to != self._opacity:
+            self._opacity = to
+            self.invalidate()
+
+    @property
+    def max_update_hz(self) -> float | None:
+        """How many times per second the GUIComponent() and its subtree
+        get laid out and rendered at most (None for every frame). In between,
+        the subtree keeps its pixels from the last update, which its parent
+        keeps compositing as usual - useful for clocks and slow gauges.
+        Nested limits all apply, so a subtree never updates more often than
+        its slowest throttled ancestor.
+        """
+        return None if self._throttle is None else self._throttle.max_hz
+
+    @max_update_hz.setter
+    def max_update_hz(self, to: float | None) -> None:
+        self._throttle = None if to is None else UpdateThrottle(to)
+        GUIComponent._throttle_generation += 1
+        self.invalidate()
+
+    def _held_back(self) -> bool:
+        """Whether a throttle (of this GUIComponent() or an ancestor) skips
+        updating it at the current time of its VCT
+        """
+
+        if self._throttles_generation != GUIComponent._throttle_generation:
+            throttles: list[UpdateThrottle] = []
+            node: Component | None = self
+            while isinstance(node, GUIComponent):
+                if node._throttle is not None:
+                    throttles.append(node._throttle)
+                node = node.parent
+            self._throttles = tuple(reversed(throttles))
+            self._throttles_generation = GUIComponent._throttle_generation
+
+        if not self._throttles or self.render_listener is None:
+            return False
+
+        time: float = self.tree_events.time
+        for throttle in self._throttles:
+            if not throttle.due(time):
+                return True
+        return False
+
+    @property
+    def layout_params(self) -> LayoutParams | None:
+        """How the layout container the GUIComponent() is in places it"""
+        return self._layout_params
+
+    @layout_params.setter
+    def layout_params(self, to: LayoutParams | None) -> None:
+        self._layout_params = to
+        if self.parent is not None:
+            self.parent.invalidate_layout()
+
+    @property
+    def viewport_topleft(self) -> IVector2:
+        """The top-left corner of the GUIComponent() in its viewport's coordinates"""
+
+        topleft: IVector2 = self.topleft
+        parent: Component | None = self.parent
+        while isinstance(parent, GUIComponent):
+            topleft = topleft + parent.topleft
+            parent = parent.parent
+        return topleft
 
     @property
     def calcd_size(self) -> IVector2:
@@ -67,8 +212,16 @@ class GUIComponent(Component):
         )
 
     def _setup(self, tree_ev: EventQueue) -> None:
+        GUIComponent._throttle_generation += 1
+
+        if self.render_listener is not None:
+            if self.tree_events is tree_ev:
+                return
+            # Moved to a different VCT
+            self.render_listener.disconnect()
+
         self.tree_events = tree_ev
-        self.tree_events.fire(EventType.GUI_CREATED, event_origin=self)
+        self.tree_events.fire(EventType.GUI_CREATED, event_origin=self, event_key=self)
 
         self.render_listener = self.tree_events.connect(
             self, self._render, EventType.G_RENDER
@@ -76,30 +229,180 @@ class GUIComponent(Component):
 
         self.setup()
 
+        for child in self.children:
+            if isinstance(child, GUIComponent):
+                child._setup(tree_ev)
+
+    def add_child(self, child: Component) -> None:
+        # Children added to a GUIComponent() that's already part of a VCT
+        # have to join it too
+        if isinstance(child, GUIComponent) and self.render_listener is not None:
+            child._setup(self.tree_events)
+
+    def add_children(self, children: list[Component]) -> None:
+        if self.render_listener is not None:
+            GUIComponent._setup_batch(children, self.tree_events, self)
+
+    @staticmethod
+    def _setup_batch(
+        components: list[Component], tree_ev: EventQueue, origin: Component
+    ) -> None:
+        """Sets up a batch of GUIComponent()s (and their GUIComponent()
+        descendants) in one pass: their listeners are connected at once,
+        a single GUI_BATCH_CREATED event is fired for all of them (instead
+        of GUI_CREATED for each), and then their setup() methods are called
+
+        components: The components to set up (non-GUIComponent()s are skipped)
+        tree_ev: The event queue of the VCT they're joining
+        origin: The Component() they were added to
+        """
+
+        GUIComponent._throttle_generation += 1
+
+        nodes: list[GUIComponent] = []
+        stack: list[Component] = list(reversed(components))
+        while stack:
+            node: Component = stack.pop()
+            if not isinstance(node, GUIComponent):
+                continue
+            if node.render_listener is not None and node.tree_events is tree_ev:
+                continue
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+
+        if not nodes:
+            return
+
+        # Components moved here from a different VCT
+        moved: dict[int, tuple[EventQueue, list[EventListener]]] = {}
+        for node in nodes:
+            if node.render_listener is not None:
+                queue: EventQueue = node.tree_events
+                moved.setdefault(id(queue), (queue, []))[1].append(
+                    node.render_listener
+                )
+        for queue, listeners in moved.values():
+            queue.disconnect_many(listeners)
+
+        connected: list[EventListener] = tree_ev.connect_many(
+            (node, node._render, EventType.G_RENDER) for node in nodes
+        )
+        for node, listener in zip(nodes, connected):
+            node.tree_events = tree_ev
+            node.render_listener = listener
+
+        tree_ev.fire(EventType.GUI_BATCH_CREATED, event_origin=origin, components=nodes)
+
+        for node in nodes:
+            node.setup()
+
     def _recreate_surface(self, size: IVector2) -> None:
         with SDLErrorDetector("Could not (re-)create GUIComponent surface"):
             if self._surface:
-                SDL_FreeSurface(self._surface)
+                free_surface(self._surface)
                 self._surface = None
 
-            self._surface = SDL_CreateRGBSurface(
-                0,
-                size.x,
-                size.y,
-                self._bit_depth,
-                self._rgba_mask.r,
-                self._rgba_mask.g,
-                self._rgba_mask.b,
-                self._rgba_mask.a,
+            self._surface = create_surface(
+                self, size, self._bit_depth, self._rgba_mask
+            )
+            SDL_SetSurfaceBlendMode(
+                self._surface, self.blend_mode.as_sdl_blend_mode()
             )
 
+    def _span(self, what: str) -> AbstractContextManager:
+        """Returns a profiler span for one of this GUIComponent()'s methods"""
+
+        profiler: FrameProfiler | None = self.tree_events.profiler
+        if profiler is None or not profiler.trace_components:
+            return NULL_SPAN
+        return profiler.component_span(f"{self.__class__.__name__}.{what}")
+
+    def layout(self, constraints: Constraints) -> IVector2:
+        """Measures and arranges the GUIComponent() (and, through measure(),
+        its subtree) within constraints, and returns its size. The result is
+        cached - unless the constraints changed or invalidate_layout() was
+        called since, this does nothing.
+
+        constraints: The sizes the GUIComponent() may take
+        """
+
+        if not self._layout_dirty and constraints == self._constraints:
+            return self._layout_size
+        if constraints == self._constraints and self._held_back():
+            # Stays dirty, and gets laid out once it's updated again
+            return self._layout_size
+
+        with self._span("layout"):
+            size: IVector2 = constraints.constrain(self.measure(constraints))
+            self.arrange(size)
+
+        self._constraints = constraints
+        self._layout_size = size
+        self._layout_dirty = False
+        return size
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        """Lays out the children and returns the size the GUIComponent()
+        wants to be. Override this (and arrange()) to lay children out.
+
+        By default, children are positioned freely (by their position) and
+        unconstrained, and the size is whatever calculate() returns.
+
+        constraints: The sizes the GUIComponent() may take (the result gets
+            clamped to them)
+        """
+
+        unconstrained: Constraints = _UNCONSTRAINED
+        for child in self.children:
+            if isinstance(child, GUIComponent) and child._layout_dirty:
+                child.layout(unconstrained)
+
+        return self.calculate(0)
+
+    def arrange(self, size: IVector2) -> None:
+        """Positions the children once measure() decided on the size
+
+        size: The final size of the GUIComponent()
+        """
+        pass
+
+    def invalidate_layout(self) -> None:
+        """Marks the GUIComponent() as needing to be measured and arranged
+        again - call this when something that its size depends on changed.
+        Its ancestors get invalidated too, since their layout can depend on
+        its size, but the rest of the VCT keeps its cached layout.
+        """
+
+        if self._layout_dirty:
+            # Its ancestors already know
+            return
+
+        self._layout_dirty = True
+        super().invalidate_layout()
+
     def _render(self, event: Event) -> None:
-        new_calcd_size: IVector2 = self.calculate(event.data["delta"])
+        if not self._visible:
+            return
+
+        if self._held_back():
+            # Throttled - keeps its pixels from the last update
+            return
+
+        if self._layout_dirty:
+            # Joined the VCT (or got invalidated) after this frame's layout pass
+            old_size: IVector2 = self._layout_size
+            self.layout(self._constraints or _UNCONSTRAINED)
+            if self._throttles and old_size != self._layout_size and self.parent:
+                # The parent was laid out with the size from before the update
+                self.parent.invalidate_layout()
+
+        new_calcd_size: IVector2 = self._layout_size
         if new_calcd_size != self._calculated_size:
             self._recreate_surface(new_calcd_size)
             self.tree_events.fire(
                 EventType.GUI_SIZE_CHANGED,
                 event_origin=self,
+                event_key=self,
                 old=self._calculated_size,
                 new=new_calcd_size,
             )
@@ -109,30 +412,143 @@ class GUIComponent(Component):
             raise ComPyGUIError("GUIComponent() has no _surface")
 
         for child in self.children:
-            if isinstance(child, GUIComponent):
+            if isinstance(child, GUIComponent) and child.visible:
                 child.render(event.data["delta"], self._surface)
 
-        with SDLErrorDetector("Failed to render GUIComponent"):
+        with SDLErrorDetector("Failed to render GUIComponent"), self._span("render"):
             self.render(event.data["delta"], self._surface)
 
+        self.dirty = False
+        self._dirty_rects.clear()
+
+    def invalidate(self, rect: IRect2 | None = None) -> None:
+        """Marks (part of) the GUIComponent() as needing to be re-composited.
+        The dirty area is passed on to the parent in its own coordinates.
+
+        rect: The dirty area, relative to the GUIComponent()'s top-left corner.
+            If None, the whole GUIComponent() is dirty
+        """
+
+        if rect is None:
+            rect = IRect2(0, 0, self._calculated_size.x, self._calculated_size.y)
+
+        self.dirty = True
+        if len(self._dirty_rects) < 32:
+            self._dirty_rects.append(rect)
+        else:
+            self._dirty_rects[-1] = self._dirty_rects[-1].union(rect)
+
+        super().invalidate(rect.offset(self.topleft))
+
+    @contextmanager
+    def pixels(self, rect: IRect2 | None = None) -> Iterator[Any]:
+        """Locks the GUIComponent()'s surface and gives zero-copy access to its pixels.
+        The accessed area is invalidated once the with block exits.
+
+        With NumPy, this yields a (height, width) array with a structured
+        dtype that has "r", "g", "b" and "a" uint8 fields (use
+        array.view(numpy.uint32) for packed pixels). Without it, this yields a
+        (height, pitch // 4) memoryview of packed pixels laid out according to
+        the GUIComponent()'s RGBA mask.
+
+        rect: The area to access, relative to the GUIComponent()'s top-left corner.
+            If None, the whole surface is accessed. Only NumPy arrays are
+            cropped to it
+        """
+
+        if not self._surface:
+            raise ComPyGUIError("GUIComponent() has no _surface")
+
+        must_lock: bool = SDL_MUSTLOCK(self._surface.contents)
+        if must_lock:
+            with SDLErrorDetector(error_info="Failed to lock GUIComponent surface"):
+                SDL_LockSurface(self._surface)
+
+        try:
+            if has_numpy():
+                view = surface_array(self._surface).view(pixel_dtype(self._surface))
+                view = view[..., 0]
+                if rect is not None:
+                    view = view[rect.y : rect.y + rect.h, rect.x : rect.x + rect.w]
+                yield view
+            else:
+                yield surface_memoryview(self._surface)
+        finally:
+            if must_lock:
+                SDL_UnlockSurface(self._surface)
+            self.invalidate(rect)
+
     def setup(self) -> None:
         pass
 
-    def render(self, delta: int, to: SDL_Surface) -> None:
-        SDL_BlitSurface(
-            self._surface, None, to, IRect2.from_vectors(self.position, self.calcd_size)
+    def render(self, delta: int, to: SDL_Surface | DisplayList) -> None:
+        if not self._surface or to is self._surface:
+            return
+
+        # At its top-left corner (position minus anchor_point * size), where
+        # invalidate() and viewport_topleft expect it to be
+        composite(
+            self._surface,
+            to,
+            self.topleft,
+            self.blend_mode,
+            premultiplied=self.premultiplied,
+            opacity=self._opacity,
         )
 
     def calculate(self, delta: int) -> IVector2:
+        """Returns the size of the GUIComponent(), if measure() isn't overridden.
+        Only called when the layout was invalidated, with a delta of 0.
+        """
         return IVector2.ZERO()
 
     def get_viewport_size(self) -> IVector2:
-        if isinstance(self.parent, GUIComponent):
-            return self.parent.get_viewport_size()
-        else:
-            return self.parent.size  # type: ignore
+        """Returns the size of the viewport the GUIComponent() is in. The
+        GUIComponent()'s layout gets invalidated when the viewport is resized.
+        """
+
+        viewport: Component | None = self.parent
+        while isinstance(viewport, GUIComponent):
+            viewport = viewport.parent
+
+        dependents: Any = getattr(viewport, "size_dependents", None)
+        if dependents is not None:
+            dependents.add(self)
+            self._size_dependents = dependents
+        return viewport.size  # type: ignore
+
+    def _detach(self, listeners: list[EventListener]) -> None:
+        if self.render_listener is not None:
+            listeners.append(self.render_listener)
+            self.render_listener = None
+
+        if self._size_dependents is not None:
+            self._size_dependents.discard(self)
+            self._size_dependents = None
+
+    def _release(
+        self, listeners: list[EventListener], surfaces: list[SDL_Surface]
+    ) -> None:
+        if self.render_listener is not None:
+            listeners.append(self.render_listener)
+            self.render_listener = None
+
+        if self._surface:
+            surfaces.append(self._surface)
+            self._surface = None
 
     def destroy(self) -> None:
-        self.tree_events.fire(EventType.GUI_DESTROY, event_origin=self)
-        self.render_listener.disconnect()
+        if self.destroyed:
+            return
+
+        # GUI_DESTROY is only fired for the root of the destroyed subtree.
+        # Components that never joined a VCT have no events to fire
+        if self.render_listener is not None:
+            self.tree_events.fire(
+                EventType.GUI_DESTROY, event_origin=self, event_key=self
+            )
+
         super().destroy()
+
+
+_UNCONSTRAINED: Constraints = Constraints.unbounded()
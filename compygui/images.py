@@ -0,0 +1,390 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import ctypes
+import mmap
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from sdl2.pixels import SDL_MasksToPixelFormatEnum
+from sdl2.rwops import SDL_RWFromConstMem
+from sdl2.sdlimage import (
+    IMG_INIT_JPG,
+    IMG_INIT_PNG,
+    IMG_INIT_WEBP,
+    IMG_Init,
+    IMG_Load_RW,
+)
+from sdl2.surface import (
+    SDL_ConvertSurfaceFormat,
+    SDL_CreateRGBSurface,
+    SDL_FreeSurface,
+    SDL_SoftStretchLinear,
+    SDL_Surface,
+)
+
+from compygui.datatypes.rgba import RGBAMask
+from compygui.datatypes.vector2 import IVector2
+from compygui.errors import ComPyGUIError, SDLError
+from compygui.memory import free_surface, tracker
+
+_img_ready: bool = False
+
+
+def _decode(path: str, size: IVector2 | None, mask: RGBAMask) -> SDL_Surface:
+    """Decodes an image file into a new (untracked) surface with the pixel
+    format of mask, scaled to size. Safe to call from any thread.
+    """
+
+    global _img_ready
+    if not _img_ready:
+        # Loaders get initialized on demand anyway - this only avoids
+        # doing it in the middle of the first decode
+        IMG_Init(IMG_INIT_PNG | IMG_INIT_JPG | IMG_INIT_WEBP)
+        _img_ready = True
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ComPyGUIError(f"Image file {path!r} is empty")
+        # A private mapping - SDL_image reads the file's pages straight from
+        # the page cache, without copying the file into a bytes object first
+        mapped: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    try:
+        buffer = (ctypes.c_char * len(mapped)).from_buffer(mapped)
+        try:
+            decoded: SDL_Surface = IMG_Load_RW(
+                SDL_RWFromConstMem(ctypes.addressof(buffer), len(mapped)), 1
+            )
+        finally:
+            del buffer
+    finally:
+        mapped.close()
+
+    if not decoded:
+        raise SDLError.from_sdl_geterror(f"Failed to decode image {path!r}")
+
+    try:
+        converted: SDL_Surface = SDL_ConvertSurfaceFormat(
+            decoded, SDL_MasksToPixelFormatEnum(32, mask.r, mask.g, mask.b, mask.a), 0
+        )
+    finally:
+        SDL_FreeSurface(decoded)
+    if not converted:
+        raise SDLError.from_sdl_geterror(f"Failed to convert image {path!r}")
+
+    surf = converted.contents
+    if size is None or (size.x == surf.w and size.y == surf.h):
+        return converted
+
+    try:
+        scaled: SDL_Surface = SDL_CreateRGBSurface(
+            0, size.x, size.y, 32, mask.r, mask.g, mask.b, mask.a
+        )
+        if not scaled:
+            raise SDLError.from_sdl_geterror(f"Failed to scale image {path!r}")
+        if SDL_SoftStretchLinear(converted, None, scaled, None) != 0:
+            SDL_FreeSurface(scaled)
+            raise SDLError.from_sdl_geterror(f"Failed to scale image {path!r}")
+    finally:
+        SDL_FreeSurface(converted)
+    return scaled
+
+
+class _CachedImage:
+    """One decoded image in an ImageCache()"""
+
+    __slots__ = ("key", "surface", "bytes", "refs", "future", "error", "waiters")
+
+    def __init__(self, key: tuple) -> None:
+        self.key: tuple = key
+        self.surface: SDL_Surface | None = None
+        self.bytes: int = 0
+        self.refs: int = 0
+        self.future: Future | None = None
+        self.error: Exception | None = None
+        self.waiters: list[tuple[ImageHandle, Callable[[ImageHandle], None]]] = []
+
+
+class ImageHandle:
+    """A reference to an image in an ImageCache(), returned by its
+    acquire(). The image stays in memory at least until every handle to it
+    is released.
+    """
+
+    __slots__ = ("path", "released", "_entry", "_cache")
+
+    def __init__(self, cache: ImageCache, entry: _CachedImage, path: str) -> None:
+        self.path: str = path
+        self.released: bool = False
+
+        self._entry: _CachedImage = entry
+        self._cache: ImageCache = cache
+
+    @property
+    def surface(self) -> SDL_Surface | None:
+        """The decoded surface (shared - don't modify or free it), or None
+        while it's still being decoded (or if decoding failed)
+        """
+        return self._entry.surface
+
+    @property
+    def ready(self) -> bool:
+        """Whether the image is decoded"""
+        return self._entry.surface is not None
+
+    @property
+    def error(self) -> Exception | None:
+        """Why decoding failed, if it did"""
+        return self._entry.error
+
+    @property
+    def size(self) -> IVector2 | None:
+        """The size of the decoded image, or None if it isn't decoded"""
+        surface: SDL_Surface | None = self._entry.surface
+        if surface is None:
+            return None
+        return IVector2(surface.contents.w, surface.contents.h)
+
+    def when_done(self, callback: Callable[[ImageHandle], None]) -> None:
+        """Calls callback with the handle once decoding finished (or failed),
+        on the main thread - right away if that happened already. Not
+        called if the handle gets released first.
+
+        callback: The function to call
+        """
+
+        if self._entry.future is None:
+            callback(self)
+        else:
+            self._entry.waiters.append((self, callback))
+
+    def release(self) -> None:
+        """Gives up this reference to the image"""
+        if not self.released:
+            self.released = True
+            self._cache._release(self._entry)
+
+
+class ImageCache:
+    """A process-wide cache of decoded images (see image_cache), shared by
+    every GUIImage(). Images are keyed by their path, the size they're
+    scaled to and their pixel format, so loading the same icon any number
+    of times costs one decode and one surface.
+
+    Images are reference counted with ImageHandle()s. Images nothing refers
+    to anymore are kept around (least recently used first out) while the
+    cache takes up less than budget bytes. The cache is also registered to
+    the memory tracker as an evictor.
+
+    Files bigger than background_threshold bytes are decoded on a worker
+    thread, and are delivered by poll() (which ComPyGUIApp() calls every
+    frame) on the main thread. ComPyGUIApp().step() and replay() wait for
+    them before every frame, so they render the same frames every time.
+
+    budget: How many bytes the cache may take up before unreferenced images
+        get freed (referenced ones are never freed)
+    background_threshold: The file size from which images are decoded in the
+        background (None to always decode right away)
+    workers: How many worker threads decode images
+    """
+
+    def __init__(
+        self,
+        *args,
+        budget: int = 64 << 20,
+        background_threshold: int | None = 256 << 10,
+        workers: int = 2,
+    ) -> None:
+        self.budget: int = budget
+        self.background_threshold: int | None = background_threshold
+        self.workers: int = workers
+
+        self.bytes: int = 0
+        """How many bytes the decoded images take up"""
+        self.decodes: int = 0
+        """How many images have been decoded so far"""
+
+        self._entries: dict[tuple, _CachedImage] = {}
+        # Unreferenced (but decoded) images, least recently released first
+        self._unused: OrderedDict[tuple, _CachedImage] = OrderedDict()
+        self._pending: list[_CachedImage] = []
+        self._executor: ThreadPoolExecutor | None = None
+
+        tracker.add_evictor(self.evict)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def pending(self) -> int:
+        """How many images are being decoded in the background"""
+        return len(self._pending)
+
+    def acquire(
+        self,
+        path: str,
+        *args,
+        size: IVector2 | None = None,
+        mask: RGBAMask = RGBAMask.RGBA(),
+        background: bool | None = None,
+    ) -> ImageHandle:
+        """Returns a handle to a decoded image, decoding it if it isn't cached
+
+        path: The path of the image file
+        size: The size to scale the image to (None for its own size)
+        mask: The pixel format to convert the image to
+        background: Whether to decode the image on a worker thread (defaults
+            to whether the file is bigger than background_threshold)
+        """
+
+        key: tuple = (
+            os.path.abspath(path),
+            None if size is None else (size.x, size.y),
+            (mask.r, mask.g, mask.b, mask.a),
+        )
+        entry: _CachedImage | None = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _CachedImage(key)
+            if background is None:
+                background = (
+                    self.background_threshold is not None
+                    and os.path.getsize(path) > self.background_threshold
+                )
+
+            if background:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="compygui-image"
+                    )
+                entry.future = self._executor.submit(_decode, path, size, mask)
+                self._pending.append(entry)
+            else:
+                try:
+                    self._store(entry, _decode(path, size, mask))
+                except Exception:
+                    del self._entries[key]
+                    raise
+        else:
+            self._unused.pop(key, None)
+
+        entry.refs += 1
+        return ImageHandle(self, entry, path)
+
+    def _store(self, entry: _CachedImage, surface: SDL_Surface) -> None:
+        entry.surface = surface
+        entry.bytes = surface.contents.pitch * surface.contents.h
+        tracker.track(surface, self, size=entry.bytes)
+        self.bytes += entry.bytes
+        self.decodes += 1
+
+    def _release(self, entry: _CachedImage) -> None:
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+
+        entry.waiters.clear()
+        if entry.future is not None:
+            # Still decoding - poll() takes care of it
+            return
+
+        if entry.surface is None:
+            # Failed - let the next acquire() try again
+            del self._entries[entry.key]
+            return
+
+        self._unused[entry.key] = entry
+        if self.bytes > self.budget:
+            self.evict(self.bytes - self.budget)
+
+    def _drop(self, entry: _CachedImage) -> int:
+        del self._entries[entry.key]
+        self._unused.pop(entry.key, None)
+        if entry.surface is None:
+            return 0
+
+        free_surface(entry.surface)
+        entry.surface = None
+        self.bytes -= entry.bytes
+        return entry.bytes
+
+    def evict(self, wanted: int) -> int:
+        """Frees unreferenced images, least recently used first, until at
+        least wanted bytes are freed. Returns how many bytes were freed.
+        Registered to the memory tracker as an evictor.
+
+        wanted: How many bytes to free
+        """
+
+        freed: int = 0
+        while self._unused and freed < wanted:
+            freed += self._drop(next(iter(self._unused.values())))
+        return freed
+
+    def poll(self, *args, wait: bool = False) -> int:
+        """Takes in the images that finished decoding in the background and
+        calls their handles' when_done() callbacks. Returns how many images
+        finished. Call this on the main thread.
+
+        wait: Whether to wait for every pending decode to finish first (so
+            what's taken in doesn't depend on how fast the workers are)
+        """
+
+        if not self._pending:
+            return 0
+
+        if wait:
+            for entry in self._pending:
+                # Blocks until it's done, without raising its error
+                entry.future.exception()  # type: ignore
+
+        done: list[_CachedImage] = [
+            entry for entry in self._pending if entry.future.done()  # type: ignore
+        ]
+        if not done:
+            return 0
+        self._pending = [entry for entry in self._pending if entry not in done]
+
+        for entry in done:
+            future: Future = entry.future  # type: ignore
+            entry.future = None
+            try:
+                self._store(entry, future.result())
+            except Exception as error:
+                entry.error = error
+
+            waiters = entry.waiters
+            entry.waiters = []
+            for handle, callback in waiters:
+                if not handle.released:
+                    callback(handle)
+
+            if entry.refs == 0:
+                entry.refs = 1
+                self._release(entry)
+
+        return len(done)
+
+    def clear(self) -> None:
+        """Frees every unreferenced image"""
+        self.evict(self.bytes)
+
+    def shutdown(self) -> None:
+        """Waits for background decodes to finish and stops the workers"""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.poll()
+
+
+image_cache: ImageCache = ImageCache()
+"""The ImageCache() shared by every GUIImage()"""
@@ -0,0 +1,124 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+from enum import Enum
+from typing import Any
+
+from compygui.datatypes.vector2 import IVector2, Vector2
+
+UNBOUNDED: int = 1 << 30
+"""A Constraints() maximum that means "no limit" on that axis"""
+
+
+class Constraints:
+    """The range of sizes a GUIComponent() may take in a layout pass,
+    passed down to it by its parent
+
+    min: The smallest allowed size
+    max: The largest allowed size (UNBOUNDED on an axis means there's no limit)
+    """
+
+    __slots__ = ("min", "max")
+
+    def __init__(
+        self, *args, min: IVector2 = IVector2.ZERO(), max: IVector2
+    ) -> None:
+        self.min: IVector2 = min
+        self.max: IVector2 = max
+
+    def __eq__(self, w: Any) -> bool:
+        if not isinstance(w, Constraints):
+            return NotImplemented
+
+        return (
+            self.min.x == w.min.x
+            and self.min.y == w.min.y
+            and self.max.x == w.max.x
+            and self.max.y == w.max.y
+        )
+
+    def __repr__(self) -> str:
+        return f"Constraints(min=({self.min.x}, {self.min.y}), max=({self.max.x}, {self.max.y}))"
+
+    @staticmethod
+    def loose(size: IVector2) -> Constraints:
+        """Any size up to size"""
+        return Constraints(max=size)
+
+    @staticmethod
+    def tight(size: IVector2) -> Constraints:
+        """Exactly size"""
+        return Constraints(min=size, max=size)
+
+    @staticmethod
+    def unbounded() -> Constraints:
+        """Any size at all"""
+        return Constraints(max=IVector2(UNBOUNDED, UNBOUNDED))
+
+    @property
+    def bounded(self) -> tuple[bool, bool]:
+        """Whether there is a maximum on the X and Y axis"""
+        return (self.max.x < UNBOUNDED, self.max.y < UNBOUNDED)
+
+    def constrain(self, size: IVector2) -> IVector2:
+        """Clamps a size to the constraints
+
+        size: The size to clamp
+        """
+
+        x: int = min(max(size.x, self.min.x), self.max.x)
+        y: int = min(max(size.y, self.min.y), self.max.y)
+        if x == size.x and y == size.y:
+            return size
+        return IVector2(x, y)
+
+
+class Direction(Enum):
+    """The main axis of a stack or flex layout"""
+
+    HORIZONTAL = 0
+    VERTICAL = 1
+
+
+class LayoutParams:
+    """How a layout container (see compygui.gui.layouts) places one of its
+    children. Set it as the child's GUIComponent().layout_params.
+
+    anchor: GUIAnchorLayout(): the point of the container the child is aligned
+        to, from Vector2(0, 0) (top-left) to Vector2(1, 1) (bottom-right)
+    offset: GUIAnchorLayout(): a distance in pixels the child is moved by
+        after anchoring
+    flex: GUIFlexLayout(): the child's share of the space that is left over on
+        the main axis. 0 means the child keeps the size it wants
+    align: GUIStackLayout()/GUIFlexLayout(): where the child is aligned on
+        the cross axis (0 = start, 1 = end), or None for the container's align
+    stretch: GUIStackLayout()/GUIFlexLayout(): make the child fill the
+        container on the cross axis
+    """
+
+    __slots__ = ("anchor", "offset", "flex", "align", "stretch")
+
+    def __init__(
+        self,
+        *args,
+        anchor: Vector2 = Vector2.ZERO(),
+        offset: IVector2 = IVector2.ZERO(),
+        flex: float = 0.0,
+        align: float | None = None,
+        stretch: bool = False,
+    ) -> None:
+        self.anchor: Vector2 = anchor
+        self.offset: IVector2 = offset
+        self.flex: float = flex
+        self.align: float | None = align
+        self.stretch: bool = stretch
+
+
+DEFAULT_LAYOUT_PARAMS: LayoutParams = LayoutParams()
+"""The LayoutParams() of children that don't have any"""
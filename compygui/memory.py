@@ -0,0 +1,363 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import ctypes
+import threading
+import weakref
+from typing import Any, Callable
+
+from sdl2.render import SDL_DestroyTexture, SDL_Texture
+from sdl2.surface import SDL_CreateRGBSurface, SDL_FreeSurface, SDL_Surface
+from compygui.datatypes.rgba import RGBAMask
+from compygui.datatypes.vector2 import IVector2
+from compygui.errors import SDLErrorDetector
+
+
+def _address(pointer: Any) -> int:
+    # Much faster than ctypes.cast(pointer, ctypes.c_void_p).value
+    return ctypes.addressof(pointer.contents)
+
+
+class Allocation:
+    """One tracked surface or texture
+
+    address: The address of the SDL object
+    kind: "surface" or "texture"
+    size: How many bytes of pixel memory it takes up
+    owner: A weak reference to the object that owns it
+    owner_class: The class name of the owner
+    """
+
+    __slots__ = ("address", "kind", "size", "owner", "owner_class")
+
+    def __init__(
+        self, *args, address: int, kind: str, size: int, owner: weakref.ref
+    ) -> None:
+        self.address: int = address
+        self.kind: str = kind
+        self.size: int = size
+        self.owner: weakref.ref = owner
+        self.owner_class: str = "?"
+
+        owner_obj: Any = owner()
+        if owner_obj is not None:
+            self.owner_class = type(owner_obj).__name__
+
+
+class MemoryTracker:
+    """Keeps track of every SDL surface and texture ComPyGUI allocates: how
+    much memory they take up in total, per owner, per class and per window,
+    the peak total and which allocations have outlived their owners.
+
+    Caches of re-creatable surfaces (glyphs, pre-rendered layers, ...) can
+    register an evictor with add_evictor(). Once the total goes over the
+    budget, enforce_budget() (called by ComPyGUIApp() once per frame, on the
+    main thread) asks the evictors to free memory until it's back under it.
+
+    budget: The number of bytes above which cached surfaces get evicted
+        (None for no limit)
+    """
+
+    def __init__(self, *args, budget: int | None = None) -> None:
+        self.budget: int | None = budget
+
+        self.current_bytes: int = 0
+        self.peak_bytes: int = 0
+
+        self._allocations: dict[int, Allocation] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+        self._evictors: list[weakref.ref | Callable[[int], int]] = []
+        self._roots: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self._allocations)
+
+    def track(
+        self, resource: Any, owner: Any, *args, kind: str = "surface", size: int
+    ) -> None:
+        """Starts tracking a surface or texture
+
+        resource: The SDL_Surface or SDL_Texture pointer
+        owner: The object responsible for freeing it
+        kind: "surface" or "texture"
+        size: How many bytes of pixel memory it takes up
+        """
+
+        allocation: Allocation = Allocation(
+            address=_address(resource), kind=kind, size=size, owner=weakref.ref(owner)
+        )
+
+        with self._lock:
+            old: Allocation | None = self._allocations.get(allocation.address)
+            if old is not None:
+                # Freed behind our back and the address got reused
+                self.current_bytes -= old.size
+
+            self._allocations[allocation.address] = allocation
+            self.current_bytes += size
+            if self.current_bytes > self.peak_bytes:
+                self.peak_bytes = self.current_bytes
+
+    def untrack(self, resource: Any) -> None:
+        """Stops tracking a surface or texture (before it gets freed)
+
+        resource: The SDL_Surface or SDL_Texture pointer
+        """
+
+        with self._lock:
+            allocation: Allocation | None = self._allocations.pop(
+                _address(resource), None
+            )
+            if allocation is not None:
+                self.current_bytes -= allocation.size
+
+    def untrack_many(self, resources: list[Any]) -> None:
+        """Like untrack(), but for a batch of surfaces/textures at once
+
+        resources: The SDL_Surface or SDL_Texture pointers
+        """
+
+        addresses: list[int] = [_address(resource) for resource in resources]
+        with self._lock:
+            for address in addresses:
+                allocation: Allocation | None = self._allocations.pop(address, None)
+                if allocation is not None:
+                    self.current_bytes -= allocation.size
+
+    def reset_peak(self) -> None:
+        """Resets the peak total to the current total"""
+        self.peak_bytes = self.current_bytes
+
+    def add_evictor(self, evictor: Callable[[int], int]) -> None:
+        """Registers a cache that can free memory when the budget is exceeded.
+        Bound methods are only weakly referenced.
+
+        evictor: A function that gets the number of bytes that should be freed
+            and returns how many bytes it actually freed
+        """
+
+        if hasattr(evictor, "__self__"):
+            self._evictors.append(weakref.WeakMethod(evictor))  # type: ignore
+        else:
+            self._evictors.append(evictor)
+
+    def remove_evictor(self, evictor: Callable[[int], int]) -> None:
+        """Unregisters a cache registered with add_evictor()
+
+        evictor: The function passed to add_evictor()
+        """
+
+        self._evictors = [
+            registered
+            for registered in self._evictors
+            if (
+                registered() if isinstance(registered, weakref.WeakMethod) else registered
+            )
+            != evictor
+        ]
+
+    def enforce_budget(self) -> int:
+        """Asks the registered evictors to free memory until the total is back
+        under the budget. Returns how many bytes were freed. Evictors free
+        surfaces that might be in use, so only call this between frames.
+        """
+
+        if self.budget is None or self.current_bytes <= self.budget:
+            return 0
+
+        freed: int = 0
+        for registered in list(self._evictors):
+            evictor: Callable[[int], int] | None
+            if isinstance(registered, weakref.WeakMethod):
+                evictor = registered()
+                if evictor is None:
+                    self._evictors.remove(registered)
+                    continue
+            else:
+                evictor = registered  # type: ignore
+
+            freed += evictor(self.current_bytes - self.budget)
+            if self.current_bytes <= self.budget:
+                break
+
+        return freed
+
+    def label_root(self, root: Any, label: str) -> None:
+        """Names a VCT root (or a Window()), so allocations of everything
+        inside of it get attributed to it in by_window()
+
+        root: The root object, usually a Window()'s Viewport()
+        label: The name to attribute its allocations to
+        """
+
+        self._roots[root] = label
+
+    def _root_of(self, obj: Any) -> Any:
+        while getattr(obj, "parent", None) is not None:
+            obj = obj.parent
+        return obj
+
+    def allocations(self) -> list[Allocation]:
+        """Returns every allocation that is currently tracked"""
+
+        with self._lock:
+            return list(self._allocations.values())
+
+    def by_owner(self) -> list[tuple[Any, int]]:
+        """Returns (owner, bytes) for every live owner, largest first"""
+
+        totals: dict[int, tuple[Any, int]] = {}
+        for allocation in self.allocations():
+            owner: Any = allocation.owner()
+            if owner is not None:
+                total: int = totals.get(id(owner), (owner, 0))[1]
+                totals[id(owner)] = (owner, total + allocation.size)
+
+        return sorted(totals.values(), key=lambda item: item[1], reverse=True)
+
+    def by_class(self) -> dict[str, int]:
+        """Returns the bytes allocated by the instances of every owner class"""
+
+        totals: dict[str, int] = {}
+        for allocation in self.allocations():
+            totals[allocation.owner_class] = (
+                totals.get(allocation.owner_class, 0) + allocation.size
+            )
+        return totals
+
+    def by_window(self) -> dict[str, int]:
+        """Returns the bytes allocated inside every labelled root (see
+        label_root()). Everything else is counted under "(detached)".
+        """
+
+        totals: dict[str, int] = {}
+        for allocation in self.allocations():
+            owner: Any = allocation.owner()
+            label: str = "(detached)"
+            if owner is not None:
+                label = self._roots.get(self._root_of(owner), label)
+            totals[label] = totals.get(label, 0) + allocation.size
+        return totals
+
+    def leaks(self) -> list[tuple[Allocation, str]]:
+        """Returns every allocation whose owner is gone, destroyed or no
+        longer part of any labelled root, together with the reason
+        """
+
+        found: list[tuple[Allocation, str]] = []
+        for allocation in self.allocations():
+            owner: Any = allocation.owner()
+            if owner is None:
+                found.append((allocation, "owner was garbage collected"))
+            elif getattr(owner, "destroyed", False):
+                found.append((allocation, "owner was destroyed"))
+            elif hasattr(owner, "parent") and self._root_of(owner) not in self._roots:
+                found.append((allocation, "owner is not part of any window"))
+        return found
+
+    def report(self) -> str:
+        """Returns a human-readable summary of the tracked memory and leaks"""
+
+        lines: list[str] = [
+            f"{len(self)} allocations, {self.current_bytes / 1024:.1f} KiB "
+            f"(peak {self.peak_bytes / 1024:.1f} KiB"
+            + (
+                f", budget {self.budget / 1024:.1f} KiB)"
+                if self.budget is not None
+                else ")"
+            ),
+            "By window:",
+        ]
+        for label, total in sorted(self.by_window().items()):
+            lines.append(f"  {label}: {total / 1024:.1f} KiB")
+
+        lines.append("By class:")
+        for name, total in sorted(
+            self.by_class().items(), key=lambda item: item[1], reverse=True
+        ):
+            lines.append(f"  {name}: {total / 1024:.1f} KiB")
+
+        leaks: list[tuple[Allocation, str]] = self.leaks()
+        lines.append(f"Possible leaks: {len(leaks)}")
+        for allocation, reason in leaks:
+            lines.append(
+                f"  {allocation.kind} at {hex(allocation.address)} "
+                f"({allocation.size / 1024:.1f} KiB, {allocation.owner_class}): {reason}"
+            )
+
+        return "\n".join(lines)
+
+
+tracker: MemoryTracker = MemoryTracker()
+"""The MemoryTracker() every ComPyGUI surface and texture is registered to"""
+
+
+def create_surface(
+    owner: Any, size: IVector2, bit_depth: int = 32, mask: RGBAMask = RGBAMask.RGBA()
+) -> SDL_Surface:
+    """Creates an SDL surface and registers it to the tracker
+
+    owner: The object responsible for freeing the surface with free_surface()
+    size: The size of the surface
+    bit_depth: The bit depth of the surface
+    mask: The RGBA mask/pixel format of the surface
+    """
+
+    with SDLErrorDetector("Could not create surface"):
+        surface: SDL_Surface = SDL_CreateRGBSurface(
+            0, size.x, size.y, bit_depth, mask.r, mask.g, mask.b, mask.a
+        )
+
+    tracker.track(
+        surface, owner, size=surface.contents.pitch * surface.contents.h
+    )
+    return surface
+
+
+def free_surface(surface: SDL_Surface) -> None:
+    """Unregisters and frees a surface created with create_surface()
+
+    surface: The surface to free
+    """
+
+    tracker.untrack(surface)
+    SDL_FreeSurface(surface)
+
+
+def free_surfaces(surfaces: list[SDL_Surface]) -> None:
+    """Unregisters and frees a batch of surfaces created with create_surface()
+
+    surfaces: The surfaces to free
+    """
+
+    tracker.untrack_many(surfaces)
+    for surface in surfaces:
+        SDL_FreeSurface(surface)
+
+
+def track_texture(texture: SDL_Texture, owner: Any, size: IVector2) -> None:
+    """Registers a (32-bit) texture to the tracker
+
+    texture: The texture to register
+    owner: The object responsible for freeing the texture with free_texture()
+    size: The size of the texture
+    """
+
+    tracker.track(texture, owner, kind="texture", size=size.x * size.y * 4)
+
+
+def free_texture(texture: SDL_Texture) -> None:
+    """Unregisters and destroys a texture registered with track_texture()
+
+    texture: The texture to free
+    """
+
+    tracker.untrack(texture)
+    SDL_DestroyTexture(texture)
@@ -0,0 +1,247 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import json
+import os
+import threading
+import time
+from array import array
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+
+NULL_SPAN: AbstractContextManager = nullcontext()
+"""The (reusable) span returned by a FrameProfiler() that isn't recording"""
+
+
+class _Span:
+    """Times one span of work for a FrameProfiler()"""
+
+    __slots__ = ("profiler", "name", "category", "start")
+
+    def __init__(self, profiler: FrameProfiler, name: str, category: str) -> None:
+        self.profiler: FrameProfiler = profiler
+        self.name: str = name
+        self.category: str = category
+        self.start: int = 0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *args) -> None:
+        self.profiler.record(
+            self.name, self.category, self.start, time.perf_counter_ns()
+        )
+
+
+class FrameProfiler:
+    """Times the phases of every frame, keeping the most recent samples in
+    fixed-size ring buffers for rolling percentiles and Chrome trace export.
+
+    A disabled FrameProfiler() only costs an attribute check per span,
+    so it can be left in place in production and enabled when needed.
+
+    enabled: Whether spans get recorded
+    capacity: How many samples are kept per span name
+    trace_capacity: How many spans are kept for trace export
+    trace_components: If True, every GUIComponent()'s calculate() and
+        render() get timed too
+    trace_listeners: If True, every EventQueue() listener callback gets timed too
+    """
+
+    def __init__(
+        self,
+        *args,
+        enabled: bool = False,
+        capacity: int = 600,
+        trace_capacity: int = 65536,
+        trace_components: bool = False,
+        trace_listeners: bool = False,
+    ) -> None:
+        self.enabled: bool = enabled
+        self.capacity: int = capacity
+        self.trace_capacity: int = trace_capacity
+        self.trace_components: bool = trace_components
+        self.trace_listeners: bool = trace_listeners
+
+        self.frame: int = 0
+
+        self._origin: int = time.perf_counter_ns()
+        self._lock: threading.Lock = threading.Lock()
+
+        self._samples: dict[str, array] = {}
+        self._sample_counts: dict[str, int] = {}
+
+        self._trace: list[tuple | None] = [None] * trace_capacity
+        self._trace_count: int = 0
+
+    def span(self, name: str, category: str = "phase") -> AbstractContextManager:
+        """Returns a context manager that times the work done inside it
+
+        name: The name of the span (e.g. the frame phase)
+        category: The category of the span, shown in trace viewers
+        """
+
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, category)
+
+    def component_span(self, name: str) -> AbstractContextManager:
+        """Like span(), but only records if trace_components is True"""
+
+        if not self.enabled or not self.trace_components:
+            return NULL_SPAN
+        return _Span(self, name, "component")
+
+    def listener_span(self, name: str) -> AbstractContextManager:
+        """Like span(), but only records if trace_listeners is True"""
+
+        if not self.enabled or not self.trace_listeners:
+            return NULL_SPAN
+        return _Span(self, name, "listener")
+
+    def record(self, name: str, category: str, start: int, end: int) -> None:
+        """Records a finished span
+
+        name: The name of the span
+        category: The category of the span
+        start: The perf_counter_ns() value the span started at
+        end: The perf_counter_ns() value the span ended at
+        """
+
+        with self._lock:
+            samples: array | None = self._samples.get(name)
+            if samples is None:
+                samples = array("d", bytes(8 * self.capacity))
+                self._samples[name] = samples
+                self._sample_counts[name] = 0
+
+            count: int = self._sample_counts[name]
+            samples[count % self.capacity] = (end - start) / 1e9
+            self._sample_counts[name] = count + 1
+
+            self._trace[self._trace_count % self.trace_capacity] = (
+                name,
+                category,
+                start,
+                end,
+                threading.get_ident(),
+                self.frame,
+            )
+            self._trace_count += 1
+
+    def next_frame(self) -> None:
+        """Marks the start of a new frame"""
+        self.frame += 1
+
+    def names(self) -> list[str]:
+        """Returns the names of every span recorded so far"""
+        return list(self._samples)
+
+    def samples(self, name: str) -> list[float]:
+        """Returns the kept durations (in seconds) of a span, oldest first
+
+        name: The name of the span
+        """
+
+        with self._lock:
+            samples: array | None = self._samples.get(name)
+            if samples is None:
+                return []
+
+            count: int = self._sample_counts[name]
+            if count <= self.capacity:
+                return list(samples[:count])
+
+            split: int = count % self.capacity
+            return list(samples[split:]) + list(samples[:split])
+
+    def percentiles(
+        self, name: str, percents: tuple[float, ...] = (50, 90, 99)
+    ) -> dict[float, float]:
+        """Returns rolling percentiles (in seconds) of a span's duration
+
+        name: The name of the span
+        percents: The percentiles to compute
+        """
+
+        ordered: list[float] = sorted(self.samples(name))
+        if not ordered:
+            return {percent: 0.0 for percent in percents}
+
+        return {
+            percent: ordered[
+                min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+            ]
+            for percent in percents
+        }
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns the mean, p50, p90 and p99 duration (in seconds) of every span"""
+
+        result: dict[str, dict[str, float]] = {}
+        for name in self.names():
+            samples: list[float] = self.samples(name)
+            stats: dict[float, float] = self.percentiles(name)
+            result[name] = {
+                "count": len(samples),
+                "mean": sum(samples) / len(samples) if samples else 0.0,
+                "p50": stats[50],
+                "p90": stats[90],
+                "p99": stats[99],
+            }
+        return result
+
+    def clear(self) -> None:
+        """Throws away every recorded sample and span"""
+
+        with self._lock:
+            self._samples.clear()
+            self._sample_counts.clear()
+            self._trace = [None] * self.trace_capacity
+            self._trace_count = 0
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Returns the kept spans in the Chrome trace-event format
+        (open in chrome://tracing or https://ui.perfetto.dev)
+        """
+
+        with self._lock:
+            if self._trace_count <= self.trace_capacity:
+                spans: list[tuple | None] = self._trace[: self._trace_count]
+            else:
+                split: int = self._trace_count % self.trace_capacity
+                spans = self._trace[split:] + self._trace[:split]
+
+        pid: int = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span[0],
+                    "cat": span[1],
+                    "ph": "X",
+                    "ts": (span[2] - self._origin) / 1000,
+                    "dur": (span[3] - span[2]) / 1000,
+                    "pid": pid,
+                    "tid": span[4],
+                    "args": {"frame": span[5]},
+                }
+                for span in spans
+                if span is not None
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Writes the kept spans to a Chrome trace-event JSON file
+
+        path: The path of the file to write
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
@@ -0,0 +1,310 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import struct
+import time
+from typing import Any, BinaryIO, Iterator
+
+from compygui.datatypes.vector2 import IVector2, Vector2
+from compygui.errors import ComPyGUIError
+
+_MAGIC: bytes = b"CPGI"
+_VERSION: int = 2
+
+# Record tags
+_FRAME: int = 0
+_EVENT: int = 1
+_NAME: int = 2
+
+# Value tags
+_NONE: int = 0
+_FALSE: int = 1
+_TRUE: int = 2
+_INT: int = 3
+_FLOAT: int = 4
+_STR: int = 5
+_IVECTOR2: int = 6
+_VECTOR2: int = 7
+
+_HEADER = struct.Struct("<4sB")
+# tag, frame, delta, idle time, seconds since recording started
+_FRAME_RECORD = struct.Struct("<BIddd")
+# Version 1 frames didn't have the idle time
+_FRAME_RECORD_V1 = struct.Struct("<BIdd")
+# tag, seconds since recording started, event type name, window index,
+# number of data items
+_EVENT_RECORD = struct.Struct("<BdHhB")
+# tag, name id, length of the UTF-8 name
+_NAME_RECORD = struct.Struct("<BHB")
+_TAG = struct.Struct("<B")
+_NAME_ID = struct.Struct("<H")
+_INT_VALUE = struct.Struct("<q")
+_FLOAT_VALUE = struct.Struct("<d")
+_STR_LENGTH = struct.Struct("<I")
+_IVECTOR2_VALUE = struct.Struct("<ii")
+_VECTOR2_VALUE = struct.Struct("<dd")
+
+
+class RecordedEvent:
+    """An app event in an InputLog()
+
+    type: The type of the event
+    window: The index of the window it was for (in app.windows), or -1
+    data: The event data (without "window_id")
+    time: When it was fired, in seconds since the recording started
+    """
+
+    __slots__ = ("type", "window", "data", "time")
+
+    def __init__(
+        self, type: str, window: int, data: dict[str, Any], time: float
+    ) -> None:
+        self.type: str = type
+        self.window: int = window
+        self.data: dict[str, Any] = data
+        self.time: float = time
+
+
+class RecordedFrame:
+    """A frame in an InputLog(), with the events fired before it
+
+    delta: The delta time the frame was rendered with
+    time: When the frame started, in seconds since the recording started
+    events: The app events fired before the frame, in order
+    idle: How long the app waited while idle before the frame, in seconds
+        (timers count it on top of delta)
+    """
+
+    __slots__ = ("delta", "time", "events", "idle")
+
+    def __init__(
+        self,
+        delta: float,
+        time: float,
+        events: list[RecordedEvent],
+        idle: float = 0.0,
+    ) -> None:
+        self.delta: float = delta
+        self.time: float = time
+        self.events: list[RecordedEvent] = events
+        self.idle: float = idle
+
+
+class InputRecorder:
+    """Writes the app events translated from input (and the delta time of
+    every frame, and the time waited while idle before it) to a compact
+    binary log, which ComPyGUIApp().replay()
+    plays back - started with ComPyGUIApp().start_recording().
+
+    Event type and data key names are written once and referred to by a
+    number afterwards, and values are packed with struct, so a frame with
+    no input costs one 29 byte record.
+
+    path: The path of the log file to write
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.frames: int = 0
+        """How many frames have been recorded"""
+        self.events: int = 0
+        """How many events have been recorded"""
+
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self._names: dict[str, int] = {}
+        self._start: float = time.perf_counter()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def _name(self, name: str) -> int:
+        id: int | None = self._names.get(name)
+        if id is None:
+            id = self._names[name] = len(self._names)
+            encoded: bytes = name.encode("utf-8")
+            self._file.write(_NAME_RECORD.pack(_NAME, id, len(encoded)) + encoded)
+        return id
+
+    def _value(self, value: Any) -> bytes:
+        if value is None:
+            return _TAG.pack(_NONE)
+        if value is True or value is False:
+            return _TAG.pack(_TRUE if value else _FALSE)
+        if isinstance(value, int):
+            return _TAG.pack(_INT) + _INT_VALUE.pack(value)
+        if isinstance(value, float):
+            return _TAG.pack(_FLOAT) + _FLOAT_VALUE.pack(value)
+        if isinstance(value, str):
+            encoded: bytes = value.encode("utf-8")
+            return _TAG.pack(_STR) + _STR_LENGTH.pack(len(encoded)) + encoded
+        if isinstance(value, IVector2):
+            return _TAG.pack(_IVECTOR2) + _IVECTOR2_VALUE.pack(value.x, value.y)
+        if isinstance(value, Vector2):
+            return _TAG.pack(_VECTOR2) + _VECTOR2_VALUE.pack(value.x, value.y)
+        raise ComPyGUIError(f"Can't record event data of type {type(value).__name__}")
+
+    def record_event(self, type: str, window: int, data: dict[str, Any]) -> None:
+        """Records an app event fired before the next frame
+
+        type: The type of the event
+        window: The index of the window it's for (in app.windows), or -1
+        data: The event data (None, bools, ints, floats, strings and vectors)
+        """
+
+        if len(data) > 255:
+            raise ComPyGUIError("Can't record events with more than 255 data items")
+
+        record: list[bytes] = [
+            _EVENT_RECORD.pack(
+                _EVENT,
+                time.perf_counter() - self._start,
+                self._name(type),
+                window,
+                len(data),
+            )
+        ]
+        for key, value in data.items():
+            record.append(_NAME_ID.pack(self._name(key)))
+            record.append(self._value(value))
+
+        self._file.write(b"".join(record))
+        self.events += 1
+
+    def record_frame(self, delta: float, idle: float = 0.0) -> None:
+        """Records the start of a frame (ending the events fired before it)
+
+        delta: The delta time the frame is rendered with
+        idle: How long the app waited while idle before the frame, in seconds
+        """
+
+        self._file.write(
+            _FRAME_RECORD.pack(
+                _FRAME, self.frames, delta, idle, time.perf_counter() - self._start
+            )
+        )
+        self.frames += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        """Finishes the log"""
+        if not self._file.closed:
+            self._file.close()
+
+
+class InputLog:
+    """A log written by an InputRecorder(), read back into frames
+
+    frames: The recorded frames, in order
+    """
+
+    def __init__(self, frames: list[RecordedFrame]) -> None:
+        self.frames: list[RecordedFrame] = frames
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        return iter(self.frames)
+
+    @property
+    def duration(self) -> float:
+        """The sum of the recorded deltas, in seconds"""
+        return sum(frame.delta for frame in self.frames)
+
+    @staticmethod
+    def load(path: str) -> InputLog:
+        """Reads a log file. Events recorded after the last frame are dropped.
+
+        path: The path of the log file
+        """
+
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+
+        if len(data) < _HEADER.size:
+            raise ComPyGUIError(f"{path!r} is not an input log")
+        magic, version = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ComPyGUIError(f"{path!r} is not an input log")
+        if version not in (1, _VERSION):
+            raise ComPyGUIError(f"Unsupported input log version {version} in {path!r}")
+
+        names: dict[int, str] = {}
+        frames: list[RecordedFrame] = []
+        events: list[RecordedEvent] = []
+        offset: int = _HEADER.size
+        try:
+            while offset < len(data):
+                tag: int = data[offset]
+                if tag == _FRAME and version == 1:
+                    _, _, delta, at = _FRAME_RECORD_V1.unpack_from(data, offset)
+                    offset += _FRAME_RECORD_V1.size
+                    frames.append(RecordedFrame(delta, at, events))
+                    events = []
+                elif tag == _FRAME:
+                    _, _, delta, idle, at = _FRAME_RECORD.unpack_from(data, offset)
+                    offset += _FRAME_RECORD.size
+                    frames.append(RecordedFrame(delta, at, events, idle))
+                    events = []
+                elif tag == _NAME:
+                    _, id, length = _NAME_RECORD.unpack_from(data, offset)
+                    offset += _NAME_RECORD.size
+                    names[id] = data[offset : offset + length].decode("utf-8")
+                    offset += length
+                elif tag == _EVENT:
+                    _, at, type, window, count = _EVENT_RECORD.unpack_from(
+                        data, offset
+                    )
+                    offset += _EVENT_RECORD.size
+                    items: dict[str, Any] = {}
+                    for _ in range(count):
+                        key: int = _NAME_ID.unpack_from(data, offset)[0]
+                        value, offset = _read_value(data, offset + _NAME_ID.size)
+                        items[names[key]] = value
+                    events.append(RecordedEvent(names[type], window, items, at))
+                else:
+                    raise ComPyGUIError(f"Unknown record {tag} at byte {offset}")
+        except (struct.error, KeyError, UnicodeDecodeError) as error:
+            raise ComPyGUIError(
+                f"Input log {path!r} is corrupt at byte {offset}"
+            ) from error
+
+        return InputLog(frames)
+
+
+def _read_value(data: bytes, offset: int) -> tuple[Any, int]:
+    """Reads a value written by InputRecorder()._value() and returns it
+    along with the offset after it
+    """
+
+    tag: int = data[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _FALSE or tag == _TRUE:
+        return tag == _TRUE, offset
+    if tag == _INT:
+        return _INT_VALUE.unpack_from(data, offset)[0], offset + _INT_VALUE.size
+    if tag == _FLOAT:
+        return _FLOAT_VALUE.unpack_from(data, offset)[0], offset + _FLOAT_VALUE.size
+    if tag == _STR:
+        length: int = _STR_LENGTH.unpack_from(data, offset)[0]
+        offset += _STR_LENGTH.size
+        return data[offset : offset + length].decode("utf-8"), offset + length
+    if tag == _IVECTOR2:
+        x, y = _IVECTOR2_VALUE.unpack_from(data, offset)
+        return IVector2(x, y), offset + _IVECTOR2_VALUE.size
+    if tag == _VECTOR2:
+        x, y = _VECTOR2_VALUE.unpack_from(data, offset)
+        return Vector2(x, y), offset + _VECTOR2_VALUE.size
+    raise ComPyGUIError(f"Unknown value {tag} at byte {offset - 1}")
@@ -0,0 +1,379 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from sdl2.surface import SDL_Surface
+
+from compygui.compositor import (
+    BlendMode,
+    DisplayList,
+    channel_offsets,
+    composite_nine_slice,
+    fill,
+    surface_array,
+)
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+from compygui.errors import ComPyGUIError
+from compygui.memory import create_surface, free_surface, tracker
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ShapeCache:
+    """Rasterized pieces of shapes (rounded rectangles, borders, shadows),
+    keyed by everything that affects their pixels. A piece is a small
+    nine-slice: its corners are drawn as they are and its one pixel wide
+    edges and center get stretched, so a shape can be drawn at any size
+    from the same piece - resizing only changes how far the edges are
+    stretched.
+
+    Pieces are freed least recently used first once the cache takes up more
+    than budget bytes - only by trim(), which ComPyGUIApp() calls between
+    frames (a DisplayList() might still refer to them during one). The
+    cache is also registered to the memory tracker as an evictor.
+
+    Windows can be rasterized on different threads at the same time (see
+    ComPyGUIApp()'s window_render_workers), so the cache is guarded by a lock.
+
+    budget: How many bytes the pieces may take up
+    """
+
+    def __init__(self, *args, budget: int = 8 << 20) -> None:
+        self.budget: int = budget
+        self.bytes: int = 0
+        """How many bytes the pieces take up"""
+        self.rasterized: int = 0
+        """How many pieces have been rasterized so far"""
+
+        self._pieces: OrderedDict[tuple, SDL_Surface] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+        tracker.add_evictor(self.evict)
+
+    def __len__(self) -> int:
+        return len(self._pieces)
+
+    def get(self, key: tuple, rasterize: Callable[[], SDL_Surface]) -> SDL_Surface:
+        """Returns a cached piece, rasterizing it if it isn't cached
+
+        key: Everything the pixels of the piece depend on
+        rasterize: Creates the piece (with create_surface(), owned by the cache)
+        """
+
+        with self._lock:
+            piece: SDL_Surface | None = self._pieces.get(key)
+            if piece is not None:
+                self._pieces.move_to_end(key)
+                return piece
+
+            # Rasterized while holding the lock, so two threads never
+            # rasterize (and cache) the same piece
+            piece = rasterize()
+            self._pieces[key] = piece
+            self.bytes += piece.contents.pitch * piece.contents.h
+            self.rasterized += 1
+            return piece
+
+    def evict(self, wanted: int) -> int:
+        """Frees least recently used pieces until at least wanted bytes are
+        freed. Returns how many bytes were freed. Only call this between frames.
+
+        wanted: How many bytes to free
+        """
+
+        freed: int = 0
+        with self._lock:
+            while self._pieces and freed < wanted:
+                _, piece = self._pieces.popitem(last=False)
+                size: int = piece.contents.pitch * piece.contents.h
+                free_surface(piece)
+                self.bytes -= size
+                freed += size
+        return freed
+
+    def trim(self) -> int:
+        """Frees pieces until the cache is back under its budget. Returns
+        how many bytes were freed.
+        """
+
+        if self.bytes <= self.budget:
+            return 0
+        return self.evict(self.bytes - self.budget)
+
+    def clear(self) -> None:
+        """Frees every piece"""
+        self.evict(self.bytes)
+
+
+shape_cache: ShapeCache = ShapeCache()
+"""The ShapeCache() shared by every shape"""
+
+
+class DropShadow:
+    """The shadow a shape casts (see draw_shadow())
+
+    color: The color of the shadow (where it's fully covered)
+    blur: How far the shadow fades out past the shape, in pixels
+    offset: How far the shadow is moved from the shape
+    spread: How far the shadow is grown (or shrunk, if negative) before blurring
+    """
+
+    __slots__ = ("color", "blur", "offset", "spread")
+
+    def __init__(
+        self,
+        *args,
+        color: RGBAColor = RGBAColor(r=0, g=0, b=0, a=96),
+        blur: int = 8,
+        offset: IVector2 = IVector2(0, 2),
+        spread: int = 0,
+    ) -> None:
+        self.color: RGBAColor = color
+        self.blur: int = blur
+        self.offset: IVector2 = offset
+        self.spread: int = spread
+
+
+def _coverage(size: IVector2, inset: float, radius: float) -> numpy.ndarray:
+    """Returns how much of every pixel is covered by a rounded rectangle
+    that is inset into a rectangle of size (anti-aliased, from 0 to 1)
+    """
+
+    half_x: float = size.x / 2 - inset
+    half_y: float = size.y / 2 - inset
+    if half_x <= 0 or half_y <= 0:
+        return numpy.zeros((size.y, size.x))
+    radius = min(radius, half_x, half_y)
+
+    # Signed distance from every pixel center to the rounded rectangle
+    qx = numpy.abs(numpy.arange(size.x) + 0.5 - size.x / 2) - (half_x - radius)
+    qy = numpy.abs(numpy.arange(size.y) + 0.5 - size.y / 2) - (half_y - radius)
+    qx, qy = qx[None, :], qy[:, None]
+    outside = numpy.hypot(numpy.maximum(qx, 0), numpy.maximum(qy, 0))
+    inside = numpy.minimum(numpy.maximum(qx, qy), 0)
+    return numpy.clip(0.5 - (outside + inside - radius), 0.0, 1.0)
+
+
+def _box_blur(mask: numpy.ndarray, radius: int, axis: int) -> numpy.ndarray:
+    padding: list[tuple[int, int]] = [(0, 0), (0, 0)]
+    padding[axis] = (radius + 1, radius)
+    summed = numpy.cumsum(numpy.pad(mask, padding), axis=axis)
+    window: int = 2 * radius + 1
+    if axis == 0:
+        return (summed[window:] - summed[:-window]) / window
+    return (summed[:, window:] - summed[:, :-window]) / window
+
+
+def _write(
+    surface: SDL_Surface,
+    layers: list[tuple[numpy.ndarray, RGBAColor]],
+) -> None:
+    """Paints coverage masks (bottom to top) in their colors onto an empty
+    surface, with straight alpha
+    """
+
+    size: tuple[int, int] = layers[0][0].shape
+    alpha = numpy.zeros(size)
+    color = numpy.zeros(size + (3,))
+    for coverage, paint in layers:
+        a = coverage * (paint.a / 255)
+        # "Over" compositing, in premultiplied form
+        color = numpy.array([paint.r, paint.g, paint.b]) * a[..., None] + color * (
+            1 - a[..., None]
+        )
+        alpha = a + alpha * (1 - a)
+
+    safe = numpy.where(alpha > 0, alpha, 1)
+    color = color / safe[..., None]
+
+    pixels = surface_array(surface)
+    r, g, b, a_offset = channel_offsets(surface)
+    pixels[..., r] = numpy.rint(color[..., 0])
+    pixels[..., g] = numpy.rint(color[..., 1])
+    pixels[..., b] = numpy.rint(color[..., 2])
+    pixels[..., a_offset] = numpy.rint(alpha * 255)
+
+
+def _require_numpy() -> None:
+    if numpy is None:
+        raise ComPyGUIError("Rasterizing shapes requires NumPy")
+
+
+def _rounded_piece(
+    owner: ShapeCache,
+    size: IVector2,
+    radius: int,
+    color: RGBAColor,
+    border_width: int,
+    border_color: RGBAColor | None,
+) -> SDL_Surface:
+    _require_numpy()
+    piece: SDL_Surface = create_surface(owner, size)
+
+    outer = _coverage(size, 0, radius)
+    if border_width <= 0 or border_color is None:
+        _write(piece, [(outer, color)])
+    else:
+        inner = _coverage(size, border_width, max(0, radius - border_width))
+        # The border only covers what the fill doesn't
+        _write(
+            piece,
+            [(outer - numpy.minimum(inner, outer), border_color), (inner, color)],
+        )
+    return piece
+
+
+def _shadow_piece(
+    owner: ShapeCache, size: IVector2, radius: int, blur: int, color: RGBAColor
+) -> SDL_Surface:
+    _require_numpy()
+    piece: SDL_Surface = create_surface(owner, size)
+
+    mask = _coverage(size, blur, radius)
+    # Three box blurs are close enough to a gaussian one
+    box: int = max(1, blur // 3)
+    for _ in range(3):
+        mask = _box_blur(_box_blur(mask, box, 0), box, 1)
+    _write(piece, [(mask, color)])
+    return piece
+
+
+def _color_key(color: RGBAColor | None) -> tuple[int, int, int, int] | None:
+    return None if color is None else (color.r, color.g, color.b, color.a)
+
+
+def draw_rounded_rect(
+    dst: SDL_Surface | DisplayList,
+    rect: IRect2,
+    color: RGBAColor,
+    *args,
+    radius: int = 0,
+    border_width: int = 0,
+    border_color: RGBAColor | None = None,
+    mode: BlendMode = BlendMode.NORMAL,
+    opacity: float = 1.0,
+    cache: ShapeCache = shape_cache,
+) -> None:
+    """Draws a rectangle with (anti-aliased) rounded corners and an optional
+    border inside of its edges, from a cached piece
+
+    dst: The surface to draw onto, or a DisplayList() to record into
+    rect: The rectangle to draw
+    color: The fill color
+    radius: The radius of the corners in pixels
+    border_width: The width of the border in pixels (0 for no border)
+    border_color: The color of the border (None for no border)
+    mode: The blend mode to use
+    opacity: How opaque the rectangle is drawn, from 0 to 1
+    cache: The ShapeCache() to take the piece from
+    """
+
+    if rect.w <= 0 or rect.h <= 0:
+        return
+
+    if border_color is None:
+        border_width = 0
+    if radius <= 0 and border_width <= 0:
+        if opacity < 1:
+            color = RGBAColor(
+                r=color.r, g=color.g, b=color.b, a=round(color.a * opacity)
+            )
+        fill(dst, rect, color, mode)
+        return
+
+    corner: int = max(radius, border_width)
+    size: IVector2 = IVector2(2 * corner + 1, 2 * corner + 1)
+    if rect.w < size.x or rect.h < size.y:
+        # Too small for the corners - this size gets a piece of its own
+        size = rect.size()
+
+    key: tuple = (
+        "rounded",
+        size.x,
+        size.y,
+        radius,
+        _color_key(color),
+        border_width,
+        _color_key(border_color),
+    )
+    piece: SDL_Surface = cache.get(
+        key,
+        lambda: _rounded_piece(cache, size, radius, color, border_width, border_color),
+    )
+    inset: int = min(corner, size.x // 2, size.y // 2)
+    composite_nine_slice(
+        piece, dst, rect, (inset, inset, inset, inset), mode, opacity=opacity
+    )
+
+
+def draw_shadow(
+    dst: SDL_Surface | DisplayList,
+    rect: IRect2,
+    shadow: DropShadow,
+    *args,
+    radius: int = 0,
+    opacity: float = 1.0,
+    cache: ShapeCache = shape_cache,
+) -> None:
+    """Draws the shadow a (rounded) rectangle casts, from a cached piece.
+    The shadow reaches shadow.blur pixels past the (moved and spread) rectangle.
+
+    dst: The surface to draw onto, or a DisplayList() to record into
+    rect: The rectangle casting the shadow
+    shadow: What the shadow looks like
+    radius: The corner radius of the rectangle
+    opacity: How opaque the shadow is drawn, from 0 to 1
+    cache: The ShapeCache() to take the piece from
+    """
+
+    blur: int = max(0, shadow.blur)
+    spread: int = shadow.spread
+    radius = max(0, radius + spread)
+    area: IRect2 = IRect2(
+        rect.x + shadow.offset.x - spread - blur,
+        rect.y + shadow.offset.y - spread - blur,
+        rect.w + 2 * (spread + blur),
+        rect.h + 2 * (spread + blur),
+    )
+    if area.w <= 2 * blur or area.h <= 2 * blur:
+        return
+
+    if blur == 0:
+        draw_rounded_rect(
+            dst, area, shadow.color, radius=radius, opacity=opacity, cache=cache
+        )
+        return
+
+    # The blur reaches blur pixels in both directions of the shape's edge
+    corner: int = radius + 2 * blur
+    size: IVector2 = IVector2(2 * corner + 1, 2 * corner + 1)
+    if area.w < size.x or area.h < size.y:
+        size = area.size()
+
+    key: tuple = ("shadow", size.x, size.y, radius, blur, _color_key(shadow.color))
+    piece: SDL_Surface = cache.get(
+        key, lambda: _shadow_piece(cache, size, radius, blur, shadow.color)
+    )
+    inset: int = min(corner, size.x // 2, size.y // 2)
+    composite_nine_slice(
+        piece,
+        dst,
+        area,
+        (inset, inset, inset, inset),
+        BlendMode.NORMAL,
+        opacity=opacity,
+    )
@@ -0,0 +1,1057 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import ctypes
+import importlib
+import inspect
+import mmap
+import os
+import struct
+import time
+from enum import Enum
+from typing import Any, Iterable
+
+from sdl2.surface import (
+    SDL_MUSTLOCK,
+    SDL_CreateRGBSurface,
+    SDL_CreateRGBSurfaceFrom,
+    SDL_FreeSurface,
+    SDL_LockSurface,
+    SDL_Surface,
+    SDL_UnlockSurface,
+)
+
+from compygui.component import Component
+from compygui.compositor import BlendMode, DisplayList, composite
+from compygui.datatypes.rect2 import IRect2
+from compygui.datatypes.rgba import RGBAColor, RGBAMask
+from compygui.datatypes.vector2 import IVector2, Vector2
+from compygui.errors import ComPyGUIError, SDLError
+from compygui.events import Event, EventListener, EventType
+from compygui.font import Font, load_font
+from compygui.guicomponent import GUIComponent
+from compygui.layout import Constraints
+from compygui.reconcile import Element
+
+_MAGIC: bytes = b"CPGS"
+_VERSION: int = 1
+
+# magic, version, viewport size, mask, number of nodes, number of names,
+# length of the UTF-8 tag, offset of the node table
+_HEADER = struct.Struct("<4sB3xiiIIIIIIIQ")
+# type name, flags, offset of the node after the subtree, position, layout
+# size, constraints (min, max), anchor point, offset and length of the
+# props, offset of the layer pixels, area of the layer (relative to the
+# top-left corner)
+_NODE = struct.Struct("<HBxIiiiiiiiiddQIQiiii")
+_NAME_LENGTH = struct.Struct("<H")
+
+# Node flags
+_GUI: int = 1
+_VISIBLE: int = 2
+_LAID_OUT: int = 4
+_LAYER: int = 8
+
+# Value tags
+_NONE: int = 0
+_FALSE: int = 1
+_TRUE: int = 2
+_INT: int = 3
+_FLOAT: int = 4
+_STR: int = 5
+_IVECTOR2: int = 6
+_VECTOR2: int = 7
+_RGBACOLOR: int = 8
+_TUPLE: int = 9
+_LIST: int = 10
+_ENUM: int = 11
+_FONT: int = 12
+_REF: int = 13
+_OBJECT: int = 14
+
+_TAG = struct.Struct("<B")
+_NAME_ID = struct.Struct("<H")
+_COUNT = struct.Struct("<I")
+_INT_VALUE = struct.Struct("<q")
+_FLOAT_VALUE = struct.Struct("<d")
+_IVECTOR2_VALUE = struct.Struct("<ii")
+_VECTOR2_VALUE = struct.Struct("<dd")
+_RGBACOLOR_VALUE = struct.Struct("<BBBB")
+_FONT_VALUE = struct.Struct("<ii")
+
+# Layers start on a cache line
+_LAYER_ALIGN: int = 64
+# How far past its rect a component is captured (for shadows, ...)
+_LAYER_MARGIN: int = 64
+
+
+def _path_of(value: Any) -> str:
+    return f"{value.__module__}:{value.__qualname__}"
+
+
+def _resolve(path: str) -> Any:
+    module, _, qualname = path.partition(":")
+    value: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        value = getattr(value, part)
+    return value
+
+
+def _in_modules(module: str, modules: tuple[str, ...]) -> bool:
+    return any(module == name or module.startswith(name + ".") for name in modules)
+
+
+class _Names:
+    """The name table of a snapshot being written - type paths and prop
+    names are written once and referred to by a number everywhere else
+    """
+
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+
+    def id(self, name: str) -> int:
+        id: int | None = self.ids.get(name)
+        if id is None:
+            if len(self.ids) > 0xFFFF:
+                raise ComPyGUIError("Can't snapshot more than 65536 distinct names")
+            id = self.ids[name] = len(self.ids)
+        return id
+
+    def ref(self, value: Any) -> int:
+        """The name id of a module-level class or function"""
+
+        path: str = _path_of(value)
+        if "<" in path:
+            raise ComPyGUIError(
+                f"Can't snapshot {value!r} (it's not defined at the top level "
+                "of a module)"
+            )
+        try:
+            found: Any = _resolve(path)
+        except (ImportError, AttributeError):
+            found = None
+        if found is not value:
+            raise ComPyGUIError(
+                f"Can't snapshot {value!r} (it can't be imported as {path!r})"
+            )
+        return self.id(path)
+
+
+def _encode(value: Any, names: _Names) -> bytes:
+    if value is None:
+        return _TAG.pack(_NONE)
+    if value is True or value is False:
+        return _TAG.pack(_TRUE if value else _FALSE)
+    if isinstance(value, Enum):
+        return (
+            _TAG.pack(_ENUM)
+            + _NAME_ID.pack(names.ref(type(value)))
+            + _encode(value.value, names)
+        )
+    if isinstance(value, int):
+        return _TAG.pack(_INT) + _INT_VALUE.pack(value)
+    if isinstance(value, float):
+        return _TAG.pack(_FLOAT) + _FLOAT_VALUE.pack(value)
+    if isinstance(value, str):
+        encoded: bytes = value.encode("utf-8")
+        return _TAG.pack(_STR) + _COUNT.pack(len(encoded)) + encoded
+    if type(value) is IVector2:
+        return _TAG.pack(_IVECTOR2) + _IVECTOR2_VALUE.pack(value.x, value.y)
+    if type(value) is Vector2:
+        return _TAG.pack(_VECTOR2) + _VECTOR2_VALUE.pack(value.x, value.y)
+    if type(value) is RGBAColor:
+        return _TAG.pack(_RGBACOLOR) + _RGBACOLOR_VALUE.pack(
+            value.r, value.g, value.b, value.a
+        )
+    if type(value) is tuple or type(value) is list:
+        return b"".join(
+            [
+                _TAG.pack(_TUPLE if type(value) is tuple else _LIST),
+                _COUNT.pack(len(value)),
+                *(_encode(item, names) for item in value),
+            ]
+        )
+    if isinstance(value, Font):
+        # Shared through load_font() again when it's loaded
+        return (
+            _TAG.pack(_FONT)
+            + _FONT_VALUE.pack(value.size, value.index)
+            + _encode(value.path, names)
+        )
+    if isinstance(value, type) or callable(value):
+        return _TAG.pack(_REF) + _NAME_ID.pack(names.ref(value))
+
+    # Plain objects (LayoutParams(), DropShadow(), ...) are written
+    # attribute by attribute
+    attributes: dict[str, Any]
+    if hasattr(value, "__dict__"):
+        attributes = dict(vars(value))
+    else:
+        attributes = {}
+        for cls in type(value).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if hasattr(value, slot):
+                    attributes[slot] = getattr(value, slot)
+        if not attributes and not getattr(type(value), "__slots__", None):
+            raise ComPyGUIError(f"Can't snapshot values of type {type(value).__name__}")
+
+    record: list[bytes] = [
+        _TAG.pack(_OBJECT),
+        _NAME_ID.pack(names.ref(type(value))),
+        _COUNT.pack(len(attributes)),
+    ]
+    for name, attribute in attributes.items():
+        record.append(_NAME_ID.pack(names.id(name)))
+        record.append(_encode(attribute, names))
+    return b"".join(record)
+
+
+def _read_pixels(surface: SDL_Surface) -> bytes:
+    """Returns a copy of the pixels of a 32-bit surface, without row padding"""
+
+    surf = surface.contents
+    row: int = surf.w * 4
+
+    must_lock: bool = SDL_MUSTLOCK(surf)
+    if must_lock:
+        SDL_LockSurface(surface)
+    try:
+        if surf.pitch == row:
+            return ctypes.string_at(surf.pixels, row * surf.h)
+        return b"".join(
+            ctypes.string_at(surf.pixels + y * surf.pitch, row) for y in range(surf.h)
+        )
+    finally:
+        if must_lock:
+            SDL_UnlockSurface(surface)
+
+
+def _ink(pixels: bytes, width: int, height: int) -> IRect2 | None:
+    """The area of a 32-bit image that isn't fully transparent (all zero)"""
+
+    row: int = width * 4
+    rows: list[int] = [
+        y for y in range(height) if pixels.count(0, y * row, (y + 1) * row) != row
+    ]
+    if not rows:
+        return None
+
+    left: int = row
+    right: int = 0
+    for y in rows:
+        line: bytes = pixels[y * row : (y + 1) * row]
+        left = min(left, row - len(line.lstrip(b"\0")))
+        right = max(right, len(line.rstrip(b"\0")))
+    left //= 4
+    right = (right + 3) // 4
+    return IRect2(left, rows[0], right - left, rows[-1] + 1 - rows[0])
+
+
+def _capture(component: GUIComponent, mask: RGBAMask) -> tuple[IRect2, bytes] | None:
+    """Renders a GUIComponent() (as it's composited onto its parent) onto a
+    transparent surface and returns the area that was drawn on (relative to
+    its top-left corner) and its pixels, or None if nothing was drawn
+    """
+
+    size: IVector2 = component._calculated_size
+    width: int = size.x + _LAYER_MARGIN * 2
+    height: int = size.y + _LAYER_MARGIN * 2
+    surface: SDL_Surface = SDL_CreateRGBSurface(
+        0, width, height, 32, mask.r, mask.g, mask.b, mask.a
+    )
+    if not surface:
+        raise SDLError.from_sdl_geterror("Failed to create snapshot layer surface")
+
+    position: IVector2 = component.position
+    try:
+        # Moves its top-left corner to (_LAYER_MARGIN, _LAYER_MARGIN)
+        component.position = (
+            position - component.topleft + IVector2(_LAYER_MARGIN, _LAYER_MARGIN)
+        )
+        component.render(0, surface)
+        pixels: bytes = _read_pixels(surface)
+    finally:
+        component.position = position
+        SDL_FreeSurface(surface)
+
+    ink: IRect2 | None = _ink(pixels, width, height)
+    if ink is None:
+        return None
+
+    row: int = width * 4
+    layer: bytes = b"".join(
+        pixels[y * row + ink.x * 4 : y * row + (ink.x + ink.w) * 4]
+        for y in range(ink.y, ink.y + ink.h)
+    )
+    return ink.offset(IVector2(-_LAYER_MARGIN, -_LAYER_MARGIN)), layer
+
+
+def _viewport_size(parent: Component) -> IVector2:
+    node: Component | None = parent
+    while isinstance(node, GUIComponent):
+        node = node.parent
+    size: Any = getattr(node, "size", None)
+    if not isinstance(size, IVector2):
+        raise ComPyGUIError("Can't snapshot components that aren't in a viewport")
+    return size
+
+
+def save_snapshot(
+    path: str,
+    parent: Component,
+    *args,
+    tag: str = "",
+    layers: bool | Iterable[Component] = True,
+    mask: RGBAMask = RGBAMask.RGBA(),
+) -> None:
+    """Writes the children of parent (built with reconcile()) to a layout
+    snapshot file, which LayoutSnapshot.load() reads back on the next
+    launch. Call it once the children were laid out and rendered.
+
+    For every component, the snapshot holds its type, key and props (from
+    the Element() it was built from - props set on it directly afterwards
+    aren't included), its layout (position, size and constraints) and whether
+    it's visible. Children that weren't built by reconcile() are left out.
+    Props can be None, bools, numbers, strings, vectors, colors, tuples,
+    lists, enums, Font()s, module-level classes and functions, and plain
+    objects (like LayoutParams()) made of those. Classes and functions
+    outside of compygui are only loaded back if their modules are passed
+    to LayoutSnapshot.load().
+
+    The file is replaced atomically, so a snapshot that's loaded from the
+    same path can stay in use.
+
+    path: The path of the file to write
+    parent: The Component() whose children to save (a Viewport(), for example)
+    tag: Identifies the version of the app that wrote the snapshot -
+        LayoutSnapshot.load() ignores snapshots with a different tag
+    layers: Which components get rasterized into static layers, which are
+        shown until they're hydrated: True for every child of parent, False
+        for none, or the components themselves
+    mask: The pixel format of the layers
+    """
+
+    size: IVector2 = _viewport_size(parent)
+    layered: set[Component]
+    if layers is True:
+        layered = set(parent.children)
+    elif layers is False:
+        layered = set()
+    else:
+        layered = set(layers)
+
+    # Placeholders of a loaded snapshot become what they stand for first
+    for child in list(parent.children):
+        if isinstance(child, GUISnapshot):
+            layered.discard(child)
+            built: Component = child.hydrate()
+            if layers is True:
+                layered.add(built)
+
+    names: _Names = _Names()
+    nodes: list[list[Any]] = []
+    props: list[bytes] = []
+    pixels: list[bytes] = []
+    props_size: int = 0
+
+    def visit(component: Component) -> None:
+        nonlocal props_size
+
+        if isinstance(component, GUISnapshot):
+            component = component.hydrate()
+        element: Element = component._element
+
+        encoded: list[bytes] = [
+            _encode(element.key, names),
+            _COUNT.pack(len(element.props)),
+        ]
+        for name, value in element.props.items():
+            try:
+                encoded.append(_NAME_ID.pack(names.id(name)) + _encode(value, names))
+            except ComPyGUIError as error:
+                raise ComPyGUIError(
+                    f"Can't snapshot prop {name!r} of "
+                    f"{type(component).__name__}: {error}"
+                ) from error
+        blob: bytes = b"".join(encoded)
+
+        flags: int = 0
+        position: IVector2 = IVector2.ZERO()
+        layout_size: IVector2 = IVector2.ZERO()
+        constraints: Constraints = Constraints(max=IVector2.ZERO())
+        anchor: Vector2 = Vector2.ZERO()
+        layer: bytes = b""
+        area: IRect2 = IRect2(0, 0, 0, 0)
+        if isinstance(component, GUIComponent):
+            flags |= _GUI
+            if component._visible:
+                flags |= _VISIBLE
+            position = component.position
+            anchor = component.anchor_point
+            layout_size = component._layout_size
+            if component._constraints is not None and not component._layout_dirty:
+                flags |= _LAID_OUT
+                constraints = component._constraints
+            captured: tuple[IRect2, bytes] | None = (
+                _capture(component, mask) if component in layered else None
+            )
+            if captured is not None:
+                flags |= _LAYER
+                area, layer = captured
+
+        record: list[Any] = [
+            names.ref(element.type),
+            flags,
+            0,
+            position.x,
+            position.y,
+            layout_size.x,
+            layout_size.y,
+            constraints.min.x,
+            constraints.min.y,
+            constraints.max.x,
+            constraints.max.y,
+            anchor.x,
+            anchor.y,
+            props_size,
+            len(blob),
+            0,
+            area.x,
+            area.y,
+            area.w,
+            area.h,
+        ]
+        nodes.append(record)
+        props.append(blob)
+        pixels.append(layer)
+        props_size += len(blob)
+
+        for child in list(component.children):
+            if child._element is not None:
+                visit(child)
+        record[2] = len(nodes)
+
+    for child in list(parent.children):
+        if child._element is not None:
+            visit(child)
+
+    encoded_tag: bytes = tag.encode("utf-8")
+    encoded_names: bytes = b"".join(
+        _NAME_LENGTH.pack(len(encoded)) + encoded
+        for encoded in (name.encode("utf-8") for name in names.ids)
+    )
+    nodes_offset: int = _HEADER.size + len(encoded_tag) + len(encoded_names)
+    nodes_offset += -nodes_offset % 8
+    props_offset: int = nodes_offset + len(nodes) * _NODE.size
+
+    offset: int = props_offset + props_size
+    for record, layer in zip(nodes, pixels):
+        record[13] += props_offset
+        if layer:
+            offset += -offset % _LAYER_ALIGN
+            record[15] = offset
+            offset += len(layer)
+
+    temporary: str = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    size.x,
+                    size.y,
+                    mask.r,
+                    mask.g,
+                    mask.b,
+                    mask.a,
+                    len(nodes),
+                    len(names.ids),
+                    len(encoded_tag),
+                    nodes_offset,
+                )
+            )
+            file.write(encoded_tag)
+            file.write(encoded_names)
+            file.write(bytes(nodes_offset - file.tell()))
+            file.write(b"".join(_NODE.pack(*record) for record in nodes))
+            file.write(b"".join(props))
+            for record, layer in zip(nodes, pixels):
+                if layer:
+                    file.write(bytes(record[15] - file.tell()))
+                    file.write(layer)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+class LayoutSnapshot:
+    """A layout snapshot file written by save_snapshot(), mapped into
+    memory. Loading it reads only the header and the name table - a node's
+    record, props and layer pixels are only read (and paged in) once the
+    node is needed.
+
+    attach() puts a lightweight GUISnapshot() placeholder in place of each
+    saved component. A placeholder takes up the saved size and shows the
+    saved layer, and builds the real components of its subtree - with
+    their saved layout - only once it's visible on screen (see
+    GUISnapshot()). Components that are never shown are never built.
+
+    Use LayoutSnapshot.load() to open one.
+
+    Loading a snapshot builds components with the props it holds (which
+    may be classes and functions of its modules) and opens the font files
+    it names, so only load snapshots the app wrote itself - never ones
+    from an untrusted source.
+
+    path: The path of the snapshot file
+    modules: The modules (with their submodules) whose classes and
+        functions the snapshot may refer to
+    size: The size of the viewport the snapshot was saved in
+    tag: The tag the snapshot was saved with
+    mask: The pixel format of the layers
+    nodes: How many components the snapshot holds
+    hydrate_budget: How many seconds per frame may be spent building
+        components of placeholders that have a layer to show meanwhile (at
+        least one placeholder gets built every frame). Placeholders without
+        a layer are built as soon as they're visible.
+    """
+
+    def __init__(
+        self, path: str, mapped: mmap.mmap, *args, modules: Iterable[str] = ()
+    ) -> None:
+        self.path: str = path
+        self.modules: tuple[str, ...] = ("compygui", *modules)
+        self.hydrate_budget: float = 0.004
+
+        self._map: mmap.mmap | None = mapped
+        self._names: list[str] = []
+        try:
+            (
+                magic,
+                version,
+                width,
+                height,
+                r,
+                g,
+                b,
+                a,
+                nodes,
+                count,
+                tag_length,
+                nodes_offset,
+            ) = _HEADER.unpack_from(mapped)
+            if magic != _MAGIC:
+                raise ComPyGUIError(f"{path!r} is not a layout snapshot")
+
+            self.version: int = version
+            self.size: IVector2 = IVector2(width, height)
+            self.mask: RGBAMask = RGBAMask(r=r, g=g, b=b, a=a)
+            self.nodes: int = nodes
+            self._nodes_offset: int = nodes_offset
+
+            offset: int = _HEADER.size
+            self.tag: str = mapped[offset : offset + tag_length].decode("utf-8")
+            offset += tag_length
+
+            if version == _VERSION:
+                for _ in range(count):
+                    length: int = _NAME_LENGTH.unpack_from(mapped, offset)[0]
+                    offset += _NAME_LENGTH.size
+                    self._names.append(
+                        mapped[offset : offset + length].decode("utf-8")
+                    )
+                    offset += length
+                if nodes_offset + nodes * _NODE.size > len(mapped):
+                    raise ComPyGUIError(f"Layout snapshot {path!r} is truncated")
+        except (struct.error, UnicodeDecodeError) as error:
+            raise ComPyGUIError(f"Layout snapshot {path!r} is corrupt") from error
+
+        self._resolved: dict[int, Any] = {}
+        # Placeholders that weren't built or destroyed yet
+        self._pending: int = 0
+        self._frame: float = -1.0
+        self._spent: float = 0.0
+
+    @staticmethod
+    def load(
+        path: str,
+        *args,
+        size: IVector2 | None = None,
+        tag: str = "",
+        modules: Iterable[str] = (),
+    ) -> LayoutSnapshot | None:
+        """Opens a snapshot file, or returns None if there's no usable one
+        (so the layout has to be built from scratch): if the file doesn't
+        exist, or it was written by another version of ComPyGUI, with
+        another tag or in a viewport of another size.
+
+        The file is trusted: building its components runs their code with
+        the props it holds. Only classes and functions of compygui and of
+        modules are resolved though (anything else raises ComPyGUIError),
+        so a snapshot can't import or call arbitrary code - but only load
+        files the app wrote itself with save_snapshot().
+
+        path: The path of the snapshot file
+        size: The size of the viewport the layout will be in (None to not check)
+        tag: The tag the snapshot has to be saved with
+        modules: The modules (with their submodules) that define the app's
+            own components, enums and other props in the snapshot
+        """
+
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        with file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                return None
+            # A private mapping, which ctypes can point surfaces into
+            mapped: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        try:
+            snapshot: LayoutSnapshot = LayoutSnapshot(path, mapped, modules=modules)
+        except BaseException:
+            mapped.close()
+            raise
+
+        if (
+            snapshot.version != _VERSION
+            or snapshot.tag != tag
+            or (size is not None and snapshot.size != size)
+        ):
+            snapshot.close()
+            return None
+        return snapshot
+
+    @property
+    def closed(self) -> bool:
+        return self._map is None
+
+    @property
+    def pending(self) -> int:
+        """How many placeholders are waiting to be built"""
+        return self._pending
+
+    def _node(self, index: int) -> tuple:
+        if self._map is None:
+            raise ComPyGUIError("LayoutSnapshot() is closed")
+        return _NODE.unpack_from(self._map, self._nodes_offset + index * _NODE.size)
+
+    def _ref(self, id: int, kind: type | None = None) -> Any:
+        """Resolves a class or function the snapshot refers to. Only ones
+        defined in self.modules are, so the file can't make it import or
+        reach anything else.
+
+        id: The name id of its path
+        kind: What it has to be a subclass of (None for any class or function)
+        """
+
+        path: str = self._names[id]
+        value: Any = self._resolved.get(id)
+        if value is None:
+            module, _, qualname = path.partition(":")
+            if not _in_modules(module, self.modules) or any(
+                part.startswith("__") for part in qualname.split(".")
+            ):
+                raise ComPyGUIError(
+                    f"Layout snapshot {self.path!r} refers to {path!r}, which "
+                    "isn't in one of the modules it was loaded with (see the "
+                    "modules argument of LayoutSnapshot.load())"
+                )
+            try:
+                value = _resolve(path)
+            except (ImportError, AttributeError) as error:
+                raise ComPyGUIError(
+                    f"Layout snapshot {self.path!r} refers to {path!r}, "
+                    "which doesn't exist"
+                ) from error
+            if not (
+                isinstance(value, type) or inspect.isfunction(value)
+            ) or not _in_modules(value.__module__, self.modules):
+                raise ComPyGUIError(
+                    f"Layout snapshot {self.path!r} refers to {path!r}, which "
+                    "isn't a class or function defined in one of the modules "
+                    "it was loaded with"
+                )
+            self._resolved[id] = value
+
+        if kind is not None and not (
+            isinstance(value, type) and issubclass(value, kind)
+        ):
+            raise ComPyGUIError(
+                f"Layout snapshot {self.path!r} refers to {path!r}, which "
+                f"isn't a {kind.__name__}"
+            )
+        return value
+
+    def _decode(self, data: Any, offset: int) -> tuple[Any, int]:
+        tag: int = data[offset]
+        offset += 1
+        if tag == _NONE:
+            return None, offset
+        if tag == _FALSE or tag == _TRUE:
+            return tag == _TRUE, offset
+        if tag == _INT:
+            return _INT_VALUE.unpack_from(data, offset)[0], offset + _INT_VALUE.size
+        if tag == _FLOAT:
+            return _FLOAT_VALUE.unpack_from(data, offset)[0], offset + _FLOAT_VALUE.size
+        if tag == _STR:
+            length: int = _COUNT.unpack_from(data, offset)[0]
+            offset += _COUNT.size
+            return data[offset : offset + length].decode("utf-8"), offset + length
+        if tag == _IVECTOR2:
+            x, y = _IVECTOR2_VALUE.unpack_from(data, offset)
+            return IVector2(x, y), offset + _IVECTOR2_VALUE.size
+        if tag == _VECTOR2:
+            x, y = _VECTOR2_VALUE.unpack_from(data, offset)
+            return Vector2(x, y), offset + _VECTOR2_VALUE.size
+        if tag == _RGBACOLOR:
+            r, g, b, a = _RGBACOLOR_VALUE.unpack_from(data, offset)
+            return RGBAColor(r=r, g=g, b=b, a=a), offset + _RGBACOLOR_VALUE.size
+        if tag == _TUPLE or tag == _LIST:
+            count: int = _COUNT.unpack_from(data, offset)[0]
+            offset += _COUNT.size
+            items: list[Any] = []
+            for _ in range(count):
+                item, offset = self._decode(data, offset)
+                items.append(item)
+            return (tuple(items) if tag == _TUPLE else items), offset
+        if tag == _ENUM:
+            enum: Any = self._ref(_NAME_ID.unpack_from(data, offset)[0], Enum)
+            value, offset = self._decode(data, offset + _NAME_ID.size)
+            return enum(value), offset
+        if tag == _FONT:
+            size, index = _FONT_VALUE.unpack_from(data, offset)
+            path, offset = self._decode(data, offset + _FONT_VALUE.size)
+            return load_font(path, size, index=index), offset
+        if tag == _REF:
+            ref: Any = self._ref(_NAME_ID.unpack_from(data, offset)[0])
+            return ref, offset + _NAME_ID.size
+        if tag == _OBJECT:
+            cls: Any = self._ref(_NAME_ID.unpack_from(data, offset)[0], object)
+            count = _COUNT.unpack_from(data, offset + _NAME_ID.size)[0]
+            offset += _NAME_ID.size + _COUNT.size
+            value = cls.__new__(cls)
+            for _ in range(count):
+                name: str = self._names[_NAME_ID.unpack_from(data, offset)[0]]
+                attribute, offset = self._decode(data, offset + _NAME_ID.size)
+                object.__setattr__(value, name, attribute)
+            return value, offset
+        raise ComPyGUIError(
+            f"Unknown value {tag} at byte {offset - 1} of {self.path!r}"
+        )
+
+    def _element(self, record: tuple) -> Element:
+        """Reads the Element() (without children) a node was built from"""
+
+        offset: int = record[13]
+        try:
+            key, offset = self._decode(self._map, offset)
+            count: int = _COUNT.unpack_from(self._map, offset)[0]  # type: ignore
+            offset += _COUNT.size
+            props: dict[str, Any] = {}
+            for _ in range(count):
+                id: int = _NAME_ID.unpack_from(self._map, offset)[0]  # type: ignore
+                name: str = self._names[id]
+                props[name], offset = self._decode(self._map, offset + _NAME_ID.size)
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise ComPyGUIError(f"Layout snapshot {self.path!r} is corrupt") from error
+        return Element(self._ref(record[0], Component), key=key, **props)
+
+    def _children(self, index: int) -> Iterable[int]:
+        """The node indices of the children of a node (or of the top level
+        for -1)
+        """
+
+        end: int = self.nodes if index < 0 else self._node(index)[2]
+        child: int = index + 1
+        while child < end:
+            yield child
+            child = self._node(child)[2]
+
+    @staticmethod
+    def _restore(component: Component, record: tuple) -> None:
+        """Gives a freshly built GUIComponent() its saved layout"""
+
+        if not isinstance(component, GUIComponent):
+            return
+        component.position = IVector2(record[3], record[4])
+        if record[1] & _LAID_OUT:
+            component._layout_size = IVector2(record[5], record[6])
+            component._constraints = Constraints(
+                min=IVector2(record[7], record[8]), max=IVector2(record[9], record[10])
+            )
+            component._layout_dirty = False
+
+    def _build(self, index: int) -> Component:
+        """Builds the component of a node, with real components for the
+        children that don't have a layer and placeholders for the ones that do
+        """
+
+        record: tuple = self._node(index)
+        element: Element = self._element(record)
+        component: Component = element.type(**element.props)
+        component.key = element.key
+        component._element = element
+
+        children: list[Component] = [
+            (
+                GUISnapshot(self, child)
+                if self._node(child)[1] & _LAYER
+                else self._build(child)
+            )
+            for child in self._children(index)
+        ]
+        if children:
+            # Not part of a VCT yet, so the whole subtree gets set up in
+            # one batch once it's added to one
+            component.extend_children(children)
+
+        # Adding the children invalidated it
+        self._restore(component, record)
+        return component
+
+    def _may_hydrate(self, time: float) -> bool:
+        if time != self._frame:
+            self._frame = time
+            self._spent = 0.0
+            return True
+        return self._spent < self.hydrate_budget
+
+    def attach(self, parent: Component) -> list[GUISnapshot]:
+        """Adds a placeholder for every saved child to parent (in one
+        batch) and returns them. Saved children that aren't GUIComponent()s
+        are built right away.
+
+        parent: The Component() to add them to, usually the same kind the
+            snapshot was saved from
+        """
+
+        children: list[Component] = [
+            (
+                GUISnapshot(self, index)
+                if self._node(index)[1] & _GUI
+                else self._build(index)
+            )
+            for index in self._children(-1)
+        ]
+        parent.extend_children(children)
+        if self._pending == 0:
+            # Everything was built right away, so nothing will release the
+            # mapping later
+            self.close()
+        return [child for child in children if isinstance(child, GUISnapshot)]
+
+    def hydrate_all(self, parent: Component) -> None:
+        """Builds every placeholder below parent right away
+
+        parent: The Component() to search for placeholders
+        """
+
+        stack: list[Component] = list(parent.children)
+        while stack:
+            node: Component = stack.pop()
+            if isinstance(node, GUISnapshot):
+                node = node.hydrate()
+            stack.extend(node.children)
+
+    def _placeholder_released(self) -> None:
+        self._pending -= 1
+        if self._pending <= 0:
+            # Nothing points into the mapping anymore
+            self.close()
+
+    def close(self) -> None:
+        """Unmaps the file. Happens on its own once every placeholder has
+        been built or destroyed.
+        """
+
+        if self._map is not None and self._pending <= 0:
+            self._map.close()
+            self._map = None
+
+
+class GUISnapshot(GUIComponent):
+    """A placeholder for a saved component (and its subtree) of a
+    LayoutSnapshot() - see LayoutSnapshot().attach(). It has no surface
+    of its own: it takes up the saved size and composites the saved layer
+    (if there is one) straight from the mapped file.
+
+    It's replaced by the real components once it's rendered while it's
+    visible and on screen (within the hydrate_budget of its snapshot, if
+    it has a layer), or as soon as it would need a different layout - its
+    subtree is then built, set up in one batch, given its saved layout and
+    rendered bottom-up right away, so the switch doesn't show. reconcile()
+    builds placeholders before it matches them too, so an Element() tree
+    can be reconciled against a loaded snapshot like against the
+    components it was saved from.
+
+    snapshot: The LayoutSnapshot() it's from
+    index: The index of its node in the snapshot
+    """
+
+    def __init__(self, snapshot: LayoutSnapshot, index: int, **kwargs) -> None:
+        record: tuple = snapshot._node(index)
+        self.snapshot: LayoutSnapshot = snapshot
+        self.index: int = index
+        self._record: tuple = record
+        self._layer: SDL_Surface | None = None
+        self._pixels: Any = None
+        self._stale: bool = False
+
+        # Containers arrange it by its layout_params, like the real component
+        element: Element = snapshot._element(record)
+        super().__init__(
+            position=IVector2(record[3], record[4]),
+            anchor_point=Vector2(record[11], record[12]),
+            visible=bool(record[1] & _VISIBLE),
+            layout_params=element.props.get("layout_params"),
+            **kwargs,
+        )
+        self.key = element.key
+        self._element = element
+        snapshot._pending += 1
+
+        self._calculated_size = IVector2(record[5], record[6])
+        LayoutSnapshot._restore(self, record)
+
+    def _recreate_surface(self, size: IVector2) -> None:
+        # Composites the layer instead
+        pass
+
+    def setup(self) -> None:
+        # Gets built once the viewport is resized, since the saved layout
+        # may depend on its size
+        self.get_viewport_size()
+
+    def measure(self, constraints: Constraints) -> IVector2:
+        # Only happens if the saved layout doesn't fit anymore
+        self._stale = True
+        return self._layout_size
+
+    def invalidate_layout(self) -> None:
+        self._stale = True
+        super().invalidate_layout()
+
+    def _on_screen(self) -> bool:
+        rect: IRect2 = IRect2(
+            0, 0, self._calculated_size.x, self._calculated_size.y
+        )
+        node: Component | None = self
+        while isinstance(node, GUIComponent):
+            if not node._visible:
+                return False
+            rect = rect.offset(node.topleft)
+            node = node.parent
+
+        size: Any = getattr(node, "size", None)
+        return isinstance(size, IVector2) and (
+            rect.intersection(IRect2(0, 0, size.x, size.y)) is not None
+        )
+
+    def _render(self, event: Event) -> None:
+        if not self._stale:
+            if not self._visible or self._held_back() or not self._on_screen():
+                return
+            if self._record[1] & _LAYER and not self.snapshot._may_hydrate(
+                self.tree_events.time
+            ):
+                return
+
+        start: float = time.perf_counter()
+        self._hydrate(event.data["delta"])
+        self.snapshot._spent += time.perf_counter() - start
+
+    def _map_layer(self) -> SDL_Surface | None:
+        if self._layer is None and self._record[1] & _LAYER:
+            width: int = self._record[18]
+            height: int = self._record[19]
+            mask: RGBAMask = self.snapshot.mask
+            self._pixels = (ctypes.c_char * (width * height * 4)).from_buffer(
+                self.snapshot._map, self._record[15]  # type: ignore
+            )
+            self._layer = SDL_CreateRGBSurfaceFrom(
+                ctypes.addressof(self._pixels),
+                width,
+                height,
+                32,
+                width * 4,
+                mask.r,
+                mask.g,
+                mask.b,
+                mask.a,
+            )
+            if not self._layer:
+                self._pixels = None
+                raise SDLError.from_sdl_geterror("Failed to map snapshot layer")
+        return self._layer
+
+    def render(self, delta: int, to: SDL_Surface | DisplayList) -> None:
+        layer: SDL_Surface | None = self._map_layer()
+        if layer is not None:
+            composite(
+                layer,
+                to,
+                self.topleft + IVector2(self._record[16], self._record[17]),
+                BlendMode.NORMAL,
+                opacity=self._opacity,
+            )
+
+    def hydrate(self) -> Component:
+        """Replaces the placeholder with the real components right away and
+        returns the component it stood for
+        """
+
+        return self._hydrate(0)
+
+    def _hydrate(self, delta: int) -> Component:
+        if self.destroyed:
+            raise ComPyGUIError("GUISnapshot() was already hydrated or destroyed")
+
+        component: Component = self.snapshot._build(self.index)
+        parent: Component | None = self.parent
+        if parent is not None:
+            children: list[Component] = list(parent.children)
+            children[children.index(self)] = component
+            parent.replace_children(children)
+        self.destroy()
+
+        if (
+            isinstance(component, GUIComponent)
+            and component.render_listener is not None
+        ):
+            # Renders the new subtree children first, so it has all of its
+            # pixels by the time its parent composites it
+            nodes: list[GUIComponent] = []
+            stack: list[Component] = [component]
+            while stack:
+                node: Component = stack.pop()
+                if isinstance(node, GUIComponent) and not isinstance(node, GUISnapshot):
+                    nodes.append(node)
+                    stack.extend(node.children)
+
+            event: Event = Event(EventType.G_RENDER, event_origin=self, delta=delta)
+            for node in reversed(nodes):
+                node._render(event)
+
+        return component
+
+    def _release(
+        self, listeners: list[EventListener], surfaces: list[SDL_Surface]
+    ) -> None:
+        super()._release(listeners, surfaces)
+        if self._layer is not None:
+            # Only the header - the pixels belong to the mapping
+            surfaces.append(self._layer)
+            self._layer = None
+        self._pixels = None
+        self.snapshot._placeholder_released()
@@ -0,0 +1,258 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+import heapq
+import math
+from itertools import count
+from typing import Callable
+
+from compygui.component import Component
+from compygui.errors import ComPyGUIError
+
+# Deadlines this close to the current time count as reached, so intervals
+# that are multiples of the frame delta don't drift due to rounding
+_EPSILON: float = 1e-9
+
+
+class Timer:
+    """A callback scheduled on a TimerScheduler(), returned by its after()
+    and every(). Keep it to cancel() the timer.
+    """
+
+    __slots__ = (
+        "callback",
+        "interval",
+        "owner",
+        "deadline",
+        "cancelled",
+        "_scheduler",
+    )
+
+    def __init__(
+        self,
+        scheduler: TimerScheduler,
+        callback: Callable[[Timer], None],
+        deadline: float,
+        interval: float | None,
+        owner: Component | None,
+    ) -> None:
+        self.callback: Callable[[Timer], None] = callback
+        self.interval: float | None = interval
+        self.owner: Component | None = owner
+        self.deadline: float = deadline
+        self.cancelled: bool = False
+
+        self._scheduler: TimerScheduler = scheduler
+
+    @property
+    def repeating(self) -> bool:
+        return self.interval is not None
+
+    def cancel(self) -> None:
+        """Stops the timer. Does nothing if it's already done or cancelled."""
+        if not self.cancelled:
+            self.cancelled = True
+            self._scheduler._cancelled += 1
+
+
+class TimerScheduler:
+    """Runs callbacks after a delay, or periodically. ComPyGUIApp() has one
+    (app.timers) that it advances by the frame delta at the start of every
+    frame, so callbacks run on the main thread, and stepped apps (see
+    ComPyGUIApp().step()) run them at the same frames every time.
+
+    Pending timers are kept in a heap ordered by their deadline, so a frame
+    where no timer is due costs a single comparison, no matter how many are
+    pending. Cancelled timers are dropped lazily (the heap is compacted once
+    most of it is cancelled).
+    """
+
+    def __init__(self) -> None:
+        self.time: float = 0.0
+        """How far this scheduler has been advanced, in seconds"""
+
+        # (deadline, sequence number, timer) - the sequence number keeps timers
+        # with the same deadline in the order they were scheduled
+        self._heap: list[tuple[float, int, Timer]] = []
+        self._sequence = count()
+        self._cancelled: int = 0
+
+    def __len__(self) -> int:
+        """How many timers are pending"""
+        return len(self._heap) - self._cancelled
+
+    def after(
+        self,
+        delay: float,
+        callback: Callable[[Timer], None],
+        *args,
+        owner: Component | None = None,
+    ) -> Timer:
+        """Calls callback with the Timer() once, after delay seconds
+
+        delay: How long to wait (0 runs it on the next advance())
+        callback: The function to call
+        owner: If the owner is destroyed before then, the timer is dropped
+        """
+
+        return self._schedule(Timer(self, callback, self.time + delay, None, owner))
+
+    def every(
+        self,
+        interval: float,
+        callback: Callable[[Timer], None],
+        *args,
+        delay: float | None = None,
+        owner: Component | None = None,
+    ) -> Timer:
+        """Calls callback with the Timer() every interval seconds, until it's
+        cancelled. If a frame takes longer than several intervals, the
+        callback only runs once for it - missed runs aren't made up for.
+
+        interval: The time between two calls
+        callback: The function to call
+        delay: When to call it the first time (defaults to interval)
+        owner: Once the owner is destroyed, the timer is dropped
+        """
+
+        if interval <= 0:
+            raise ComPyGUIError(f"Timer interval must be positive, got {interval}")
+
+        first: float = interval if delay is None else delay
+        return self._schedule(
+            Timer(self, callback, self.time + first, interval, owner)
+        )
+
+    def _schedule(self, timer: Timer) -> Timer:
+        heapq.heappush(self._heap, (timer.deadline, next(self._sequence), timer))
+        return timer
+
+    def _drop_cancelled(self) -> None:
+        heap: list[tuple[float, int, Timer]] = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+
+        if self._cancelled > 64 and self._cancelled * 2 > len(heap):
+            self._heap = [entry for entry in heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def time_until_next(self) -> float | None:
+        """Returns how long it is until the next timer is due (0 if one is
+        due already), or None if there are no pending timers
+        """
+
+        self._drop_cancelled()
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self.time)
+
+    def advance(self, delta: float) -> int:
+        """Moves time forward and runs the callbacks of every timer that is
+        due, in the order of their deadlines. Timers scheduled by the
+        callbacks run on a later advance() at the earliest. Returns how many
+        callbacks ran.
+
+        delta: How much time passed
+        """
+
+        self.time += delta
+        now: float = self.time + _EPSILON
+        heap: list[tuple[float, int, Timer]] = self._heap
+        if not heap or heap[0][0] > now:
+            return 0
+
+        due: list[Timer] = []
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap)[2])
+
+        ran: int = 0
+        for timer in due:
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+            if timer.owner is not None and timer.owner.destroyed:
+                timer.cancelled = True
+                continue
+
+            if timer.interval is None:
+                # Done - cancel() is a no-op from now on
+                timer.cancelled = True
+            ran += 1
+            timer.callback(timer)
+
+            if timer.interval is not None:
+                if timer.cancelled:
+                    # Cancelled by its own callback
+                    self._cancelled -= 1
+                    continue
+                timer.deadline += timer.interval
+                if timer.deadline <= now:
+                    timer.deadline = self.time + timer.interval
+                self._schedule(timer)
+
+        return ran
+
+    def clear(self) -> None:
+        """Cancels every pending timer"""
+
+        for _, _, timer in self._heap:
+            timer.cancelled = True
+        self._heap = []
+        self._cancelled = 0
+
+
+class UpdateThrottle:
+    """Limits how often something updates (see
+    GUIComponent().max_update_hz and Viewport().max_update_hz), going by
+    a clock that is passed in. Whether an update is due is decided once per
+    point in time, so everything that asks at the same time gets the same
+    answer, in whatever order it asks.
+
+    max_hz: How many updates per second there may be at most
+    """
+
+    __slots__ = ("interval", "next_update", "_asked_at", "_due")
+
+    def __init__(self, max_hz: float) -> None:
+        if max_hz <= 0:
+            raise ComPyGUIError(f"Update rate must be positive, got {max_hz}")
+
+        self.interval: float = 1 / max_hz
+        self.next_update: float = -math.inf
+
+        self._asked_at: float | None = None
+        self._due: bool = False
+
+    @property
+    def max_hz(self) -> float:
+        return 1 / self.interval
+
+    def due(self, time: float) -> bool:
+        """Returns whether an update is due at time. If it is, the next one
+        is due an interval later (or an interval after time, if updates
+        were missed - they aren't made up for).
+
+        time: The current time, in seconds
+        """
+
+        if time != self._asked_at:
+            self._asked_at = time
+            self._due = time + _EPSILON >= self.next_update
+            if self._due:
+                self.next_update += self.interval
+                if self.next_update <= time + _EPSILON:
+                    self.next_update = time + self.interval
+        return self._due
+
+    def force(self) -> None:
+        """Makes the next update due right away"""
+        self.next_update = -math.inf
+        self._asked_at = None
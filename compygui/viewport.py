@@ -1,17 +1,27 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+import ctypes
+import weakref
+
 from sdl2.surface import (
-    SDL_CreateRGBSurface,
-    SDL_FillRect,
-    SDL_FreeSurface,
+    SDL_MUSTLOCK,
+    SDL_LockSurface,
+    SDL_SaveBMP,
     SDL_Surface,
+    SDL_UnlockSurface,
 )
 from compygui.component import Component
+from compygui.compositor import BlendMode, DisplayList, fill
 from compygui.datatypes.rect2 import IRect2
 from compygui.datatypes.vector2 import IVector2
 from compygui.datatypes.rgba import RGBAColor, RGBAMask
 from compygui.errors import ComPyGUIError, SDLErrorDetector
 from compygui.events import Event, EventListener, EventQueue, EventType
 from compygui.guicomponent import GUIComponent
+from compygui.layout import Constraints
+from compygui.memory import create_surface, free_surface
+from compygui.profiler import NULL_SPAN, FrameProfiler
+from compygui.timers import UpdateThrottle
 
 
 class BaseViewport(Component, ABC):
@@ -41,6 +51,14 @@ class BaseViewport(Component, ABC):
         self.bit_depth: int = bit_depth
         self.mask: RGBAMask = mask
 
+        self.damage: list[IRect2] = []
+
+        # GUIComponent()s whose layout depends on the size (see
+        # GUIComponent().get_viewport_size()) - only they get laid out again
+        # when the BaseViewport() is resized
+        self.size_dependents: weakref.WeakSet[GUIComponent] = weakref.WeakSet()
+        self._layout_dirty: bool = True
+
         self.recreate_surface()
 
     def recreate_surface(self) -> None:
@@ -48,28 +66,117 @@ class BaseViewport(Component, ABC):
 
         with SDLErrorDetector(error_info="Failed to (re)create viewport surface"):
             if self._surface:
-                SDL_FreeSurface(self._surface)
+                free_surface(self._surface)
                 self._surface = None
 
-            self._surface = SDL_CreateRGBSurface(
-                0,
-                self.size.x,
-                self.size.y,
-                self.bit_depth,
-                self.mask.r,
-                self.mask.g,
-                self.mask.b,
-                self.mask.a,
-            )
+            self._surface = create_surface(self, self.size, self.bit_depth, self.mask)
 
     def get_rect(self) -> IRect2:
-        return IRect2.from_vectors(IVector2.ZERO(), self.size)
+        return IRect2(0, 0, self.size.x, self.size.y)
+
+    def resize(self, size: IVector2) -> None:
+        """Resizes the BaseViewport() (and its surface)
+
+        size: The new size
+        """
+
+        if size == self.size:
+            return
+
+        self.size = size
+        self.recreate_surface()
+        self.invalidate()
+
+        for dependent in list(self.size_dependents):
+            dependent.invalidate_layout()
+
+    def read_pixels(self) -> bytes:
+        """Returns a copy of the pixels of the BaseViewport()'s surface, row by
+        row with no padding, each pixel laid out according to BaseViewport().mask
+        """
+
+        if not self._surface:
+            raise ComPyGUIError("Viewport() doesn't have a _surface")
 
-    def destroy(self) -> None:
-        """Clean up and delete the BaseViewport()"""
+        surf = self._surface.contents
+        row: int = surf.w * surf.format.contents.BytesPerPixel
+
+        must_lock: bool = SDL_MUSTLOCK(surf)
+        if must_lock:
+            with SDLErrorDetector(error_info="Failed to lock viewport surface"):
+                SDL_LockSurface(self._surface)
+
+        try:
+            if surf.pitch == row:
+                return ctypes.string_at(surf.pixels, row * surf.h)
+
+            return b"".join(
+                ctypes.string_at(surf.pixels + y * surf.pitch, row)
+                for y in range(surf.h)
+            )
+        finally:
+            if must_lock:
+                SDL_UnlockSurface(self._surface)
+
+    def save_bmp(self, path: str) -> None:
+        """Saves the BaseViewport()'s surface to a BMP file
+
+        path: The path of the file to write
+        """
+
+        if not self._surface:
+            raise ComPyGUIError("Viewport() doesn't have a _surface")
+
+        with SDLErrorDetector(error_info="Failed to save viewport surface"):
+            SDL_SaveBMP(self._surface, path.encode("utf-8"))
+
+    def invalidate(self, rect: IRect2 | None = None) -> None:
+        """Records a dirty area of the BaseViewport() in BaseViewport().damage
+
+        rect: The dirty area, or None if the whole BaseViewport() is dirty
+        """
+
+        if rect is None:
+            rect = self.get_rect()
+
+        clipped: IRect2 | None = rect.intersection(self.get_rect())
+        if clipped is None:
+            return
+
+        if len(self.damage) < 32:
+            self.damage.append(clipped)
+        else:
+            self.damage[-1] = self.damage[-1].union(clipped)
+
+    @property
+    def needs_redraw(self) -> bool:
+        """Whether anything was invalidated since the last render"""
+        return bool(self.damage) or self._layout_dirty
+
+    def invalidate_layout(self) -> None:
+        """Marks the BaseViewport() as having children that need to be laid out"""
+        self._layout_dirty = True
+
+    def layout(self) -> None:
+        """Lays out the children whose layout was invalidated. Children of
+        a BaseViewport() are positioned freely and unconstrained.
+        """
+
+        if not self._layout_dirty:
+            return
+
+        self._layout_dirty = False
+        constraints: Constraints = Constraints.unbounded()
+        for child in self.children:
+            if isinstance(child, GUIComponent) and child._layout_dirty:
+                child.layout(constraints)
+
+    def _release(
+        self, listeners: list[EventListener], surfaces: list[SDL_Surface]
+    ) -> None:
         if self._surface:
-            SDL_FreeSurface(self._surface)
-        super().destroy()
+            surfaces.append(self._surface)
+            self._surface = None
 
     @abstractmethod
     def render(self, delta: int) -> None:
@@ -82,20 +189,85 @@ class Viewport(BaseViewport):
 
     bg_color: The color used for filling the background at the start
         of a re-render.
+    tiled: If True, children are recorded into a DisplayList() and rasterized
+        in tiles on a thread pool instead of being drawn one after another.
+        Gives the same result as the serial path, but only works if every
+        child draws through compygui.compositor.fill()/composite()
+    tile_size: The size of one tile when tiled is True
+    profiler: The FrameProfiler() that times rendering, if any
+    max_update_hz: How many times per second the Viewport() gets rendered at
+        most (None for every frame) - in between, it keeps its pixels. Parts
+        of the VCT can be throttled on their own with
+        GUIComponent().max_update_hz
     """
 
     def __init__(
-        self, *children, bg_color: RGBAColor = RGBAColor.TBLACK(), **props
+        self,
+        *children,
+        bg_color: RGBAColor = RGBAColor.TBLACK(),
+        tiled: bool = False,
+        tile_size: IVector2 = IVector2(256, 256),
+        profiler: FrameProfiler | None = None,
+        max_update_hz: float | None = None,
+        **props
     ) -> None:
         super().__init__(*children, **props)
 
+        self._throttle: UpdateThrottle | None = (
+            None if max_update_hz is None else UpdateThrottle(max_update_hz)
+        )
+
         self.bg_color: RGBAColor = bg_color
-        self.tree_events: EventQueue = EventQueue()
+        self.profiler: FrameProfiler | None = profiler
+        # Every GUIComponent() in the VCT connects a listener (and fires
+        # GUI_CREATED when it joins), so the VCT can't have a fixed limit
+        self.tree_events: EventQueue = EventQueue(
+            profiler=profiler, max_events=None, max_listeners=None
+        )
+
+        self.tiled: bool = tiled
+        self.tile_size: IVector2 = tile_size
+        self._display_list: DisplayList = DisplayList()
+
+    @property
+    def max_update_hz(self) -> float | None:
+        return None if self._throttle is None else self._throttle.max_hz
+
+    @max_update_hz.setter
+    def max_update_hz(self, to: float | None) -> None:
+        self._throttle = None if to is None else UpdateThrottle(to)
+
+    def resize(self, size: IVector2) -> None:
+        if size != self.size and self._throttle is not None:
+            # The new surface is empty until the next update
+            self._throttle.force()
+        super().resize(size)
 
     def add_child(self, child: Component) -> None:
         if isinstance(child, GUIComponent):
             child._setup(self.tree_events)
 
+    def add_children(self, children: list[Component]) -> None:
+        GUIComponent._setup_batch(children, self.tree_events, self)
+
+    def _span(self, phase: str) -> AbstractContextManager:
+        if self.profiler is None:
+            return NULL_SPAN
+        return self.profiler.span(phase)
+
+    def _render_tiled(self, delta: int) -> None:
+        if not self._surface:
+            raise ComPyGUIError("Viewport() doesn't have a _surface")
+
+        self._display_list.clear()
+        self._display_list.fill(self.get_rect(), self.bg_color, BlendMode.NONE)
+
+        for child in self.children:
+            if isinstance(child, GUIComponent) and child.visible:
+                child.render(delta, self._display_list)
+
+        self._display_list.execute_tiled(self._surface, self.tile_size)
+
     def render(self, delta: int) -> None:
         """Renders the contents of this Viewport() to its _surface"""
 
@@ -105,15 +277,25 @@ class Viewport(BaseViewport):
         if not self._surface:
             raise ComPyGUIError("Viewport() doesn't have a _surface")
 
-        self.tree_events.fire(EventType.G_RENDER, event_origin=self, delta=delta)
+        self.tree_events.time += delta
+        if self._throttle is not None and not self._throttle.due(
+            self.tree_events.time
+        ):
+            return
 
-        with SDLErrorDetector("Viewport rendering failed"):
-            SDL_FillRect(
-                self._surface,
-                self.get_rect().as_sdl_rect(),
-                self.bg_color.as_int(8),
-            )
+        with self._span("layout"):
+            self.layout()
+            self.tree_events.fire(EventType.G_RENDER, event_origin=self, delta=delta)
+
+        with SDLErrorDetector("Viewport rendering failed"), self._span("paint"):
+            if self.tiled:
+                self._render_tiled(delta)
+            else:
+                fill(self._surface, self.get_rect(), self.bg_color, BlendMode.NONE)
+
+                for child in self.children:
+                    if isinstance(child, GUIComponent) and child.visible:
+                        child.render(delta, self._surface)
 
-            for child in self.children:
-                if isinstance(child, GUIComponent):
-                    child.render(delta, self._surface)
+        self.damage.clear()
+        self.tree_events.tick()
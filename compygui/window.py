@@ -7,6 +7,8 @@ for important license information.
 https://github.com/FluffyKn1ght/compygui
 """
 
+from contextlib import AbstractContextManager
+
 from sdl2 import (
     SDL_RENDERER_PRESENTVSYNC,
     SDL_WINDOW_RESIZABLE,
@@ -19,7 +21,6 @@ from sdl2.render import (
     SDL_CreateRenderer,
     SDL_CreateTextureFromSurface,
     SDL_DestroyRenderer,
-    SDL_DestroyTexture,
     SDL_RenderClear,
     SDL_RenderCopy,
     SDL_RenderPresent,
@@ -29,9 +30,11 @@ from sdl2.render import (
 from sdl2.surface import SDL_Surface
 from sdl2.video import (
     SDL_WINDOW_HIDDEN,
+    SDL_WINDOW_MINIMIZED,
     SDL_WINDOWPOS_CENTERED,
     SDL_WINDOWPOS_UNDEFINED,
     SDL_DestroyWindow,
+    SDL_GetWindowFlags,
     SDL_GetWindowID,
     SDL_ShowWindow,
     SDL_Window,
@@ -40,6 +43,9 @@ from compygui.datatypes.vector2 import IVector2
 from compygui.datatypes.rgba import RGBAMask
 from compygui.errors import SDLError, SDLErrorDetector
 from compygui.events import Event, EventListener, EventOrigin, EventQueue, EventType
+from compygui.gui.perfhud import GUIPerfHUD
+from compygui.memory import free_texture, track_texture, tracker
+from compygui.profiler import NULL_SPAN, FrameProfiler
 from compygui.viewport import Viewport
 
 
@@ -74,7 +80,8 @@ class Window:
     to properly render and recieve events. Creating a Window() will automatically
     create an SDL renderer, as well as a Viewport() to serve as a VCT root.
     Any and all GUIComponents must be parented to that viewport
-    to be properly rendered inside the window.
+    to be properly rendered inside the window. Destroying a Window()
+    destroys its Viewport() and everything inside of it.
 
     title: The title of the window
     position: The position of the window on the screen
@@ -83,6 +90,9 @@ class Window:
     renderer_flags: Flags to be passed to SDL_CreateRenderer
     vp_bit_depth: Viewport surface bit depth
     vp_mask: Viewport RGBA mask/format
+    headless: If True, no renderer is created and nothing is ever presented -
+        the window only renders to its Viewport(). Used by headless apps
+    profiler: The FrameProfiler() that times rendering and presenting, if any
     """
 
     def __init__(
@@ -96,16 +106,21 @@ class Window:
         vp_bit_depth: int = 32,
         vp_mask: RGBAMask = RGBAMask.RGBA(),
         app_event_queue: EventQueue,
+        headless: bool = False,
+        profiler: FrameProfiler | None = None,
     ) -> None:
         self.destroyed: bool = False
 
         self.size: IVector2 = size
+        self.headless: bool = headless
+        self.profiler: FrameProfiler | None = profiler
 
         self._window: SDL_Window
-        self._renderer: SDL_Renderer
+        self._renderer: SDL_Renderer | None = None
         self.viewport: Viewport
 
         self.shown: bool = False
+        self.perf_hud: GUIPerfHUD | None = None
 
         with SDLErrorDetector(error_info="Failed to create window"):
             self._window = SDL_CreateWindow(
@@ -117,8 +132,9 @@ class Window:
                 window_flags | SDL_WINDOW_HIDDEN,
             )
 
-        with SDLErrorDetector(error_info="Failed to create renderer for window"):
-            self._renderer = SDL_CreateRenderer(self._window, -1, renderer_flags)
+        if not headless:
+            with SDLErrorDetector(error_info="Failed to create renderer for window"):
+                self._renderer = SDL_CreateRenderer(self._window, -1, renderer_flags)
 
         self.app_events: EventQueue = app_event_queue
 
@@ -128,39 +144,142 @@ class Window:
                 size=size,
                 mask=vp_mask,
                 bit_depth=vp_bit_depth,
+                profiler=profiler,
             )
         except SDLError as e:
             raise SDLError(f"Failed to create viewport for window: {e.msg}")
 
+        self.id: int = SDL_GetWindowID(self._window)
+        """The SDL window ID - app events about this window are routed by it"""
+
+        label: str = f"{title} (#{self.id})"
+        tracker.label_root(self, label)
+        tracker.label_root(self.viewport, label)
+
         self._window_close_listener: EventListener = self.app_events.connect(
-            self, self.on_window_close, EventType.APP_WINDOW_CLOSE, oneshot=True
+            self,
+            self.on_window_close,
+            EventType.APP_WINDOW_CLOSE,
+            key=self.id,
         )
         self._render_listener: EventListener = self.app_events.connect(
             self, self._render, EventType.APP_RENDER
         )
+        self._mouse_wheel_listener: EventListener = self.app_events.connect(
+            self, self.on_mouse_wheel, EventType.APP_MOUSE_WHEEL, key=self.id
+        )
+        self._window_resize_listener: EventListener = self.app_events.connect(
+            self, self.on_window_resize, EventType.APP_WINDOW_RESIZE, key=self.id
+        )
 
-    def __del__(self) -> None:
-        self.destroy()
+    def _span(self, phase: str) -> AbstractContextManager:
+        if self.profiler is None:
+            return NULL_SPAN
+        return self.profiler.span(phase)
+
+    @property
+    def visible(self) -> bool:
+        """Whether the window is shown and not minimized"""
+        if not self.shown or self.destroyed:
+            return False
+        return not SDL_GetWindowFlags(self._window) & SDL_WINDOW_MINIMIZED
 
     def _render(self, event: Event) -> None:
+        if not self.visible:
+            return
+
+        if not event.data.get("rasterized", False):
+            self.rasterize(event.data["delta"])
+        self.present()
+
+    def rasterize(self, delta: int) -> None:
+        """Renders the window's Viewport() to its surface.
+
+        This only touches the window's own VCT, so different windows
+        can be rasterized on different threads at the same time.
+
+        delta: The frame delta time
+        """
+
         with SDLErrorDetector(error_info="Error during window re-render"):
             if not self.viewport._surface:
                 return
 
-            self.viewport.render(event.data["delta"])
+            self.viewport.render(delta)
+
+    def present(self) -> None:
+        """Uploads the window's Viewport() surface to the renderer and
+        presents it. Must be called from the main thread.
+        """
+
+        if self._renderer is None:
+            return
+
+        with SDLErrorDetector(error_info="Error during window re-render"):
+            if not self.viewport._surface:
+                return
 
             surface: SDL_Surface = self.viewport._surface
-            tex: SDL_Texture = SDL_CreateTextureFromSurface(self._renderer, surface)
-            SDL_RenderClear(self._renderer)
-            SDL_RenderCopy(self._renderer, tex, None, None)
-            SDL_RenderPresent(self._renderer)
-            SDL_DestroyTexture(tex)
+            with self._span("upload"):
+                tex: SDL_Texture = SDL_CreateTextureFromSurface(
+                    self._renderer, surface
+                )
+                track_texture(
+                    tex, self, IVector2(surface.contents.w, surface.contents.h)
+                )
+
+            with self._span("present"):
+                SDL_RenderClear(self._renderer)
+                SDL_RenderCopy(self._renderer, tex, None, None)
+                SDL_RenderPresent(self._renderer)
+                free_texture(tex)
 
     def on_window_close(self, event: Event) -> None:
-        """Event handler for "app.window_close" (EventType.APP_WINDOW_CLOSE)"""
-        if event.data["window_id"] == SDL_GetWindowID(self._window):
-            self.hide()
-            self.destroy()
+        """Event handler for "app.window_close" (EventType.APP_WINDOW_CLOSE),
+        which is routed to the window by its ID"""
+
+        # Unkeyed fires are broadcast to every window
+        if event.data["window_id"] != self.id:
+            return
+
+        self.hide()
+        self.destroy()
+
+    def on_window_resize(self, event: Event) -> None:
+        """Event handler for "app.window_resize" (EventType.APP_WINDOW_RESIZE).
+        Resizes the window's Viewport(), which only lays out again the
+        GUIComponent()s that depend on its size. Routed to the window by its ID.
+        """
+
+        if event.data["window_id"] != self.id:
+            return
+
+        self.size = event.data["size"]
+        self.viewport.resize(self.size)
+
+    def on_mouse_wheel(self, event: Event) -> None:
+        """Event handler for "app.mouse_wheel" (EventType.APP_MOUSE_WHEEL).
+
+        Fires "mouse_wheel" (EventType.G_MOUSE_WHEEL) in the window's VCT, with
+        the pointer position and the scroll delta. Components under the pointer
+        claim the wheel by setting the event's "target" data to themselves -
+        since components are set up after their ancestors, the innermost one
+        wins - and the target's handle_mouse_wheel() is then called with the event.
+        Routed to the window by its ID.
+        """
+
+        if event.data["window_id"] != self.id:
+            return
+
+        wheel: Event = self.viewport.tree_events.fire(
+            EventType.G_MOUSE_WHEEL,
+            event_origin=EventOrigin.WINDOW,
+            position=event.data["position"],
+            delta=event.data["delta"],
+            target=None,
+        )
+        if wheel.data["target"] is not None:
+            wheel.data["target"].handle_mouse_wheel(wheel)
 
     def show(self) -> None:
         """Shows the window on the screen"""
@@ -174,6 +293,29 @@ class Window:
         SDL_HideWindow(self._window)
         self.shown = False
 
+    def toggle_perf_hud(self, shown: bool | None = None) -> GUIPerfHUD | None:
+        """Shows or hides a GUIPerfHUD() on top of the window's contents.
+        Returns the GUIPerfHUD() if it's shown.
+
+        shown: Whether the GUIPerfHUD() should be shown (None toggles it)
+        """
+
+        if shown is None:
+            shown = self.perf_hud is None
+
+        if shown and self.perf_hud is None:
+            self.perf_hud = GUIPerfHUD(
+                profiler=self.profiler, app_events=self.app_events
+            )
+            # Children are drawn in order, so the last one ends up on top
+            self.perf_hud.reparent(self.viewport)
+        elif not shown and self.perf_hud is not None:
+            self.perf_hud.reparent(None)
+            self.perf_hud.destroy()
+            self.perf_hud = None
+
+        return self.perf_hud
+
     def destroy(self) -> None:
         """Cleans up and deletes the Window()"""
 
@@ -189,6 +331,11 @@ class Window:
 
         self._render_listener.disconnect()
         self._window_close_listener.disconnect()
+        self._mouse_wheel_listener.disconnect()
+        self._window_resize_listener.disconnect()
+
+        self.viewport.destroy()
 
-        SDL_DestroyRenderer(self._renderer)
+        if self._renderer is not None:
+            SDL_DestroyRenderer(self._renderer)
         SDL_DestroyWindow(self._window)
@@ -45,8 +45,9 @@ class HelloWorldApp(ComPyGUIApp):
         window.show()
 
 
-app: HelloWorldApp = HelloWorldApp(title="Hello, ComPyGUI! :D")
+if __name__ == "__main__":
+    app: HelloWorldApp = HelloWorldApp(title="Hello, ComPyGUI! :D")
 
-app.run()
+    app.run()
 
-app.quit()
+    app.quit()
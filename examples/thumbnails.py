@@ -0,0 +1,38 @@
+"""
+ComPyGUI - A competent Python GUI library
+  Copyright (C) 2026  FluffyKn1ght
+
+Please see the NOTICE file or compygui.compygui.ComPyGuiApp.NOTICE
+for important license information.
+https://github.com/FluffyKn1ght/compygui
+"""
+
+"""Thumbnails
+
+Renders the Hello World layout offscreen into a batch of PNG files, on a
+pool of worker processes - no app or window needed.
+"""
+
+import os
+
+from compygui.batch import RenderJob, render_batch
+from compygui.datatypes.rgba import RGBAColor
+from compygui.datatypes.vector2 import IVector2
+
+from helloworld import hello_world_layout
+
+if __name__ == "__main__":
+    os.makedirs("thumbnails", exist_ok=True)
+
+    jobs: list[RenderJob] = [
+        RenderJob(
+            hello_world_layout,
+            IVector2(720, 540),
+            f"thumbnails/hello_{index}.png",
+            bg_color=RGBAColor(r=index * 8 % 256, g=64, b=128, a=255),
+        )
+        for index in range(32)
+    ]
+
+    for path in render_batch(jobs):
+        print(path)